@@ -371,6 +371,9 @@ def _query_cmd_impl(
     settings = ctx.resolve_client_settings(warnings=warnings_list)
     for warning in warnings_list:
         click.echo(f"[warning] {warning}", err=True)
+    # Session cache (AFFINITY_SESSION_CACHE) lets piped queries reuse field metadata
+    ctx.init_session_cache(settings)
+    session_cache = ctx.session_cache
 
     # Execute query (or use cached data)
     result: Any = None  # Will hold QueryResult
@@ -390,7 +393,7 @@ def _query_cmd_impl(
             from affinity import AsyncAffinity
             from affinity.hooks import ResponseInfo
 
-            from ..query.executor import RateLimitedExecutor
+            from ..query.executor import RateLimitedExecutor, query_http_limits
 
             # Create rate limiter for adaptive throttling
             rate_limiter = RateLimitedExecutor()
@@ -420,6 +423,7 @@ def _query_cmd_impl(
                 on_response=combined_on_response,
                 on_error=settings.on_error,
                 policies=settings.policies,
+                limits=query_http_limits(),
             ) as client:
                 # Create progress callback
                 if quiet:
@@ -449,6 +453,7 @@ def _query_cmd_impl(
                             allow_partial=True,
                             rate_limiter=rate_limiter,
                             resume_api_cursor=resume_api_cursor,
+                            session_cache=session_cache,
                         )
                         exec_result = await executor.execute(plan)
                 else:
@@ -461,6 +466,7 @@ def _query_cmd_impl(
                         allow_partial=True,
                         rate_limiter=rate_limiter,
                         resume_api_cursor=resume_api_cursor,
+                        session_cache=session_cache,
                     )
                     exec_result = await executor.execute(plan)
 
@@ -94,12 +94,17 @@ def transform_interaction_data(
 
     now = datetime.now(timezone.utc)
     result: dict[str, Any] = {}
+    # Each date is checked, formatted, and diffed; read the attributes once
+    last_event_date = interaction_dates.last_event_date
+    next_event_date = interaction_dates.next_event_date
+    last_email_date = interaction_dates.last_email_date
+    last_interaction_date = interaction_dates.last_interaction_date
 
     # Last meeting (last_event)
-    if interaction_dates.last_event_date:
+    if last_event_date:
         meeting_data: dict[str, Any] = {
-            "date": _format_datetime(interaction_dates.last_event_date),
-            "daysSince": _days_since(interaction_dates.last_event_date, now),
+            "date": _format_datetime(last_event_date),
+            "daysSince": _days_since(last_event_date, now),
         }
         # Add team member data from interactions
         if interactions and interactions.last_event:
@@ -112,10 +117,10 @@ def transform_interaction_data(
         result["lastMeeting"] = meeting_data
 
     # Next meeting (next_event)
-    if interaction_dates.next_event_date:
+    if next_event_date:
         meeting_data = {
-            "date": _format_datetime(interaction_dates.next_event_date),
-            "daysUntil": _days_until(interaction_dates.next_event_date, now),
+            "date": _format_datetime(next_event_date),
+            "daysUntil": _days_until(next_event_date, now),
         }
         if interactions and interactions.next_event:
             person_ids = interactions.next_event.person_ids
@@ -127,10 +132,10 @@ def transform_interaction_data(
         result["nextMeeting"] = meeting_data
 
     # Last email
-    if interaction_dates.last_email_date:
+    if last_email_date:
         email_data: dict[str, Any] = {
-            "date": _format_datetime(interaction_dates.last_email_date),
-            "daysSince": _days_since(interaction_dates.last_email_date, now),
+            "date": _format_datetime(last_email_date),
+            "daysSince": _days_since(last_email_date, now),
         }
         if interactions and interactions.last_email:
             person_ids = interactions.last_email.person_ids
@@ -142,10 +147,10 @@ def transform_interaction_data(
         result["lastEmail"] = email_data
 
     # Last interaction (any type)
-    if interaction_dates.last_interaction_date:
+    if last_interaction_date:
         result["lastInteraction"] = {
-            "date": _format_datetime(interaction_dates.last_interaction_date),
-            "daysSince": _days_since(interaction_dates.last_interaction_date, now),
+            "date": _format_datetime(last_interaction_date),
+            "daysSince": _days_since(last_interaction_date, now),
         }
 
     return result if result else None
@@ -20,6 +20,7 @@ Example:
 # Phase 2 modules
 from .aggregates import (
     apply_having,
+    compile_aggregates,
     compute_aggregates,
     group_and_aggregate,
 )
@@ -144,6 +145,7 @@ __all__ = [
     "is_relative_date",
     # Aggregates
     "compute_aggregates",
+    "compile_aggregates",
     "group_and_aggregate",
     "apply_having",
     # Executor
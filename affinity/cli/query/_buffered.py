@@ -0,0 +1,87 @@
+"""Read-ahead buffering for async iterators.
+
+Lets the executor request the next page from the API while the current page
+is being processed. This module is CLI-only and NOT part of the public SDK API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import TypeVar, cast
+
+T = TypeVar("T")
+
+# Queue marker signalling that the source iterator is exhausted
+_DONE = object()
+
+
+async def prefetch(source: AsyncIterable[T], n: int = 1) -> AsyncIterator[T]:
+    """Iterate ``source`` while keeping up to ``n`` items fetched ahead.
+
+    A background task drains ``source`` into a bounded queue, so the next
+    item is awaited while the consumer is still working on the current one.
+    Exceptions raised by ``source`` (including KeyboardInterrupt) are re-raised
+    in the consumer at the point where the failing item would have been
+    yielded. If the consumer stops early, the background task is cancelled.
+
+    Args:
+        source: Async iterable to read from
+        n: Maximum number of items buffered ahead of the consumer
+
+    Yields:
+        Items from ``source`` in order
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=n)
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as exc:
+            # Forward to the consumer instead of failing the task
+            await queue.put(_Failure(exc))
+            return
+        await queue.put(_DONE)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield cast(T, item)
+    finally:
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+async def aclose(source: object) -> None:
+    """Close an async iterator the consumer stopped reading early.
+
+    Async generators (such as SDK page iterators) are closed right away, so
+    their cleanup, e.g. releasing a pooled connection, doesn't wait for
+    garbage collection. Iterators without aclose() are left as they are.
+    """
+    close = getattr(source, "aclose", None)
+    if close is not None:
+        await close()
+
+
+class _Failure:
+    """Wrapper for an exception raised by the source iterator."""
+
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
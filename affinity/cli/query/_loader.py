@@ -0,0 +1,91 @@
+"""Batched ID lookups for the query executor.
+
+Coalesces individual lookups issued in the same event-loop tick into batched
+calls (the DataLoader pattern). This module is CLI-only and NOT part of the
+public SDK API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class IdBatcher(Generic[K, V]):
+    """Collect ID lookups and resolve them with one batch call per tick.
+
+    The first load() in a tick schedules a flush on the event loop. The flush
+    sends every queued ID to ``batch_fn`` (split into chunks of at most
+    ``max_batch_size``) and resolves each caller's future from the returned
+    mapping. IDs missing from the mapping resolve to None.
+
+    Lookups are memoized for the batcher's lifetime: repeated or concurrent
+    loads of the same ID share one future. If a batch call fails, every
+    future in that batch receives the exception.
+
+    Example:
+        batcher = IdBatcher(fetch_names)  # async (ids) -> {id: name}
+        names = await asyncio.gather(batcher.load(1), batcher.load(2))
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        *,
+        max_batch_size: int = 100,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+        self._flush_scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def load(self, key: K) -> asyncio.Future[V | None]:
+        """Queue a lookup and return a future for its result."""
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Dispatch queued IDs as batch calls."""
+        queue, self._queue = self._queue, []
+        self._flush_scheduled = False
+        for start in range(0, len(queue), self._max_batch_size):
+            task = asyncio.ensure_future(
+                self._run_batch(queue[start : start + self._max_batch_size])
+            )
+            # Keep a reference so the task isn't garbage collected mid-flight
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, keys: list[K]) -> None:
+        """Run one batch call and resolve its futures."""
+        try:
+            results = await self._batch_fn(keys)
+        except Exception as exc:
+            for key in keys:
+                future = self._futures[key]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key in keys:
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(results.get(key))
@@ -6,39 +6,77 @@ It is CLI-only and NOT part of the public SDK API.
 
 from __future__ import annotations
 
-import contextlib
 import statistics
 from collections import defaultdict
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
-from .filters import resolve_field_path
+from .filters import compile_field_path
 from .models import AggregateFunc, HavingClause
 
+# Column sources for compiled aggregate reducers
+_NUMERIC = "numeric"
+_PRESENT = "present"
+_RECORDS = "records"
+
 # =============================================================================
 # Aggregate Functions
 # =============================================================================
 
 
-def compute_sum(records: list[dict[str, Any]], field: str) -> float:
-    """Compute sum of a field across records."""
-    total = 0.0
+def _numeric_values(records: list[dict[str, Any]], field: str) -> list[float]:
+    """Extract the values of a field that convert to float, in record order."""
+    return _numeric_column(records, compile_field_path(field))
+
+
+def _numeric_column(
+    records: list[dict[str, Any]], get_value: Callable[[dict[str, Any]], Any]
+) -> list[float]:
+    """Extract the values returned by a compiled getter that convert to float."""
+    values: list[float] = []
+    append = values.append
     for record in records:
-        value = resolve_field_path(record, field)
+        value = get_value(record)
         if value is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                total += float(value)
-    return total
+            # Plain try/except: entering a suppress() context per value costs
+            # more than the conversion itself
+            try:  # noqa: SIM105
+                append(float(value))
+            except (ValueError, TypeError):
+                pass
+    return values
+
+
+def _present_values(records: list[dict[str, Any]], field: str) -> list[Any]:
+    """Extract the non-null values of a field, in record order."""
+    return _present_column(records, compile_field_path(field))
+
+
+def _present_column(
+    records: list[dict[str, Any]], get_value: Callable[[dict[str, Any]], Any]
+) -> list[Any]:
+    """Extract the non-null values returned by a compiled getter."""
+    return [value for value in map(get_value, records) if value is not None]
+
+
+def compute_sum(records: list[dict[str, Any]], field: str) -> float:
+    """Compute sum of a field across records."""
+    return _sum_of(_numeric_values(records, field))
+
+
+def _sum_of(values: list[float]) -> float:
+    """Sum numeric values extracted by _numeric_values."""
+    return sum(values, 0.0)
 
 
 def compute_avg(records: list[dict[str, Any]], field: str) -> float | None:
     """Compute average of a field across records."""
-    values: list[float] = []
-    for record in records:
-        value = resolve_field_path(record, field)
-        if value is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                values.append(float(value))
+    return _avg_of(_numeric_values(records, field))
 
+
+def _avg_of(values: list[float]) -> float | None:
+    """Average numeric values extracted by _numeric_values."""
     if not values:
         return None
     return sum(values) / len(values)
@@ -46,28 +84,12 @@ def compute_avg(records: list[dict[str, Any]], field: str) -> float | None:
 
 def compute_min(records: list[dict[str, Any]], field: str) -> Any:
     """Compute minimum value of a field across records."""
-    values: list[Any] = []
-    for record in records:
-        value = resolve_field_path(record, field)
-        if value is not None:
-            values.append(value)
-
-    if not values:
-        return None
-    return min(values)
+    return min(_present_values(records, field), default=None)
 
 
 def compute_max(records: list[dict[str, Any]], field: str) -> Any:
     """Compute maximum value of a field across records."""
-    values: list[Any] = []
-    for record in records:
-        value = resolve_field_path(record, field)
-        if value is not None:
-            values.append(value)
-
-    if not values:
-        return None
-    return max(values)
+    return max(_present_values(records, field), default=None)
 
 
 def compute_count(records: list[dict[str, Any]], field: str | bool | None = None) -> int:
@@ -82,12 +104,8 @@ def compute_count(records: list[dict[str, Any]], field: str | bool | None = None
         return len(records)
 
     if isinstance(field, str):
-        count = 0
-        for record in records:
-            value = resolve_field_path(record, field)
-            if value is not None:
-                count += 1
-        return count
+        get_value = compile_field_path(field)
+        return sum(1 for record in records if get_value(record) is not None)
 
     return len(records)
 
@@ -103,17 +121,15 @@ def compute_percentile(records: list[dict[str, Any]], field: str, p: int | float
     Returns:
         The percentile value, or None if no valid values
     """
-    values: list[float] = []
-    for record in records:
-        value = resolve_field_path(record, field)
-        if value is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                values.append(float(value))
+    return _percentile_of(_numeric_values(records, field), p)
+
 
+def _percentile_of(values: list[float], p: int | float) -> float | None:
+    """Percentile of numeric values (sorts a copy; the input may be shared)."""
     if not values:
         return None
 
-    values.sort()
+    values = sorted(values)
 
     # Handle edge cases
     if len(values) == 1:
@@ -131,8 +147,15 @@ def compute_percentile(records: list[dict[str, Any]], field: str, p: int | float
 
 def compute_first(records: list[dict[str, Any]], field: str) -> Any:
     """Get first non-null value of a field."""
+    return _first_present(compile_field_path(field), records)
+
+
+def _first_present(
+    get_value: Callable[[dict[str, Any]], Any], records: list[dict[str, Any]]
+) -> Any:
+    """First non-null value returned by a compiled getter."""
     for record in records:
-        value = resolve_field_path(record, field)
+        value = get_value(record)
         if value is not None:
             return value
     return None
@@ -140,8 +163,13 @@ def compute_first(records: list[dict[str, Any]], field: str) -> Any:
 
 def compute_last(records: list[dict[str, Any]], field: str) -> Any:
     """Get last non-null value of a field."""
+    return _last_present(compile_field_path(field), records)
+
+
+def _last_present(get_value: Callable[[dict[str, Any]], Any], records: list[dict[str, Any]]) -> Any:
+    """Last non-null value returned by a compiled getter."""
     for record in reversed(records):
-        value = resolve_field_path(record, field)
+        value = get_value(record)
         if value is not None:
             return value
     return None
@@ -217,29 +245,58 @@ def compute_aggregates(
     Returns:
         Dict of aggregate name -> computed value
     """
-    results: dict[str, Any] = {}
+    return compile_aggregates(aggregates)(records)
+
+
+def compile_aggregates(
+    aggregates: dict[str, AggregateFunc],
+) -> Callable[[list[dict[str, Any]]], dict[str, Any]]:
+    """Compile aggregate definitions into a function over a record set.
+
+    Aggregate kinds are dispatched and field paths parsed once here, so a
+    grouped query only pays for the column scans of each group.
+
+    Args:
+        aggregates: Dict of aggregate name -> AggregateFunc
+
+    Returns:
+        Function mapping a list of records to aggregate name -> computed value
+    """
+    getters: dict[str, Callable[[dict[str, Any]], Any]] = {}
+    # (name, source, field, reduce): source is the column reduce is applied to
+    reducers: list[tuple[str, str, str, Callable[[Any], Any]]] = []
     expression_aggs: list[tuple[str, str, list[str | int | float]]] = []
 
-    # First pass: compute non-expression aggregates
+    def reducer(name: str, source: str, field: str, reduce: Callable[[Any], Any]) -> None:
+        if field not in getters:
+            getters[field] = compile_field_path(field)
+        reducers.append((name, source, field, reduce))
+
     for name, agg_func in aggregates.items():
         if agg_func.sum is not None:
-            results[name] = compute_sum(records, agg_func.sum)
+            reducer(name, _NUMERIC, agg_func.sum, _sum_of)
         elif agg_func.avg is not None:
-            results[name] = compute_avg(records, agg_func.avg)
+            reducer(name, _NUMERIC, agg_func.avg, _avg_of)
         elif agg_func.min is not None:
-            results[name] = compute_min(records, agg_func.min)
+            reducer(name, _PRESENT, agg_func.min, partial(min, default=None))
         elif agg_func.max is not None:
-            results[name] = compute_max(records, agg_func.max)
+            reducer(name, _PRESENT, agg_func.max, partial(max, default=None))
         elif agg_func.count is not None:
-            results[name] = compute_count(records, agg_func.count)
+            if isinstance(agg_func.count, str):
+                # Counting a field is counting its non-null values
+                reducer(name, _PRESENT, agg_func.count, len)
+            else:
+                reducers.append((name, _RECORDS, "", len))
         elif agg_func.percentile is not None:
             field = agg_func.percentile.get("field", "")
             p = agg_func.percentile.get("p", 50)
-            results[name] = compute_percentile(records, field, p)
+            reducer(name, _NUMERIC, field, partial(_percentile_of, p=p))
         elif agg_func.first is not None:
-            results[name] = compute_first(records, agg_func.first)
+            get_first = compile_field_path(agg_func.first)
+            reducers.append((name, _RECORDS, "", partial(_first_present, get_first)))
         elif agg_func.last is not None:
-            results[name] = compute_last(records, agg_func.last)
+            get_last = compile_field_path(agg_func.last)
+            reducers.append((name, _RECORDS, "", partial(_last_present, get_last)))
         elif agg_func.multiply is not None:
             expression_aggs.append((name, "multiply", agg_func.multiply))
         elif agg_func.divide is not None:
@@ -249,11 +306,32 @@ def compute_aggregates(
         elif agg_func.subtract is not None:
             expression_aggs.append((name, "subtract", agg_func.subtract))
 
-    # Second pass: compute expression aggregates
-    for name, operation, operands in expression_aggs:
-        results[name] = compute_expression(results, operation, operands)
+    def run(records: list[dict[str, Any]]) -> dict[str, Any]:
+        results: dict[str, Any] = {}
+        # Columns are extracted once per field: numeric values are shared by
+        # sum/avg/percentile, non-null values by min/max/count
+        numeric: dict[str, list[float]] = {}
+        present: dict[str, list[Any]] = {}
+
+        for name, source, field, reduce in reducers:
+            column: Any
+            if source == _NUMERIC:
+                column = numeric.get(field)
+                if column is None:
+                    column = numeric[field] = _numeric_column(records, getters[field])
+            elif source == _PRESENT:
+                column = present.get(field)
+                if column is None:
+                    column = present[field] = _present_column(records, getters[field])
+            else:
+                column = records
+            results[name] = reduce(column)
+
+        for name, operation, operands in expression_aggs:
+            results[name] = compute_expression(results, operation, operands)
+        return results
 
-    return results
+    return run
 
 
 def group_and_aggregate(
@@ -287,16 +365,18 @@ def group_and_aggregate(
                 return tuple(value)
         return value
 
+    get_key = compile_field_path(group_by)
     for record in records:
-        key = resolve_field_path(record, group_by)
+        key = get_key(record)
         hashable_key = make_hashable(key)
         groups[hashable_key].append(record)
 
     results: list[dict[str, Any]] = []
     null_result: dict[str, Any] | None = None
 
+    aggregate = compile_aggregates(aggregates)
     for key, group_records in groups.items():
-        agg_values = compute_aggregates(group_records, aggregates)
+        agg_values = aggregate(group_records)
 
         # Convert tuple back to list for display, use "(no value)" for null
         display_key: Any
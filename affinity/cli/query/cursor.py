@@ -27,6 +27,11 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 if TYPE_CHECKING:
     from .models import Query
 
+try:  # Optional: faster JSON encoding for large cached result sets
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -352,8 +357,7 @@ def write_cache(data: list[dict[str, Any]], query_hash: str) -> tuple[str, str]:
         InvalidCursor: If data exceeds size limits
     """
     # Serialize data
-    json_content = json.dumps(data, separators=(",", ":"), default=str)
-    content_bytes = json_content.encode()
+    content_bytes = _encode_cache_data(data)
 
     # Check single file limit
     if len(content_bytes) > MAX_CACHE_FILE_BYTES:
@@ -394,6 +398,21 @@ def write_cache(data: list[dict[str, Any]], query_hash: str) -> tuple[str, str]:
     return str(cache_path), content_hash
 
 
+def _encode_cache_data(data: list[dict[str, Any]]) -> bytes:
+    """Serialize cache data to compact JSON bytes, using orjson when installed.
+
+    Falls back to the standard library for values orjson rejects
+    (e.g. integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            encoded: bytes = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+            return encoded
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, separators=(",", ":"), default=str).encode()
+
+
 def read_cache(cursor: CursorPayload) -> list[dict[str, Any]] | None:
     """Read cached results with integrity check.
 
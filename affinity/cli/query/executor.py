@@ -7,15 +7,24 @@ This module is CLI-only and NOT part of the public SDK API.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import heapq
 import logging
 import os
+import signal
+import sys
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Protocol
 
+import httpx
+
 from ...exceptions import AuthenticationError, AuthorizationError, NotFoundError
 from ..interaction_utils import resolve_interaction_names_async, transform_interaction_data
+from ._buffered import aclose, prefetch
+from ._loader import IdBatcher
 from .aggregates import apply_having, compute_aggregates, group_and_aggregate
 from .exceptions import (
     QueryExecutionError,
@@ -26,10 +35,10 @@ from .exceptions import (
 )
 from .filters import (
     FilterContext,
+    compile_field_path,
     compile_filter,
     compile_filter_with_context,
     requires_relationship_data,
-    resolve_field_path,
 )
 from .models import ExecutionPlan, PlanStep, Query, QueryResult, WhereClause
 from .schema import (
@@ -47,31 +56,106 @@ if TYPE_CHECKING:
     from affinity import AsyncAffinity
     from affinity.models.pagination import PaginationProgress
 
+    from ..session_cache import SessionCache
     from .schema import EntitySchema
 
 
+# =============================================================================
+# Field Reference Utilities
+# =============================================================================
+
+# Prefix of custom field paths ("fields.<name>"), and the all-fields wildcard
+_FIELDS_PREFIX = "fields."
+_FIELDS_WILDCARD = "fields.*"
+
+# Sentinel returned when a query references every field via "fields.*"
+_ALL_FIELDS: frozenset[str] = frozenset({"*"})
+
+# AggregateFunc attributes that can hold a single field path (count may also be a bool)
+_AGGREGATE_FIELD_ATTRS = ("sum", "avg", "min", "max", "count", "first", "last")
+
+
+def _iter_query_field_paths(query: Query) -> Iterator[str]:
+    """Yield field paths referenced by select, groupBy, and aggregate clauses."""
+    if query.select:
+        yield from query.select
+    if query.group_by:
+        yield query.group_by
+    if query.aggregate:
+        for agg in query.aggregate.values():
+            for attr in _AGGREGATE_FIELD_ATTRS:
+                field = getattr(agg, attr, None)
+                if field and isinstance(field, str):
+                    yield field
+            # Handle percentile which has nested structure
+            if agg.percentile and isinstance(agg.percentile, dict):
+                pct_field = agg.percentile.get("field", "")
+                if isinstance(pct_field, str):
+                    yield pct_field
+
+
+def _push_clauses(stack: list[Any], clauses: Any) -> None:
+    """Queue the sub-clauses of an and/or clause."""
+    if isinstance(clauses, list):
+        stack.extend(clauses)
+
+
+# Where clause keys holding sub-clauses -> how to queue them. Covers both
+# the JSON aliases (dict input) and the WhereClause attribute names.
+_WHERE_CHILDREN: dict[str, Callable[[list[Any], Any], None]] = {
+    "and": _push_clauses,
+    "or": _push_clauses,
+    "and_": _push_clauses,
+    "or_": _push_clauses,
+    "not": list.append,
+    "not_": list.append,
+}
+
+
 # =============================================================================
 # Field Projection Utilities
 # =============================================================================
 
 
-def _set_nested_value(target: dict[str, Any], path: str, value: Any) -> None:
-    """Set a value at a nested path in a dict.
+def _record_to_dict(record: Any) -> dict[str, Any]:
+    """Convert a fetched record to its JSON-compatible dict form.
 
-    Creates intermediate dicts as needed.
+    Records that are already dicts (raw API payloads) are returned as-is,
+    skipping the model_dump() call.
+    """
+    if isinstance(record, dict):
+        return record
+    result: dict[str, Any] = record.model_dump(mode="json", by_alias=True)
+    return result
 
-    Args:
-        target: Dict to set value in
-        path: Dot-separated path like "fields.Status"
-        value: Value to set
+
+async def _warm_person_name_cache(
+    interaction_data: dict[str, Any],
+    cache: dict[int, str],
+    loader: IdBatcher[int, str],
+) -> None:
+    """Batch-resolve uncached team member names before per-section resolution.
+
+    Names the loader cannot resolve are left out of the cache, so
+    resolve_interaction_names_async falls back to individual fetches for them.
     """
-    parts = path.split(".")
-    current = target
-    for part in parts[:-1]:
-        if part not in current:
-            current[part] = {}
-        current = current[part]
-    current[parts[-1]] = value
+    person_ids: set[int] = set()
+    for section_key in ("lastMeeting", "nextMeeting", "lastEmail"):
+        section = interaction_data.get(section_key)
+        if section and section.get("teamMemberIds"):
+            person_ids.update(pid for pid in section["teamMemberIds"] if pid not in cache)
+    if not person_ids:
+        return
+
+    ids = list(person_ids)
+    try:
+        names = await asyncio.gather(*[loader.load(pid) for pid in ids])
+    except Exception as e:
+        logger.debug(f"Batch person name lookup failed, resolving individually: {e}")
+        return
+    for pid, name in zip(ids, names, strict=True):
+        if name is not None:
+            cache[pid] = name
 
 
 def _extract_person_display_name(data: dict[str, Any]) -> str | None:
@@ -91,6 +175,53 @@ def _extract_person_display_name(data: dict[str, Any]) -> str | None:
     return name if name else None
 
 
+def _extract_field_value(value_wrapper: Any) -> Any:
+    """Extract a query-friendly value from an API field value wrapper.
+
+    Handles dropdowns ({"data": {"text": ...}}), person and company references,
+    multi-select arrays, and plain scalars.
+    """
+    if not isinstance(value_wrapper, dict):
+        return value_wrapper
+
+    data = value_wrapper.get("data")
+    if isinstance(data, list):
+        return _extract_multi_select_values(data)
+    if isinstance(data, dict):
+        # Dropdown/ranked-dropdown with text value
+        if "text" in data:
+            return data["text"]
+        # Person reference: {"firstName": "Jane", "lastName": "Doe"}
+        if "firstName" in data or "lastName" in data:
+            return _extract_person_display_name(data)
+        # Company reference: {"name": "Acme", "domain": "acme.com"}
+        if "name" in data:
+            return data["name"]
+    return data
+
+
+def _extract_multi_select_values(items: list[Any]) -> list[Any]:
+    """Extract text/names from each item of a multi-select field value."""
+    extracted: list[Any] = []
+    for item in items:
+        if not isinstance(item, dict):
+            extracted.append(item)
+        elif "text" in item:
+            # Dropdown item
+            extracted.append(item["text"])
+        elif "firstName" in item or "lastName" in item:
+            # Person reference in multi-select
+            name = _extract_person_display_name(item)
+            if name:
+                extracted.append(name)
+        elif "name" in item:
+            # Company reference in multi-select
+            extracted.append(item["name"])
+        else:
+            extracted.append(item)
+    return extracted
+
+
 def _normalize_list_entry_fields(record: dict[str, Any]) -> dict[str, Any]:
     """Normalize list entry field values from API format to query-friendly format.
 
@@ -110,63 +241,18 @@ def _normalize_list_entry_fields(record: dict[str, Any]) -> dict[str, Any]:
     """
     entity = record.get("entity")
 
-    # Extract custom field values if available
+    # Extract custom field values into a dict keyed by field name
     normalized_fields: dict[str, Any] = {}
     if entity and isinstance(entity, dict):
         fields_container = entity.get("fields")
         if fields_container and isinstance(fields_container, dict):
             fields_data = fields_container.get("data")
             if fields_data and isinstance(fields_data, dict):
-                # Extract field values into a dict keyed by field name
-                for _field_id, field_obj in fields_data.items():
-                    if not isinstance(field_obj, dict):
-                        continue
-
-                    field_name = field_obj.get("name")
-                    if not field_name:
-                        continue
-
-                    value_wrapper = field_obj.get("value")
-                    if value_wrapper is None:
-                        normalized_fields[field_name] = None
-                        continue
-
-                    if isinstance(value_wrapper, dict):
-                        data = value_wrapper.get("data")
-                        # Handle dropdown/ranked-dropdown with text value
-                        if isinstance(data, dict) and "text" in data:
-                            normalized_fields[field_name] = data["text"]
-                        # Handle multi-select (array of values)
-                        elif isinstance(data, list):
-                            # Extract text/names from each item
-                            extracted = []
-                            for item in data:
-                                if isinstance(item, dict) and "text" in item:
-                                    # Dropdown item
-                                    extracted.append(item["text"])
-                                elif isinstance(item, dict) and (
-                                    "firstName" in item or "lastName" in item
-                                ):
-                                    # Person reference in multi-select
-                                    name = _extract_person_display_name(item)
-                                    if name:
-                                        extracted.append(name)
-                                elif isinstance(item, dict) and "name" in item:
-                                    # Company reference in multi-select
-                                    extracted.append(item["name"])
-                                else:
-                                    extracted.append(item)
-                            normalized_fields[field_name] = extracted
-                        # Handle person reference: {"firstName": "Jane", "lastName": "Doe"}
-                        elif isinstance(data, dict) and ("firstName" in data or "lastName" in data):
-                            normalized_fields[field_name] = _extract_person_display_name(data)
-                        # Handle company reference: {"name": "Acme", "domain": "acme.com"}
-                        elif isinstance(data, dict) and "name" in data:
-                            normalized_fields[field_name] = data["name"]
-                        else:
-                            normalized_fields[field_name] = data
-                    else:
-                        normalized_fields[field_name] = value_wrapper
+                normalized_fields = {
+                    field_obj["name"]: _extract_field_value(field_obj.get("value"))
+                    for field_obj in fields_data.values()
+                    if isinstance(field_obj, dict) and field_obj.get("name")
+                }
 
     # Replace the complex fields structure with a simple dict keyed by name
     if normalized_fields:
@@ -193,6 +279,51 @@ def _normalize_list_entry_fields(record: dict[str, Any]) -> dict[str, Any]:
     return record
 
 
+@dataclass(frozen=True, slots=True)
+class _Projection:
+    """Select clause projection, precomputed once and applied per record."""
+
+    paths: tuple[str, ...]  # Explicit paths (excluding the "fields.*" wildcard)
+    include_all_fields: bool  # True if "fields.*" was selected
+    # (getter, parent keys, leaf key) per path, so paths are parsed only once
+    _accessors: tuple[tuple[Callable[[dict[str, Any]], Any], tuple[str, ...], str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        accessors = []
+        for path in self.paths:
+            *parents, leaf = path.split(".")
+            accessors.append((compile_field_path(path), tuple(parents), leaf))
+        object.__setattr__(self, "_accessors", tuple(accessors))
+
+    @classmethod
+    def from_select(cls, select: list[str]) -> _Projection:
+        """Build a projection from a select list."""
+        return cls(
+            paths=tuple(p for p in select if p != "fields.*"),
+            include_all_fields="fields.*" in select,
+        )
+
+    def __call__(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Return a new record containing only the selected fields."""
+        new_record: dict[str, Any] = {}
+
+        # Apply explicit paths - always include value even if None
+        # This ensures explicitly selected fields appear in output
+        for getter, parents, leaf in self._accessors:
+            target = new_record
+            for key in parents:
+                target = target.setdefault(key, {})
+            target[leaf] = getter(record)
+
+        # Handle fields.* wildcard - copy entire fields dict
+        if self.include_all_fields and "fields" in record:
+            new_record["fields"] = record["fields"]
+
+        return new_record
+
+
 def _apply_select_projection(
     records: list[dict[str, Any]], select: list[str]
 ) -> list[dict[str, Any]]:
@@ -214,28 +345,8 @@ def _apply_select_projection(
     if not select:
         return records
 
-    # Check for fields.* wildcard - means include all fields
-    include_all_fields = "fields.*" in select
-    # Filter out the wildcard from paths to process
-    paths = [p for p in select if p != "fields.*"]
-
-    projected: list[dict[str, Any]] = []
-    for record in records:
-        new_record: dict[str, Any] = {}
-
-        # Apply explicit paths - always include value even if None
-        # This ensures explicitly selected fields appear in output
-        for path in paths:
-            value = resolve_field_path(record, path)
-            _set_nested_value(new_record, path, value)
-
-        # Handle fields.* wildcard - copy entire fields dict
-        if include_all_fields and "fields" in record:
-            new_record["fields"] = record["fields"]
-
-        projected.append(new_record)
-
-    return projected
+    projection = _Projection.from_select(select)
+    return [projection(record) for record in records]
 
 
 # =============================================================================
@@ -284,7 +395,7 @@ class NullProgressCallback:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Tracks state during query execution."""
 
@@ -298,7 +409,7 @@ class ExecutionContext:
     # Structure: {rel_name: {record_id: [related_records]}} - for quantifier/exists filtering
     relationship_data: dict[str, dict[int, list[dict[str, Any]]]] = field(default_factory=dict)
     current_step: int = 0
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
     max_records: int = 10000
     interrupted: bool = False
     resolved_where: dict[str, Any] | None = None  # Where clause with resolved names
@@ -306,10 +417,49 @@ class ExecutionContext:
     needs_full_fetch: bool = False  # True if filter/aggregate/sort exists (need all records first)
     early_terminated: bool = False  # True if stopped early due to limit (streaming mode)
     last_api_cursor: str | None = None  # API cursor at pagination stop (for streaming resumption)
+    count_only: bool = False  # True if only count(*) is needed (fetch counts, keeps no records)
+    record_count: int = 0  # Records counted during fetch in count_only mode
+    # Select projection applied while fetching; records are stored already projected
+    projection: _Projection | None = None
+    filter_during_fetch: bool = False  # True if the plan allows fusing filter + limit into fetch
+    # WHERE predicate applied while fetching; set once the where clause is resolved
+    fetch_filter: Callable[[dict[str, Any]], bool] | None = None
+
+    def add_page(
+        self, page_data: list[Any], stop_at: int | None, *, normalize: bool = False
+    ) -> bool:
+        """Convert one page of fetched records and add them to records.
+
+        Records are converted, filtered (fetch_filter) and projected as a batch
+        and stored with a single extend. Without a fetch filter, records past
+        stop_at are sliced off before conversion so they are never dumped.
+
+        Args:
+            page_data: Raw records from one API page
+            stop_at: Stop once records reaches this size (None for no limit)
+            normalize: Normalize list entry fields for query-friendly access
+
+        Returns:
+            True if records reached stop_at and fetching should stop
+        """
+        records = self.records
+        if stop_at is not None and self.fetch_filter is None:
+            page_data = page_data[: max(stop_at - len(records), 0)]
+        batch = [_record_to_dict(record) for record in page_data]
+        if normalize:
+            batch = [_normalize_list_entry_fields(record) for record in batch]
+        if self.fetch_filter is not None:
+            batch = [record for record in batch if self.fetch_filter(record)]
+        if stop_at is not None:
+            batch = batch[: max(stop_at - len(records), 0)]
+        if self.projection is not None:
+            batch = [self.projection(record) for record in batch]
+        records.extend(batch)
+        return stop_at is not None and len(records) >= stop_at
 
     def check_timeout(self, timeout: float) -> None:
         """Check if execution has exceeded timeout."""
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         if elapsed > timeout:
             raise QueryTimeoutError(
                 f"Query execution exceeded timeout of {timeout}s",
@@ -336,9 +486,9 @@ class ExecutionContext:
         """
         from ..results import ResultSummary
 
-        # Apply select projection if specified
+        # Apply select projection if specified (unless already applied during fetch)
         data = self.records
-        if self.query.select:
+        if self.query.select and self.projection is None:
             # Auto-include expansions in select - if user requested expand,
             # they clearly want that data in output
             effective_select = list(self.query.select)
@@ -356,7 +506,7 @@ class ExecutionContext:
                 included_counts = None
 
         meta: dict[str, Any] = {
-            "executionTime": time.time() - self.start_time,
+            "executionTime": time.monotonic() - self.start_time,
             "interrupted": self.interrupted,
         }
         if self.early_terminated:
@@ -486,6 +636,36 @@ DEFAULT_MAX_RECORDS = 10000  # Default --max-records value
 # PERF: entity_concurrency_limit
 DEFAULT_CONCURRENCY = 15
 
+# Concurrent person name lookups during expansion (shared semaphore size)
+PERSON_RESOLUTION_CONCURRENCY = 10
+
+# Page size the API uses when no limit is requested
+_API_PAGE_SIZE = 100
+
+# How long a successful whoami() check is trusted by a reused executor
+_AUTH_CHECK_TTL_SECONDS = 300.0
+
+
+def query_http_limits(concurrency: int = DEFAULT_CONCURRENCY) -> httpx.Limits:
+    """Connection pool limits sized for query execution.
+
+    The SDK default keeps only 10 idle connections alive, fewer than the
+    executor runs in parallel (entity fetches plus person name lookups), so
+    surplus connections would be closed and re-established between requests.
+
+    Args:
+        concurrency: Concurrent entity fetches (see DEFAULT_CONCURRENCY)
+
+    Returns:
+        Limits that keep one connection alive per concurrent request
+    """
+    connections = concurrency + PERSON_RESOLUTION_CONCURRENCY
+    return httpx.Limits(
+        max_connections=connections,
+        max_keepalive_connections=connections,
+        keepalive_expiry=30.0,
+    )
+
 
 # =============================================================================
 # Rate-Aware Throttling
@@ -588,6 +768,371 @@ def validate_quantifier_query(
         )
 
 
+def _coerce_int(value: Any) -> int | None:
+    """Convert value to int, supporting both int and numeric strings.
+
+    Strings are checked before calling int() so that non-numeric input
+    (common in hand-written queries) doesn't pay for a raised ValueError.
+
+    Args:
+        value: Value from a where clause
+
+    Returns:
+        The integer, or None if value is not an int or a decimal integer string
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return _parse_int_string(value)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_int_string(value: str) -> int | None:
+    """Parse a decimal integer string, memoized since IDs repeat across clauses."""
+    text = value.strip()
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    return int(text) if digits.isdecimal() else None
+
+
+def _extract_parent_ids_impl(where: Any, field_name: str | None) -> list[int]:
+    """Extract ALL parent ID values from where clause.
+
+    Handles all condition types:
+    - Direct eq: {"path": "listId", "op": "eq", "value": 12345}
+    - Direct eq (string): {"path": "listId", "op": "eq", "value": "12345"}
+    - Direct in: {"path": "listId", "op": "in", "value": [123, 456, 789]}
+    - AND: {"and": [{"path": "listId", "op": "eq", "value": 123}, ...]}
+    - OR: {"or": [{"path": "listId", "op": "eq", "value": 123},
+                  {"path": "listId", "op": "eq", "value": 456}]}
+
+    Accepts both integer and string IDs (strings are converted to int).
+    Returns deduplicated list of all parent IDs found.
+    """
+    if where is None or field_name is None:
+        return []
+
+    if hasattr(where, "model_dump"):
+        where = where.model_dump(mode="json", by_alias=True)
+
+    # Insertion-ordered set: duplicates are dropped as they are found
+    ids: dict[int, None] = {}
+
+    # Walk with an explicit stack (no frame per nested clause, no recursion
+    # limit), visiting clauses in the same depth-first, left-to-right order
+    stack: list[Any] = [where]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
+        if node.get("path") == field_name:
+            op = node.get("op")
+            value = node.get("value")
+            # Direct condition with "eq" operator
+            if op == "eq":
+                int_val = _coerce_int(value)
+                if int_val is not None:
+                    ids[int_val] = None
+            # Direct condition with "in" operator (list of IDs)
+            elif op == "in" and isinstance(value, list):
+                for v in value:
+                    int_val = _coerce_int(v)
+                    if int_val is not None:
+                        ids[int_val] = None
+
+        # Compound "and"/"or" conditions: queue "or" first so "and" pops first
+        for key in ("or", "and"):
+            clauses = node.get(key)
+            if clauses:
+                stack.extend(reversed(clauses))
+
+        # NOTE: "not" clauses are intentionally NOT traversed.
+        # Negated parent filters are rejected by the parser.
+
+    return list(ids)
+
+
+def _is_parent_only_where(where: dict[str, Any], field_name: str | None) -> bool:
+    """Check if a where clause does nothing but select parents.
+
+    True for eq/in conditions on the parent field, alone or combined with
+    and/or. Every record fetched from those parents then matches the clause.
+    """
+    if field_name is None or any(where.get(key) for key in ("not", "all", "none", "exists")):
+        return False
+    if where.get("path") is not None:
+        return where["path"] == field_name and where.get("op") in ("eq", "in")
+    clauses = where.get("and") or where.get("or")
+    return (
+        isinstance(clauses, list)
+        and bool(clauses)
+        and all(
+            isinstance(clause, dict) and _is_parent_only_where(clause, field_name)
+            for clause in clauses
+        )
+    )
+
+
+def _order_key_part(value: Any, ascending: bool) -> tuple[int, Any]:
+    """Build the sort key for one order-by value.
+
+    None sorts to the end in ascending order. Descending order negates the
+    value where possible.
+    """
+    if value is None:
+        return (1, None) if ascending else (0, None)
+    if ascending:
+        return (0, value)
+    try:
+        return (0, -value)
+    except TypeError:
+        return (0, value)
+
+
+def _required_ids(where: WhereClause | None, id_field: str) -> list[int] | None:
+    """Get the IDs a record must have to match a where clause.
+
+    Returns the IDs from eq/in conditions on the ID field, intersected across
+    and-clauses and unioned across or-clauses. Returns None when a record
+    with any other ID could still match.
+    """
+    if where is None:
+        return None
+    if where.path is not None:
+        if where.path != id_field:
+            return None
+        if where.op == "eq":
+            values = [where.value]
+        elif where.op == "in" and isinstance(where.value, list):
+            values = where.value
+        else:
+            return None
+        ids: dict[int, None] = {}
+        for value in values:
+            id_ = _coerce_int(value)
+            if id_ is None:
+                return None
+            ids[id_] = None
+        return list(ids)
+    if where.and_:
+        required = [
+            ids for ids in (_required_ids(c, id_field) for c in where.and_) if ids is not None
+        ]
+        if not required:
+            return None
+        allowed = set(required[0]).intersection(*required[1:])
+        return [i for i in required[0] if i in allowed]
+    if where.or_:
+        union: dict[int, None] = {}
+        for clause in where.or_:
+            clause_ids = _required_ids(clause, id_field)
+            if clause_ids is None:
+                return None
+            union.update(dict.fromkeys(clause_ids))
+        return list(union)
+    return None
+
+
+def _id_lookup_kwargs(where: WhereClause | None, schema: Any) -> dict[str, Any]:
+    """Get service.all() kwargs that fetch only the records an ID filter allows.
+
+    The where clause is still applied client-side; this only narrows the fetch
+    to a batch lookup when the clause pins a small set of IDs.
+    """
+    if not schema.supports_id_lookup:
+        return {}
+    ids = _required_ids(where, schema.id_field)
+    if not ids or len(ids) > _API_PAGE_SIZE:
+        return {}
+    return {"ids": ids}
+
+
+# Plan step operations handled by _execute_fetch
+_FETCH_OPERATIONS = ("fetch", "fetch_streaming")
+
+# Entities _execute_fetch can dispatch to, for unknown-entity errors
+_QUERYABLE_ENTITIES = ", ".join(
+    sorted(
+        name
+        for name, schema in SCHEMA_REGISTRY.items()
+        if schema.fetch_strategy != FetchStrategy.RELATIONSHIP_ONLY
+    )
+)
+
+
+def _fetch_projection(plan: ExecutionPlan) -> _Projection | None:
+    """Get the select projection to apply while fetching, if safe.
+
+    Projection can move into the fetch loop only when no later step reads
+    unselected fields, i.e. the plan consists of nothing but fetch and limit.
+
+    Args:
+        plan: The execution plan
+
+    Returns:
+        Projection to apply per fetched record, or None to project at the end
+    """
+    query = plan.query
+    if not query.select:
+        return None
+    if not all(step.operation in (*_FETCH_OPERATIONS, "limit") for step in plan.steps):
+        return None
+    return _Projection.from_select(query.select)
+
+
+def _aggregate_projection(plan: ExecutionPlan) -> _Projection | None:
+    """Get a projection keeping only the fields an aggregate plan reads.
+
+    For plans of only fetch, aggregate, and limit steps, fetched records are
+    needed for nothing but the aggregates (and groupBy key), so each one can
+    be stored as a small dict of those fields instead of the full record.
+    Paths with array indexes are not projected (the projection writes dotted
+    keys only), nor are count-only plans, which keep no records at all.
+
+    Args:
+        plan: The execution plan
+
+    Returns:
+        Projection to apply per fetched record, or None to keep full records
+    """
+    query = plan.query
+    if not query.aggregate or query.select or _is_count_only(plan):
+        return None
+    if not all(step.operation in (*_FETCH_OPERATIONS, "aggregate", "limit") for step in plan.steps):
+        return None
+
+    paths = [path for path in dict.fromkeys(_iter_query_field_paths(query)) if path]
+    if any("[" in path for path in paths):
+        return None
+    return _Projection(paths=tuple(paths), include_all_fields=False)
+
+
+def _can_filter_during_fetch(plan: ExecutionPlan) -> bool:
+    """Check if the filter and limit steps can run inside the fetch loop.
+
+    True for plans of only fetch, filter, and limit steps with a query limit.
+    Filtering each record as it is fetched then lets the fetch stop as soon
+    as enough matches are found, instead of fetching everything, filtering,
+    and truncating.
+
+    Args:
+        plan: The execution plan
+
+    Returns:
+        True if the fetch step may filter records and stop at the limit
+    """
+    query = plan.query
+    if query.limit is None or query.order_by is not None:
+        return False
+    if query.aggregate is not None or query.group_by is not None:
+        return False
+    return all(step.operation in (*_FETCH_OPERATIONS, "filter", "limit") for step in plan.steps)
+
+
+def _compile_fetch_filter(
+    where: dict[str, Any], entity_type: str
+) -> Callable[[dict[str, Any]], bool] | None:
+    """Compile a resolved where clause for filtering during fetch.
+
+    Only filters that need no relationship data can run per record; those
+    that do still go through the regular filter step.
+
+    Args:
+        where: Resolved where clause
+        entity_type: Entity being queried
+
+    Returns:
+        Filter function, or None if the filter needs relationship data
+    """
+    from .filters import partition_where
+
+    clause = WhereClause.model_validate(where)
+    _cheap, expensive = partition_where(clause, entity_type)
+    if expensive is not None:
+        return None
+    return compile_filter(clause)
+
+
+def _is_count_only(plan: ExecutionPlan) -> bool:
+    """Check if a plan only needs the number of fetched records.
+
+    True for ungrouped queries whose aggregates are all count(*) and whose plan
+    has no client-side filter, sort, include, or expand step. Such plans can
+    count records page by page instead of materializing them.
+
+    Args:
+        plan: The execution plan
+
+    Returns:
+        True if the fetch step can count records without keeping them
+    """
+    query = plan.query
+    if not query.aggregate or query.group_by is not None or query.select:
+        return False
+    if any(
+        agg.model_dump(exclude_none=True) != {"count": True} for agg in query.aggregate.values()
+    ):
+        return False
+    return all(step.operation in (*_FETCH_OPERATIONS, "aggregate", "limit") for step in plan.steps)
+
+
+def _steps_with_deferred_expansions(plan: ExecutionPlan) -> list[PlanStep]:
+    """Order plan steps so expansions only run on records that survive the limit.
+
+    Expand steps are planned before sort and limit, so every fetched record
+    would be expanded (one API call each) and most then dropped. They are
+    moved to the end when no later step reads what they add: no aggregate
+    or groupBy, and no orderBy on an expanded field.
+
+    Args:
+        plan: The execution plan
+
+    Returns:
+        The plan's steps, in execution order
+    """
+    query = plan.query
+    expansions = {step.expansion for step in plan.steps if step.operation == "expand"}
+    if (
+        not expansions
+        or query.limit is None
+        or query.aggregate is not None
+        or query.group_by is not None
+    ):
+        return plan.steps
+    if query.order_by and any(
+        order.field is None or order.field.split(".", 1)[0] in expansions
+        for order in query.order_by
+    ):
+        return plan.steps
+    return [step for step in plan.steps if step.operation != "expand"] + [
+        step for step in plan.steps if step.operation == "expand"
+    ]
+
+
+def _group_concurrent_steps(steps: list[PlanStep]) -> list[list[PlanStep]]:
+    """Group steps so that runs of consecutive include steps execute together.
+
+    The planner chains every step on its predecessor, but include steps only
+    read ctx.records and each writes its own ctx.included entry, so adjacent
+    includes are independent and can overlap their API calls. Every other
+    step reads or rewrites ctx.records and stays in a group of its own.
+
+    Args:
+        steps: Plan steps in execution order
+
+    Returns:
+        Groups of steps, in execution order
+    """
+    groups: list[list[PlanStep]] = []
+    for step in steps:
+        if step.operation == "include" and groups and groups[-1][0].operation == "include":
+            groups[-1].append(step)
+        else:
+            groups.append([step])
+    return groups
+
+
 def can_use_streaming(query: Query, *, max_records_explicit: bool = False) -> bool:
     """Check if streaming mode with early termination is applicable.
 
@@ -614,6 +1159,59 @@ def can_use_streaming(query: Query, *, max_records_explicit: bool = False) -> bo
     return bool(max_records_explicit)
 
 
+@contextlib.contextmanager
+def _cancel_on_sigint(ctx: ExecutionContext) -> Iterator[None]:
+    """Cancel the current task on SIGINT while the block runs.
+
+    Cancellation is delivered at the next await, unlike KeyboardInterrupt
+    which can surface anywhere (including inside async generators and
+    library code). ``ctx.interrupted`` is set so the caller can tell a
+    Ctrl+C apart from other cancellations.
+
+    The flag is set by a signal.signal handler, which runs between bytecodes
+    even while a synchronous step (client-side filter, sort, or aggregate)
+    holds the loop. The cancel itself is scheduled on the loop. If the
+    signal lands after the last await, no cancel is delivered, and the
+    caller must check ``ctx.interrupted`` once the block's work returns.
+
+    The SIGINT handler installed before the block (e.g. asyncio.Runner's,
+    or a host application's) is restored afterwards.
+
+    Outside the main thread, where signal handlers cannot be installed,
+    this is a no-op.
+
+    Args:
+        ctx: Execution context to mark as interrupted
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    active = True
+
+    def cancel_task() -> None:
+        # A cancel scheduled after the block has exited must not leak out
+        if active and task is not None:
+            task.cancel()
+
+    def on_sigint(_signum: int, _frame: Any) -> None:
+        ctx.interrupted = True
+        loop.call_soon_threadsafe(cancel_task)
+
+    try:
+        previous_handler = signal.signal(signal.SIGINT, on_sigint)
+    except ValueError:
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        active = False
+        signal.signal(
+            signal.SIGINT,
+            previous_handler if previous_handler is not None else signal.SIG_DFL,
+        )
+
+
 # =============================================================================
 # Query Executor
 # =============================================================================
@@ -638,6 +1236,7 @@ class QueryExecutor:
         allow_partial: bool = False,
         rate_limiter: RateLimitedExecutor | None = None,
         resume_api_cursor: str | None = None,
+        session_cache: SessionCache | None = None,
     ) -> None:
         """Initialize the executor.
 
@@ -655,6 +1254,8 @@ class QueryExecutor:
             resume_api_cursor: API cursor for O(1) streaming resumption. When provided,
                                pagination starts from this cursor instead of from the beginning,
                                avoiding re-fetching records that were already returned.
+            session_cache: Optional session cache for list field metadata, so
+                           pipelines of queries don't re-fetch it on every run.
         """
         self.client = client
         self.progress = progress or NullProgressCallback()
@@ -668,6 +1269,19 @@ class QueryExecutor:
         self.allow_partial = allow_partial
         self.rate_limiter = rate_limiter or RateLimitedExecutor(self.concurrency)
         self.resume_api_cursor = resume_api_cursor
+        self.session_cache = session_cache
+        # Name lookup caches, filled on first use and kept for the executor's lifetime.
+        # The list name cache (exact name -> ID) stays None until lists are fetched;
+        # the casefolded map (None marks names that differ only in case) fills with it.
+        self._list_name_cache: dict[str, int] | None = None
+        self._list_casefold_cache: dict[str, int | None] = {}
+        self._field_name_cache: dict[str, dict[str, Any]] = {}
+        self._field_index_inflight: dict[int, asyncio.Task[dict[str, Any] | None]] = {}
+        self._person_name_cache: dict[int, str] = {}
+        # (query, field refs) for the query being run; see _collect_field_refs_from_query
+        self._field_refs_cache: tuple[Query, frozenset[str]] | None = None
+        # monotonic time of the last successful auth check (None: not checked)
+        self._auth_verified_at: float | None = None
 
     async def execute(self, plan: ExecutionPlan) -> QueryResult:
         """Execute a query plan.
@@ -704,63 +1318,122 @@ class QueryExecutor:
             query=plan.query,
             max_records=self.max_records,
             needs_full_fetch=needs_full_fetch,
+            count_only=_is_count_only(plan),
+            projection=_fetch_projection(plan) or _aggregate_projection(plan),
+            filter_during_fetch=_can_filter_during_fetch(plan),
         )
 
-        try:
-            # Verify auth before starting
-            await self._verify_auth()
-
-            # Check for single-ID lookup optimization
-            # This is much faster than streaming through all pages
-            single_id_result = await self._try_single_id_lookup(plan, ctx)
-            if single_id_result is not None:
-                return single_id_result
-
-            # Check if streaming mode is applicable for early termination
-            # Streaming works when: has limit OR explicit max_records, no sort/aggregate/groupBy
-            if can_use_streaming(plan.query, max_records_explicit=self.max_records_explicit):
-                schema = SCHEMA_REGISTRY.get(plan.query.from_)
-                # Only use streaming for GLOBAL entities (persons, companies, opportunities)
-                if schema and schema.fetch_strategy == FetchStrategy.GLOBAL:
-                    await self._execute_streaming(plan, ctx)
-                    # Handle includes and expands after streaming (if any)
-                    for step in plan.steps:
-                        if step.operation == "include":
-                            await self._execute_include(step, ctx)
-                        elif step.operation == "expand":
-                            await self._execute_expand(step, ctx)
-                    return ctx.build_result()
-
-            # Execute steps in dependency order (normal path)
-            for step in plan.steps:
-                ctx.current_step = step.step_id
-                ctx.check_timeout(self.timeout)
+        with _cancel_on_sigint(ctx):
+            try:
+                result = await self._execute_plan(plan, ctx)
+            except asyncio.CancelledError:
+                # Only SIGINT cancellation becomes an interrupt; anything else
+                # (e.g. the caller cancelling us) must propagate
+                if not ctx.interrupted:
+                    raise
+                task = asyncio.current_task()
+                if sys.version_info >= (3, 11) and task is not None:
+                    task.uncancel()
+                return self._interrupted_result(ctx)
+            except KeyboardInterrupt:
+                # Fallback where no SIGINT handler could be installed
+                ctx.interrupted = True
+                return self._interrupted_result(ctx)
+        if ctx.interrupted:
+            # SIGINT arrived during a synchronous step with no await after it
+            return self._interrupted_result(ctx)
+        return result
 
-                self.progress.on_step_start(step)
+    async def _execute_plan(self, plan: ExecutionPlan, ctx: ExecutionContext) -> QueryResult:
+        """Run the plan's steps against an initialized execution context."""
+        # Verify auth before starting
+        await self._verify_auth()
+
+        # Check for single-ID lookup optimization
+        # This is much faster than streaming through all pages
+        single_id_result = await self._try_single_id_lookup(plan, ctx)
+        if single_id_result is not None:
+            return single_id_result
+
+        # Check if streaming mode is applicable for early termination
+        # Streaming works when: has limit OR explicit max_records, no sort/aggregate/groupBy
+        if can_use_streaming(plan.query, max_records_explicit=self.max_records_explicit):
+            schema = SCHEMA_REGISTRY.get(plan.query.from_)
+            # Only use streaming for GLOBAL entities (persons, companies, opportunities)
+            if schema and schema.fetch_strategy == FetchStrategy.GLOBAL:
+                await self._execute_streaming(plan, ctx)
+                # Handle includes and expands after streaming (if any)
+                for step in plan.steps:
+                    if step.operation == "include":
+                        await self._execute_include(step, ctx)
+                    elif step.operation == "expand":
+                        await self._execute_expand(step, ctx)
+                return ctx.build_result()
 
-                try:
-                    await self._execute_step(step, ctx)
-                    self.progress.on_step_complete(step, len(ctx.records))
-                except Exception as e:
-                    self.progress.on_step_error(step, e)
-                    raise
+        # Execute steps in dependency order (normal path)
+        for group in _group_concurrent_steps(_steps_with_deferred_expansions(plan)):
+            ctx.current_step = group[0].step_id
+            ctx.check_timeout(self.timeout)
 
-            return ctx.build_result()
+            if len(group) == 1:
+                await self._run_step(group[0], ctx)
+                continue
 
-        except KeyboardInterrupt:
-            ctx.interrupted = True
-            if self.allow_partial and ctx.records:
-                return ctx.build_result()
-            raise QueryInterruptedError(
-                f"Query interrupted at step {ctx.current_step}. "
-                f"{len(ctx.records)} records fetched before interruption.",
-                step_id=ctx.current_step,
-                records_fetched=len(ctx.records),
-                partial_results=ctx.records,
-            ) from None
+            # Independent includes share the rate limiter, so overlapping them
+            # stays within the concurrency budget. Let every step finish (and
+            # report progress) before surfacing the first failure.
+            outcomes = await asyncio.gather(
+                *(self._run_step(step, ctx) for step in group), return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            # Restore step order in the included maps (completion order may differ)
+            for step in group:
+                rel_name = step.relationship
+                if rel_name in ctx.included:
+                    ctx.included[rel_name] = ctx.included.pop(rel_name)
+                if rel_name in ctx.included_by_parent:
+                    ctx.included_by_parent[rel_name] = ctx.included_by_parent.pop(rel_name)
+
+        return ctx.build_result()
+
+    async def _run_step(self, step: PlanStep, ctx: ExecutionContext) -> None:
+        """Execute one plan step with progress reporting."""
+        self.progress.on_step_start(step)
+
+        try:
+            await self._execute_step(step, ctx)
+            completed = len(ctx.records)
+            if ctx.count_only and step.operation in _FETCH_OPERATIONS:
+                completed = ctx.record_count
+            self.progress.on_step_complete(step, completed)
+        except Exception as e:
+            self.progress.on_step_error(step, e)
+            raise
+
+    def _interrupted_result(self, ctx: ExecutionContext) -> QueryResult:
+        """Return partial results or raise after an interruption."""
+        if self.allow_partial and ctx.records:
+            return ctx.build_result()
+        raise QueryInterruptedError(
+            f"Query interrupted at step {ctx.current_step}. "
+            f"{len(ctx.records)} records fetched before interruption.",
+            step_id=ctx.current_step,
+            records_fetched=len(ctx.records),
+            partial_results=ctx.records,
+        ) from None
 
     async def _verify_auth(self) -> None:
-        """Verify client is authenticated."""
+        """Verify client is authenticated.
+
+        A successful check is reused for _AUTH_CHECK_TTL_SECONDS, so an
+        executor running several queries makes one whoami() call, not one
+        per query.
+        """
+        verified_at = self._auth_verified_at
+        if verified_at is not None and time.monotonic() - verified_at < _AUTH_CHECK_TTL_SECONDS:
+            return
         try:
             await self.client.whoami()
         except Exception as e:
@@ -768,6 +1441,11 @@ class QueryExecutor:
                 "Authentication failed. Check your API key before running queries.",
                 cause=e,
             ) from None
+        self._auth_verified_at = time.monotonic()
+
+    def invalidate_auth(self) -> None:
+        """Forget the cached auth check so the next query calls whoami() again."""
+        self._auth_verified_at = None
 
     async def _try_single_id_lookup(
         self, plan: ExecutionPlan, ctx: ExecutionContext
@@ -958,7 +1636,7 @@ class QueryExecutor:
 
     async def _execute_step(self, step: PlanStep, ctx: ExecutionContext) -> None:
         """Execute a single plan step."""
-        if step.operation in ("fetch", "fetch_streaming"):
+        if step.operation in _FETCH_OPERATIONS:
             await self._execute_fetch(step, ctx)
         elif step.operation == "filter":
             await self._execute_filter_with_preinclude(step, ctx)
@@ -983,7 +1661,10 @@ class QueryExecutor:
 
         schema = SCHEMA_REGISTRY.get(step.entity)
         if schema is None:
-            raise QueryExecutionError(f"Unknown entity: {step.entity}", step=step)
+            raise QueryExecutionError(
+                f"Unknown entity: {step.entity}. Queryable entities: {_QUERYABLE_ENTITIES}",
+                step=step,
+            )
 
         try:
             match schema.fetch_strategy:
@@ -1020,6 +1701,7 @@ class QueryExecutor:
         starts from the cursor instead of from the beginning.
         """
         service = getattr(self.client, schema.service_attr)
+        stop_at = self._fetch_stop_at(ctx)
 
         def on_progress(p: PaginationProgress) -> None:
             self.progress.on_step_progress(step, p.items_so_far, None)
@@ -1033,15 +1715,13 @@ class QueryExecutor:
             while current_cursor:
                 # Fetch page starting from cursor
                 page = await service.list(cursor=current_cursor)
-                for record in page.data:
-                    record_dict = record.model_dump(mode="json", by_alias=True)
-                    ctx.records.append(record_dict)
-                    items_so_far += 1
-
-                    if self._should_stop(ctx):
-                        # Capture API cursor for potential next resumption
-                        ctx.last_api_cursor = page.next_cursor
-                        return
+                before = len(ctx.records)
+                reached = ctx.add_page(page.data, stop_at)
+                items_so_far += len(ctx.records) - before
+                if reached:
+                    # Capture API cursor for potential next resumption
+                    ctx.last_api_cursor = page.next_cursor
+                    return
 
                 # Progress update after each page
                 self.progress.on_step_progress(step, items_so_far, None)
@@ -1050,16 +1730,23 @@ class QueryExecutor:
                 current_cursor = page.next_cursor
             return
 
-        # Standard path: iterate from beginning
-        async for page in service.all().pages(on_progress=on_progress):
-            for record in page.data:
-                record_dict = record.model_dump(mode="json", by_alias=True)
-                ctx.records.append(record_dict)
-
-                if self._should_stop(ctx):
-                    # Capture API cursor for potential streaming resumption
-                    ctx.last_api_cursor = page.next_cursor
-                    return
+        # Standard path: iterate from beginning. When every page will be consumed
+        # anyway, request the next page while the current one is processed; with
+        # early termination possible, read-ahead would only waste API calls.
+        pages = service.all(**_id_lookup_kwargs(ctx.query.where, schema)).pages(
+            on_progress=on_progress
+        )
+        if stop_at is None:
+            pages = prefetch(pages)
+        async for page in pages:
+            if ctx.count_only:
+                ctx.record_count += len(page.data)
+                continue
+            if ctx.add_page(page.data, stop_at):
+                # Capture API cursor for potential streaming resumption
+                ctx.last_api_cursor = page.next_cursor
+                await aclose(pages)
+                return
 
     async def _fetch_with_parent(
         self,
@@ -1079,14 +1766,15 @@ class QueryExecutor:
         """
         # Resolve name-based lookups BEFORE extracting parent IDs
         where = ctx.query.where
+        where_unchanged = False
         if where is not None:
             # Convert WhereClause to dict for resolution
+            dumped = hasattr(where, "model_dump")
             where_as_dict: dict[str, Any] = (
-                where.model_dump(mode="json", by_alias=True)
-                if hasattr(where, "model_dump")
-                else where  # type: ignore[assignment]
+                where.model_dump(mode="json", by_alias=True) if dumped else where  # type: ignore[assignment]
             )
             where_dict = await self._resolve_list_names_to_ids(where_as_dict)
+            where_unchanged = dumped and where_dict is where_as_dict
         else:
             where_dict = None
 
@@ -1098,12 +1786,19 @@ class QueryExecutor:
         # - The normalized records have fields keyed by NAME (e.g., "Status")
         # - Field ID resolution is only for the API call, not client-side filtering
         if where_dict is not None:
-            ctx.resolved_where = where_dict
-
-        # Resolve field names to IDs for listEntries queries (after we know parent IDs)
-        # This is only used for the API call, NOT for client-side filtering
-        if where_dict is not None and parent_ids:
-            where_dict = await self._resolve_field_names_to_ids(where_dict, parent_ids)
+            # When resolution changed nothing, the filter step can use ctx.query.where
+            # as-is instead of validating the dump back into a WhereClause
+            if not where_unchanged:
+                ctx.resolved_where = where_dict
+            # A clause that only picks the parents is satisfied by every fetched record
+            if ctx.filter_during_fetch and not _is_parent_only_where(
+                where_dict, schema.parent_filter_field
+            ):
+                ctx.fetch_filter = _compile_fetch_filter(where_dict, ctx.query.from_)
+
+        # NOTE: fields.<name> paths are not rewritten to field IDs here. The where
+        # clause is only evaluated client-side, against records keyed by field
+        # NAME; the API receives field IDs via field_ids (see below) instead.
         if not parent_ids:
             # Should never happen - parser validates this
             raise QueryExecutionError(
@@ -1155,11 +1850,17 @@ class QueryExecutor:
                     pages_kwargs["field_ids"] = field_ids
 
                 async for page in nested_service.all().pages(**pages_kwargs):
+                    if ctx.count_only:
+                        ctx.record_count += len(page.data)
+                        continue
                     for record in page.data:
-                        results.append(record.model_dump(mode="json", by_alias=True))
+                        results.append(_record_to_dict(record))
             else:
                 async for record in nested_service.all():
-                    results.append(record.model_dump(mode="json", by_alias=True))
+                    if ctx.count_only:
+                        ctx.record_count += 1
+                        continue
+                    results.append(_record_to_dict(record))
 
             return results
 
@@ -1167,11 +1868,10 @@ class QueryExecutor:
         all_results = await asyncio.gather(*[fetch_from_parent(pid) for pid in parent_ids])
 
         # Merge results, respecting limits
+        stop_at = self._fetch_stop_at(ctx)
         for results in all_results:
-            for record_dict in results:
-                ctx.records.append(record_dict)
-                if self._should_stop(ctx):
-                    return
+            if ctx.add_page(results, stop_at):
+                return
 
             # Report progress after each parent completes
             self.progress.on_step_progress(step, len(ctx.records), None)
@@ -1198,6 +1898,7 @@ class QueryExecutor:
             field_ids: Optional list of field IDs to request for listEntries
         """
         nested_service = nested_method(parent_id)
+        stop_at = self._fetch_stop_at(ctx)
         items_fetched = 0
 
         def on_progress(p: PaginationProgress) -> None:
@@ -1222,17 +1923,13 @@ class QueryExecutor:
 
                 # Fetch page starting from cursor
                 page = await nested_service.list(**list_kwargs)
-                for record in page.data:
-                    record_dict = record.model_dump(mode="json", by_alias=True)
-                    # Normalize list entry fields for query-friendly access
-                    record_dict = _normalize_list_entry_fields(record_dict)
-                    ctx.records.append(record_dict)
-                    items_fetched += 1
-
-                    if self._should_stop(ctx):
-                        # Capture API cursor for potential next resumption
-                        ctx.last_api_cursor = page.next_cursor
-                        return
+                before = len(ctx.records)
+                reached = ctx.add_page(page.data, stop_at, normalize=True)
+                items_fetched += len(ctx.records) - before
+                if reached:
+                    # Capture API cursor for potential next resumption
+                    ctx.last_api_cursor = page.next_cursor
+                    return
 
                 # Progress update after each page
                 self.progress.on_step_progress(step, items_fetched, None)
@@ -1248,18 +1945,35 @@ class QueryExecutor:
             pages_kwargs: dict[str, Any] = {}
             if field_ids is not None:
                 pages_kwargs["field_ids"] = field_ids
-
-            async for page in nested_service.pages(**pages_kwargs):
-                for record in page.data:
-                    record_dict = record.model_dump(mode="json", by_alias=True)
-                    # Normalize list entry fields for query-friendly access
-                    record_dict = _normalize_list_entry_fields(record_dict)
-                    ctx.records.append(record_dict)
-                    items_fetched += 1
-                    if self._should_stop(ctx):
-                        # Capture API cursor for potential streaming resumption
-                        ctx.last_api_cursor = page.next_cursor
-                        return
+            # Push a small limit down as the page size so the first page isn't
+            # a full one. Not when records are filtered or counted while fetching:
+            # those read past stop_at, and small pages would only add requests.
+            if (
+                stop_at is not None
+                and stop_at < _API_PAGE_SIZE
+                and ctx.fetch_filter is None
+                and not ctx.count_only
+            ):
+                pages_kwargs["limit"] = stop_at
+
+            # As in the global path: read ahead only when every page is needed
+            pages = nested_service.pages(**pages_kwargs)
+            if stop_at is None:
+                pages = prefetch(pages)
+            async for page in pages:
+                if ctx.count_only:
+                    ctx.record_count += len(page.data)
+                    items_fetched += len(page.data)
+                    self.progress.on_step_progress(step, items_fetched, None)
+                    continue
+                before = len(ctx.records)
+                reached = ctx.add_page(page.data, stop_at, normalize=True)
+                items_fetched += len(ctx.records) - before
+                if reached:
+                    # Capture API cursor for potential streaming resumption
+                    ctx.last_api_cursor = page.next_cursor
+                    await aclose(pages)
+                    return
                 # Report progress after each page
                 self.progress.on_step_progress(step, items_fetched, None)
 
@@ -1269,16 +1983,18 @@ class QueryExecutor:
             if field_ids is not None:
                 pages_kwargs["field_ids"] = field_ids
 
-            async for page in nested_service.all().pages(**pages_kwargs):
-                for record in page.data:
-                    record_dict = record.model_dump(mode="json", by_alias=True)
-                    # Normalize list entry fields for query-friendly access
-                    record_dict = _normalize_list_entry_fields(record_dict)
-                    ctx.records.append(record_dict)
-                    if self._should_stop(ctx):
-                        # Capture API cursor for potential streaming resumption
-                        ctx.last_api_cursor = page.next_cursor
-                        return
+            pages = nested_service.all().pages(**pages_kwargs)
+            if stop_at is None:
+                pages = prefetch(pages)
+            async for page in pages:
+                if ctx.count_only:
+                    ctx.record_count += len(page.data)
+                    continue
+                if ctx.add_page(page.data, stop_at, normalize=True):
+                    # Capture API cursor for potential streaming resumption
+                    ctx.last_api_cursor = page.next_cursor
+                    await aclose(pages)
+                    return
         else:
             # Fall back to async iteration for services without pages()
             all_kwargs: dict[str, Any] = {}
@@ -1286,21 +2002,37 @@ class QueryExecutor:
                 all_kwargs["field_ids"] = field_ids
 
             async for record in nested_service.all(**all_kwargs):
-                record_dict = record.model_dump(mode="json", by_alias=True)
+                if ctx.count_only:
+                    ctx.record_count += 1
+                    continue
+                record_dict = _record_to_dict(record)
                 # Normalize list entry fields for query-friendly access
                 record_dict = _normalize_list_entry_fields(record_dict)
+                if ctx.fetch_filter is not None and not ctx.fetch_filter(record_dict):
+                    continue
+                if ctx.projection is not None:
+                    record_dict = ctx.projection(record_dict)
                 ctx.records.append(record_dict)
                 items_fetched += 1
 
                 if items_fetched % 100 == 0:
                     self.progress.on_step_progress(step, items_fetched, None)
 
-                if self._should_stop(ctx):
+                if stop_at is not None and len(ctx.records) >= stop_at:
                     return
 
     def _should_stop(self, ctx: ExecutionContext) -> bool:
         """Check if we should stop fetching.
 
+        See _fetch_stop_at for when limits apply during fetch. Fetch loops
+        compute the threshold once and compare against it per record.
+        """
+        stop_at = self._fetch_stop_at(ctx)
+        return stop_at is not None and len(ctx.records) >= stop_at
+
+    def _fetch_stop_at(self, ctx: ExecutionContext) -> int | None:
+        """Get the record count at which fetching should stop.
+
         The limit and max_records are only applied during fetch when there's
         NO operation that needs all records first (filter, aggregate, sort).
 
@@ -1314,181 +2046,180 @@ class QueryExecutor:
         Note: When needs_full_fetch is True, we rely on the underlying
         entity's total count and per-list limits rather than max_records.
         After filter/aggregate/sort, the final results are truncated.
+
+        Returns:
+            The smaller of max_records and the query limit, or None if the
+            fetch must not stop early.
         """
-        # Only apply limits during fetch if no operation needs all records first
-        if ctx.needs_full_fetch:
-            return False
-        # Stop at max_records safety limit
-        if len(ctx.records) >= ctx.max_records:
-            return True
-        # Stop at query limit
-        return bool(ctx.query.limit and len(ctx.records) >= ctx.query.limit)
+        # Only apply limits during fetch if no operation needs all records first,
+        # or if the filter is already applied while fetching
+        if ctx.needs_full_fetch and ctx.fetch_filter is None:
+            return None
+        # Stop at max_records safety limit, or earlier at the query limit
+        if ctx.query.limit:
+            return min(ctx.max_records, ctx.query.limit)
+        return ctx.max_records
 
     def _extract_parent_ids(self, where: Any, field_name: str | None) -> list[int]:
         """Extract ALL parent ID values from where clause.
 
-        Handles all condition types:
-        - Direct eq: {"path": "listId", "op": "eq", "value": 12345}
-        - Direct eq (string): {"path": "listId", "op": "eq", "value": "12345"}
-        - Direct in: {"path": "listId", "op": "in", "value": [123, 456, 789]}
-        - AND: {"and": [{"path": "listId", "op": "eq", "value": 123}, ...]}
-        - OR: {"or": [{"path": "listId", "op": "eq", "value": 123},
-                      {"path": "listId", "op": "eq", "value": 456}]}
-
-        Accepts both integer and string IDs (strings are converted to int).
-        Returns deduplicated list of all parent IDs found.
+        See _extract_parent_ids_impl, which holds the logic so it can be
+        exercised without constructing an executor.
         """
-        if where is None or field_name is None:
-            return []
-
-        if hasattr(where, "model_dump"):
-            where = where.model_dump(mode="json", by_alias=True)
-
-        if not isinstance(where, dict):
-            return []
-
-        def to_int(value: Any) -> int | None:
-            """Convert value to int, supporting both int and numeric strings."""
-            if isinstance(value, int):
-                return value
-            if isinstance(value, str):
-                try:
-                    return int(value)
-                except ValueError:
-                    return None
-            return None
-
-        ids: list[int] = []
-
-        # Direct condition with "eq" operator
-        if where.get("path") == field_name and where.get("op") == "eq":
-            value = where.get("value")
-            int_val = to_int(value)
-            if int_val is not None:
-                ids.append(int_val)
-
-        # Direct condition with "in" operator (list of IDs)
-        if where.get("path") == field_name and where.get("op") == "in":
-            value = where.get("value")
-            if isinstance(value, list):
-                for v in value:
-                    int_val = to_int(v)
-                    if int_val is not None:
-                        ids.append(int_val)
-
-        # Compound "and" conditions - traverse recursively
-        if where.get("and"):
-            for condition in where["and"]:
-                ids.extend(self._extract_parent_ids(condition, field_name))
-
-        # Compound "or" conditions - traverse recursively
-        if where.get("or"):
-            for condition in where["or"]:
-                ids.extend(self._extract_parent_ids(condition, field_name))
-
-        # NOTE: "not" clauses are intentionally NOT traversed.
-        # Negated parent filters are rejected by the parser.
+        return _extract_parent_ids_impl(where, field_name)
 
-        # Deduplicate while preserving order
-        seen: set[int] = set()
-        unique_ids: list[int] = []
-        for id_ in ids:
-            if id_ not in seen:
-                seen.add(id_)
-                unique_ids.append(id_)
-
-        return unique_ids
-
-    def _collect_field_refs_from_query(self, query: Query) -> set[str]:
+    def _collect_field_refs_from_query(self, query: Query) -> frozenset[str]:
         """Collect all fields.* references from the query.
 
         Scans select, groupBy, aggregate, and where clauses for fields.* paths
         and returns the set of field names (without the "fields." prefix).
 
         Supports the "fields.*" wildcard which indicates all fields are needed.
+        The result is cached for the query object, since it is consulted once
+        per parent list when fetching list entries.
 
         Returns:
             Set of field names referenced, or {"*"} if all fields are needed.
         """
+        cached = self._field_refs_cache
+        if cached is not None and cached[0] is query:
+            return cached[1]
+
+        result = self._scan_field_refs(query)
+        self._field_refs_cache = (query, result)
+        return result
+
+    def _scan_field_refs(self, query: Query) -> frozenset[str]:
+        """Uncached implementation of _collect_field_refs_from_query."""
+        # Cheap check for the common "select fields.*" case before any scanning
+        if query.group_by == _FIELDS_WILDCARD or (
+            query.select and _FIELDS_WILDCARD in query.select
+        ):
+            return _ALL_FIELDS
+
+        # Select-only queries (the common case) need just one pass over select
+        if not (query.where or query.aggregate or query.group_by):
+            return frozenset(
+                path[len(_FIELDS_PREFIX) :]
+                for path in query.select or ()
+                if path.startswith(_FIELDS_PREFIX) and path != _FIELDS_PREFIX
+            )
+
         field_names: set[str] = set()
 
-        # Check for fields.* wildcard in select
-        if query.select:
-            for path in query.select:
-                if path == "fields.*":
-                    return {"*"}  # Wildcard means all fields
-                if path.startswith("fields."):
-                    field_names.add(path[7:])  # Remove "fields." prefix
-
-        # Collect from groupBy
-        if query.group_by:
-            if query.group_by == "fields.*":
-                return {"*"}
-            if query.group_by.startswith("fields."):
-                field_names.add(query.group_by[7:])
-
-        # Collect from aggregates
-        if query.aggregate:
-            for agg in query.aggregate.values():
-                for attr in ["sum", "avg", "min", "max", "first", "last"]:
-                    field = getattr(agg, attr, None)
-                    if field and isinstance(field, str):
-                        if field == "fields.*":
-                            return {"*"}
-                        if field.startswith("fields."):
-                            field_names.add(field[7:])
-                # Handle percentile which has nested structure
-                if agg.percentile and isinstance(agg.percentile, dict):
-                    pct_field = agg.percentile.get("field", "")
-                    if pct_field == "fields.*":
-                        return {"*"}
-                    if pct_field.startswith("fields."):
-                        field_names.add(pct_field[7:])
-
-        # Collect from where clause (recursive)
+        for path in _iter_query_field_paths(query):
+            if not path.startswith(_FIELDS_PREFIX) or path == _FIELDS_PREFIX:
+                continue  # Not a fields.<name> path
+            name = path[len(_FIELDS_PREFIX) :]
+            if name == "*":
+                return _ALL_FIELDS  # Wildcard means all fields
+            field_names.add(name)
+
+        # Collect from where clause
         if query.where:
-            where_dict = (
-                query.where.model_dump(mode="json", by_alias=True)
-                if hasattr(query.where, "model_dump")
-                else query.where
-            )
-            self._collect_field_refs_from_where(where_dict, field_names)
+            self._collect_field_refs_from_where(query.where, field_names)
             if "*" in field_names:
-                return {"*"}
+                return _ALL_FIELDS
 
-        return field_names
+        return frozenset(field_names)
 
     def _collect_field_refs_from_where(
-        self, where: dict[str, Any] | Any, field_names: set[str]
+        self, where: WhereClause | dict[str, Any] | Any, field_names: set[str]
     ) -> None:
-        """Recursively collect fields.* references from a where clause.
+        """Collect fields.* references from a where clause.
+
+        Walks nested and/or/not clauses with an explicit stack rather than
+        recursion, which saves a Python frame per node. WhereClause models are
+        walked directly (only their explicitly set fields are visited), so the
+        clause is never dumped to a dict.
 
         Args:
-            where: The where clause dict or sub-clause
+            where: The where clause (model or dict) or sub-clause
             field_names: Set to add field names to (modified in place)
         """
-        if not isinstance(where, dict):
-            return
+        stack = [where]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, WhereClause):
+                path: Any = node.path
+                children = [
+                    (key, getattr(node, key))
+                    for key in node.__pydantic_fields_set__ & _WHERE_CHILDREN.keys()
+                ]
+            elif isinstance(node, dict):
+                path = node.get("path", "")
+                children = [(key, node[key]) for key in node.keys() & _WHERE_CHILDREN.keys()]
+            else:
+                continue
 
-        # Check if this is a direct condition with fields.* path
-        path = where.get("path", "")
-        if isinstance(path, str):
-            if path == "fields.*":
-                field_names.add("*")
-                return
-            if path.startswith("fields."):
-                field_names.add(path[7:])
+            # Check if this is a direct condition with fields.* path
+            if isinstance(path, str):
+                if path == _FIELDS_WILDCARD:
+                    field_names.add("*")
+                    return  # Wildcard covers every other reference
+                if path.startswith(_FIELDS_PREFIX):
+                    field_names.add(path[len(_FIELDS_PREFIX) :])
+
+            # Queue compound and not clauses
+            for key, value in children:
+                _WHERE_CHILDREN[key](stack, value)
 
-        # Recurse into compound conditions
-        for key in ["and", "or", "and_", "or_"]:
-            if key in where and isinstance(where[key], list):
-                for sub_clause in where[key]:
-                    self._collect_field_refs_from_where(sub_clause, field_names)
+    async def _list_field_index(self, list_id: int) -> dict[str, Any] | None:
+        """Get cached field metadata for a list, fetching it on first use.
 
-        # Recurse into not clause
-        for key in ["not", "not_"]:
-            if key in where:
-                self._collect_field_refs_from_where(where[key], field_names)
+        Concurrent callers for the same list share one in-flight get_fields
+        request (single-flight), so N parallel lookups cost one API call.
+        Failures are not cached: every waiter of the failed request gets
+        None and a later call retries.
+
+        Returns:
+            {"by_name": casefolded name -> field ID, "all_ids": [field IDs]},
+            or None if the field metadata could not be fetched
+        """
+        cache_key = f"list_{list_id}"
+        cached = self._field_name_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        task = self._field_index_inflight.get(list_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_list_field_index(list_id))
+            self._field_index_inflight[list_id] = task
+            task.add_done_callback(lambda _t: self._field_index_inflight.pop(list_id, None))
+        # Shield so one cancelled waiter doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_list_field_index(self, list_id: int) -> dict[str, Any] | None:
+        """Fetch field metadata for a list and store it in the cache.
+
+        Checks the session cache (if enabled) before calling the API.
+        """
+        from affinity.models.entities import FieldMetadata
+        from affinity.types import ListId
+
+        cache = self.session_cache
+        # V2 field metadata lacks dropdown options, so keep it apart from V1 entries
+        cache_key = f"list_fields_v2_{list_id}"
+        fields = cache.get_list(cache_key, FieldMetadata) if cache and cache.enabled else None
+
+        if fields is None:
+            try:
+                fields = await self.client.lists.get_fields(ListId(list_id))
+            except Exception:
+                return None
+            if cache and cache.enabled:
+                cache.set(cache_key, fields)
+
+        # Build a mapping of casefolded name -> field ID
+        field_map: dict[str, str] = {}
+        all_field_ids: list[str] = []
+        for list_field in fields:
+            if list_field.name:
+                field_map[list_field.name.casefold()] = str(list_field.id)
+            all_field_ids.append(str(list_field.id))
+        index = {"by_name": field_map, "all_ids": all_field_ids}
+        self._field_name_cache[f"list_{list_id}"] = index
+        return index
 
     async def _resolve_field_ids_for_list_entries(
         self,
@@ -1509,8 +2240,6 @@ class QueryExecutor:
             List of field IDs to request, or None if no custom fields needed.
             If wildcard (fields.*) is used, returns all field IDs for the list.
         """
-        from affinity.types import ListId
-
         # Collect all field references from the query
         field_names = self._collect_field_refs_from_query(ctx.query)
 
@@ -1519,31 +2248,10 @@ class QueryExecutor:
             # This avoids expensive API calls for lists with many fields
             return None
 
-        # Ensure field name cache is populated for this list
-        if not hasattr(self, "_field_name_cache"):
-            self._field_name_cache: dict[str, dict[str, Any]] = {}
-
-        # Check if we need to fetch field metadata
-        cache_key = f"list_{list_id}"
-        if cache_key not in self._field_name_cache:
-            try:
-                fields = await self.client.lists.get_fields(ListId(list_id))
-                # Build a mapping of lowercase name -> field ID
-                field_map: dict[str, str] = {}
-                all_field_ids: list[str] = []
-                for field in fields:
-                    if field.name:
-                        field_map[field.name.lower()] = str(field.id)
-                    all_field_ids.append(str(field.id))
-                self._field_name_cache[cache_key] = {
-                    "by_name": field_map,
-                    "all_ids": all_field_ids,
-                }
-            except Exception:
-                # If we can't fetch fields, continue without custom field values
-                return None
-
-        cache = self._field_name_cache[cache_key]
+        cache = await self._list_field_index(list_id)
+        if cache is None:
+            # If we can't fetch fields, continue without custom field values
+            return None
 
         # Handle wildcard: return all field IDs
         if "*" in field_names:
@@ -1554,7 +2262,7 @@ class QueryExecutor:
         field_ids: list[str] = []
         missing_fields: list[str] = []
         for name in field_names:
-            field_id = cache["by_name"].get(name.lower())
+            field_id = cache["by_name"].get(name.casefold())
             if field_id is not None:
                 field_ids.append(field_id)
             else:
@@ -1591,9 +2299,12 @@ class QueryExecutor:
         Also handles:
             {"path": "listName", "op": "in", "value": ["Deals", "Leads"]}
 
+        An exact name match wins. Otherwise names match case-insensitively, as
+        in the SDK's lists.resolve_all().
+
         Cache behavior: The list name cache is populated once per QueryExecutor
-        instance. Since QueryExecutor is created fresh for each execute() call,
-        the cache is effectively per-query.
+        instance and kept for the executor's lifetime, so every query run on
+        the same executor reuses it.
         """
         if not isinstance(where, dict):
             return where
@@ -1603,102 +2314,54 @@ class QueryExecutor:
             names = where.get("value")
             op = where.get("op")
 
-            # Fetch all lists once and cache
-            if not hasattr(self, "_list_name_cache"):
-                self._list_name_cache: dict[str, int] = {}
+            # Fetch all lists once and cache exact name -> ID, plus casefolded
+            # name -> ID where names that differ only in case map to None
+            if self._list_name_cache is None:
+                list_names: dict[str, int] = {}
+                casefolded: dict[str, int | None] = {}
                 async for list_obj in self.client.lists.all():
-                    self._list_name_cache[list_obj.name] = list_obj.id
+                    list_names[list_obj.name] = list_obj.id
+                    key = list_obj.name.casefold()
+                    cached_id = casefolded.get(key, list_obj.id)
+                    casefolded[key] = cached_id if cached_id == list_obj.id else None
+                self._list_name_cache = list_names
+                self._list_casefold_cache = casefolded
 
             if op == "eq" and isinstance(names, str):
-                list_id = self._list_name_cache.get(names)
-                if list_id is None:
-                    raise QueryExecutionError(f"List not found: '{names}'")
-                return {"path": "listId", "op": "eq", "value": list_id}
+                return {"path": "listId", "op": "eq", "value": self._lookup_list_id(names)}
 
             if op == "in" and isinstance(names, list):
-                list_ids = []
-                for name in names:
-                    list_id = self._list_name_cache.get(name)
-                    if list_id is None:
-                        raise QueryExecutionError(f"List not found: '{name}'")
-                    list_ids.append(list_id)
+                list_ids = [self._lookup_list_id(name) for name in names]
                 return {"path": "listId", "op": "in", "value": list_ids}
 
-        # Recursively process compound conditions
-        result = dict(where)
-        if where.get("and"):
-            result["and"] = [await self._resolve_list_names_to_ids(c) for c in where["and"]]
-        if where.get("or"):
-            result["or"] = [await self._resolve_list_names_to_ids(c) for c in where["or"]]
+        # Recursively process compound conditions, copying only what changed so
+        # a clause without listName comes back as the same object
+        result = where
+        for key in ("and", "or"):
+            clauses = where.get(key)
+            if clauses:
+                resolved = [await self._resolve_list_names_to_ids(c) for c in clauses]
+                if any(new is not old for new, old in zip(resolved, clauses, strict=True)):
+                    if result is where:
+                        result = dict(where)
+                    result[key] = resolved
 
         return result
 
-    async def _resolve_field_names_to_ids(
-        self, where: dict[str, Any], list_ids: list[int]
-    ) -> dict[str, Any]:
-        """Resolve field name references to field IDs in fields.* paths.
-
-        Transforms:
-            {"path": "fields.Status", "op": "eq", "value": "Active"}
-        Into:
-            {"path": "fields.12345", "op": "eq", "value": "Active"}
-
-        Field names are resolved case-insensitively against the field definitions
-        for the specified list(s).
-
-        Args:
-            where: The where clause to transform
-            list_ids: List IDs to fetch field metadata from
-
-        Returns:
-            Transformed where clause with field names resolved to IDs
-        """
-        if not isinstance(where, dict) or not list_ids:
-            return where
-
-        # Build flat field name -> ID cache for all lists
-        if not hasattr(self, "_field_name_to_id_cache"):
-            self._field_name_to_id_cache: dict[str, str] = {}
-
-            from affinity.types import ListId
-
-            for list_id in list_ids:
-                try:
-                    fields = await self.client.lists.get_fields(ListId(list_id))
-                    for field in fields:
-                        if field.name:
-                            # Map lowercase name to field ID
-                            self._field_name_to_id_cache[field.name.lower()] = str(field.id)
-                except Exception:
-                    # If we can't fetch fields, continue without resolution
-                    pass
-
-        # Check if this is a fields.* condition
-        path = where.get("path", "")
-        if isinstance(path, str) and path.startswith("fields."):
-            field_ref = path[7:]  # Everything after "fields."
-
-            # Skip if already a field ID (numeric or "field-" prefix)
-            if not field_ref.isdigit() and not field_ref.startswith("field-"):
-                # Try to resolve by name (case-insensitive)
-                field_id = self._field_name_to_id_cache.get(field_ref.lower())
-                if field_id is not None:
-                    result = dict(where)
-                    result["path"] = f"fields.{field_id}"
-                    return result
-
-        # Recursively process compound conditions
-        result = dict(where)
-        if where.get("and"):
-            result["and"] = [
-                await self._resolve_field_names_to_ids(c, list_ids) for c in where["and"]
-            ]
-        if where.get("or"):
-            result["or"] = [
-                await self._resolve_field_names_to_ids(c, list_ids) for c in where["or"]
-            ]
-
-        return result
+    def _lookup_list_id(self, name: str) -> int:
+        """Look up a list ID by exact name, falling back to a case-insensitive match."""
+        exact_id = (self._list_name_cache or {}).get(name)
+        if exact_id is not None:
+            return exact_id
+        key = name.casefold()
+        if key not in self._list_casefold_cache:
+            raise QueryExecutionError(f"List not found: '{name}'")
+        list_id = self._list_casefold_cache[key]
+        if list_id is None:
+            raise QueryExecutionError(
+                f"Ambiguous list name: '{name}' (several lists differ only in case)"
+            )
+        return list_id
 
     async def _execute_filter_with_preinclude(
         self,
@@ -1722,6 +2385,9 @@ class QueryExecutor:
         """
         from .filters import partition_where
 
+        if ctx.fetch_filter is not None:
+            return  # Already applied to each record during fetch
+
         # Get where clause (prefer resolved, fall back to original)
         where: WhereClause | None
         if ctx.resolved_where is not None:
@@ -1996,6 +2662,23 @@ class QueryExecutor:
             )
 
     # PERF: rate_limiter_boundary - expand_direct_entities
+    def _person_name_loader(self, semaphore: asyncio.Semaphore) -> IdBatcher[int, str]:
+        """Create a batcher that resolves person IDs to display names.
+
+        Each batch is a single V2 lookup (persons.iter(ids=...)) instead of
+        one persons.get() per team member.
+        """
+        from affinity.types import PersonId
+
+        async def fetch_names(ids: list[int]) -> dict[int, str]:
+            names: dict[int, str] = {}
+            async with semaphore:
+                async for person in self.client.persons.iter(ids=[PersonId(i) for i in ids]):
+                    names[int(person.id)] = person.full_name or f"Person {person.id}"
+            return names
+
+        return IdBatcher(fetch_names)
+
     async def _expand_direct_entities(
         self,
         step: PlanStep,
@@ -2012,10 +2695,12 @@ class QueryExecutor:
         from affinity.models.entities import Company, Person
         from affinity.types import CompanyId, PersonId
 
-        # Shared cache for person name resolution across all records
-        person_name_cache: dict[int, str] = {}
+        # Team rosters repeat across records and steps, so names are cached per executor
+        person_name_cache = self._person_name_cache
         # SHARED semaphore for person resolution - bounded across ALL concurrent tasks
-        person_semaphore = asyncio.Semaphore(10)
+        person_semaphore = asyncio.Semaphore(PERSON_RESOLUTION_CONCURRENCY)
+        # Coalesces team member lookups from concurrent records into batch calls
+        person_loader = self._person_name_loader(person_semaphore)
 
         record_count = len(ctx.records)
         completed = 0
@@ -2064,6 +2749,9 @@ class QueryExecutor:
             # PERF: Person resolution OUTSIDE rate limiter, with SHARED semaphore
             if expansion_def.name == "interactionDates" and record.get("interactionDates"):
                 try:
+                    await _warm_person_name_cache(
+                        record["interactionDates"], person_name_cache, person_loader
+                    )
                     await resolve_interaction_names_async(
                         self.client,
                         record["interactionDates"],
@@ -2099,10 +2787,12 @@ class QueryExecutor:
         from affinity.models.entities import Company, Person
         from affinity.types import CompanyId, PersonId
 
-        # Shared cache for person name resolution across all records
-        person_name_cache: dict[int, str] = {}
+        # Team rosters repeat across records and steps, so names are cached per executor
+        person_name_cache = self._person_name_cache
         # SHARED semaphore for person resolution - bounded across ALL concurrent tasks
-        person_semaphore = asyncio.Semaphore(10)
+        person_semaphore = asyncio.Semaphore(PERSON_RESOLUTION_CONCURRENCY)
+        # Coalesces team member lookups from concurrent records into batch calls
+        person_loader = self._person_name_loader(person_semaphore)
 
         record_count = len(ctx.records)
         completed = 0
@@ -2194,6 +2884,9 @@ class QueryExecutor:
             # PERF: Person resolution OUTSIDE rate limiter, with SHARED semaphore
             if expansion_def.name == "interactionDates" and record.get("interactionDates"):
                 try:
+                    await _warm_person_name_cache(
+                        record["interactionDates"], person_name_cache, person_loader
+                    )
                     await resolve_interaction_names_async(
                         self.client,
                         record["interactionDates"],
@@ -2781,6 +3474,11 @@ class QueryExecutor:
         if ctx.query.aggregate is None:
             return
 
+        if ctx.count_only:
+            # Fetch counted records without keeping them; every aggregate is count(*)
+            ctx.records = [dict.fromkeys(ctx.query.aggregate, ctx.record_count)]
+            return
+
         if ctx.query.group_by is not None:
             # Group and aggregate
             results = group_and_aggregate(
@@ -2805,47 +3503,54 @@ class QueryExecutor:
         if order_by is None:
             return
 
-        # Build sort key function
-        def sort_key(record: dict[str, Any]) -> tuple[Any, ...]:
-            keys: list[Any] = []
-            for order in order_by:
-                value = resolve_field_path(record, order.field) if order.field else None
+        # Compile each key's getter once instead of parsing the path per record
+        keys_spec = [
+            (compile_field_path(order.field or ""), order.direction == "asc") for order in order_by
+        ]
 
-                # Handle None values (sort to end)
-                if value is None:
-                    if order.direction == "asc":
-                        keys.append((1, None))
-                    else:
-                        keys.append((0, None))
-                elif order.direction == "asc":
-                    keys.append((0, value))
-                else:
-                    # Negate for desc, but handle non-numeric
-                    try:
-                        keys.append((0, -value))
-                    except TypeError:
-                        keys.append((0, value))
+        # Build sort key function. A single order key (the common case) is used
+        # as the sort key directly, skipping the per-record wrapping tuple.
+        sort_key: Callable[[dict[str, Any]], Any]
+        if len(keys_spec) == 1:
+            [(get_value, ascending)] = keys_spec
+
+            def sort_key(record: dict[str, Any]) -> Any:
+                return _order_key_part(get_value(record), ascending)
+
+        else:
 
-            return tuple(keys)
+            def sort_key(record: dict[str, Any]) -> Any:
+                return tuple(
+                    [_order_key_part(get_value(record), asc) for get_value, asc in keys_spec]
+                )
 
-        # Sort with stable algorithm
+        # Sort with stable algorithm. For a small limit (top-K) keep only the
+        # first `limit` records: nsmallest is O(N log K) and equivalent to
+        # sorted(records, key=sort_key)[:limit], ties included.
+        limit = ctx.query.limit
         try:
-            ctx.records.sort(key=sort_key)
+            if limit is not None and limit < len(ctx.records) // 4:
+                ctx.records = heapq.nsmallest(limit, ctx.records, key=sort_key)
+            else:
+                ctx.records.sort(key=sort_key)
         except TypeError:
             # Mixed types - fall back to string comparison
-            for order in reversed(order_by):
-                reverse = order.direction == "desc"
-                field = order.field or ""
+            for get_value, ascending in reversed(keys_spec):
 
-                def make_key(f: str) -> Callable[[dict[str, Any]], str]:
-                    return lambda r: str(resolve_field_path(r, f) or "")
+                def make_key(
+                    get: Callable[[dict[str, Any]], Any],
+                ) -> Callable[[dict[str, Any]], str]:
+                    return lambda r: str(get(r) or "")
 
-                ctx.records.sort(key=make_key(field), reverse=reverse)
+                ctx.records.sort(key=make_key(get_value), reverse=not ascending)
 
     def _execute_limit(self, _step: PlanStep, ctx: ExecutionContext) -> None:
-        """Execute limit step."""
+        """Execute limit step.
+
+        Truncates ctx.records in place instead of copying the kept prefix.
+        """
         if ctx.query.limit is not None:
-            ctx.records = ctx.records[: ctx.query.limit]
+            del ctx.records[ctx.query.limit :]
 
     async def _execute_streaming(
         self,
@@ -2869,7 +3574,9 @@ class QueryExecutor:
 
         schema = SCHEMA_REGISTRY.get(query.from_)
         if schema is None:
-            raise QueryExecutionError(f"Unknown entity: {query.from_}")
+            raise QueryExecutionError(
+                f"Unknown entity: {query.from_}. Queryable entities: {_QUERYABLE_ENTITIES}"
+            )
 
         # Only GLOBAL fetch strategy supports streaming (persons, companies, opportunities)
         if schema.fetch_strategy != FetchStrategy.GLOBAL:
@@ -2895,6 +3602,11 @@ class QueryExecutor:
             # No relationship data needed - use simple filter
             expensive_fn = compile_filter(expensive_filter_clause)
 
+        # Project matches as they accumulate unless a later include/expand step
+        # still needs the full records
+        if ctx.projection is None and query.select and not query.include and not query.expand:
+            ctx.projection = _Projection.from_select(query.select)
+
         # Get service for streaming pages
         service = getattr(self.client, schema.service_attr)
         accumulated: list[dict[str, Any]] = []
@@ -2918,7 +3630,7 @@ class QueryExecutor:
                 while current_cursor:
                     page = await service.list(cursor=current_cursor)
                     pages_processed += 1
-                    page_records = [r.model_dump(mode="json", by_alias=True) for r in page.data]
+                    page_records = [_record_to_dict(r) for r in page.data]
 
                     # Phase 1: Apply cheap filter (no API calls)
                     if cheap_fn is not None:
@@ -2948,6 +3660,8 @@ class QueryExecutor:
                             page_records = [r for r in page_records if expensive_fn(r)]
 
                     # Accumulate matches
+                    if ctx.projection is not None:
+                        page_records = [ctx.projection(r) for r in page_records]
                     accumulated.extend(page_records)
                     self.progress.on_step_progress(fetch_step, len(accumulated), None)
 
@@ -2974,9 +3688,10 @@ class QueryExecutor:
                 return
 
             # Standard path: iterate from beginning
-            async for page in service.all().pages():
+            pages = service.all(**_id_lookup_kwargs(query.where, schema)).pages()
+            async for page in pages:
                 pages_processed += 1
-                page_records = [r.model_dump(mode="json", by_alias=True) for r in page.data]
+                page_records = [_record_to_dict(r) for r in page.data]
 
                 # Phase 1: Apply cheap filter (no API calls)
                 if cheap_fn is not None:
@@ -3012,6 +3727,8 @@ class QueryExecutor:
                         page_records = [r for r in page_records if expensive_fn(r)]
 
                 # Accumulate matches
+                if ctx.projection is not None:
+                    page_records = [ctx.projection(r) for r in page_records]
                 accumulated.extend(page_records)
 
                 # Report progress
@@ -3028,6 +3745,7 @@ class QueryExecutor:
                         limit,
                         pages_processed,
                     )
+                    await aclose(pages)
                     self.progress.on_step_complete(fetch_step, len(ctx.records))
                     return
 
@@ -3036,6 +3754,7 @@ class QueryExecutor:
                     ctx.records = accumulated[: ctx.max_records]
                     # Capture API cursor for O(1) streaming resumption
                     ctx.last_api_cursor = page.next_cursor
+                    await aclose(pages)
                     self.progress.on_step_complete(fetch_step, len(ctx.records))
                     return
 
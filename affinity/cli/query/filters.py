@@ -13,9 +13,10 @@ import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
+from operator import methodcaller
 from typing import TYPE_CHECKING, Any
 
-from ...compare import compare_values
+from ...compare import get_comparator
 from .dates import parse_date_value
 from .exceptions import QueryValidationError
 from .models import ExistsClause, QuantifierClause, WhereClause
@@ -246,19 +247,15 @@ OperatorFunc = Callable[[Any, Any], bool]
 
 
 def _make_operator(op_name: str) -> OperatorFunc:
-    """Create an operator function that delegates to compare_values().
+    """Look up the shared comparison function for an operator.
 
-    This is a factory function that creates operator functions for the OPERATORS
-    registry. Each function wraps compare_values() with the appropriate operator name.
+    Binds the function from the compare module directly so compiled filters
+    skip compare_values()' operator dispatch on every record.
     """
+    return get_comparator(op_name)
 
-    def op_func(field_value: Any, target: Any) -> bool:
-        return compare_values(field_value, target, op_name)
 
-    return op_func
-
-
-# Operator registry - all operators delegate to compare_values() from the shared module
+# Operator registry - all operators use the shared comparison functions from compare.py
 # This ensures consistent comparison behavior between SDK filter and Query tool
 OPERATORS: dict[str, OperatorFunc] = {
     "eq": _make_operator("eq"),
@@ -305,8 +302,32 @@ def resolve_field_path(record: dict[str, Any], path: str) -> Any:
     """
     if not path:
         return None
+    return _resolve_parts(record, _parse_field_path(path))
+
+
+def compile_field_path(path: str) -> Callable[[dict[str, Any]], Any]:
+    """Compile a field path into a getter.
+
+    Equivalent to ``lambda record: resolve_field_path(record, path)``, but
+    the path is parsed once instead of on every call.
 
+    Args:
+        path: The field path
+
+    Returns:
+        Function returning the resolved value for a record, or None if not found
+    """
+    if not path:
+        return lambda _record: None
     parts = _parse_field_path(path)
+    if len(parts) == 1 and isinstance(parts[0], str):
+        # Flat key: dict.get via a C-level callable, no Python frame per record
+        return methodcaller("get", parts[0])
+    return lambda record: _resolve_parts(record, parts)
+
+
+def _resolve_parts(record: dict[str, Any], parts: list[str | int]) -> Any:
+    """Walk parsed path parts into a record."""
     current: Any = record
 
     for part in parts:
@@ -388,21 +409,28 @@ def compile_filter(where: WhereClause) -> Callable[[dict[str, Any]], bool]:
     Returns:
         A function that takes a record and returns True if it matches
     """
+    filter_func = _compile_filter(where)
+    path = _equality_path(where)
+    if path is None:
+        return filter_func
+    return _memoize_by_value(filter_func, path)
+
+
+def _compile_filter(where: WhereClause) -> Callable[[dict[str, Any]], bool]:
+    """Compile a WHERE clause without the top-level equality memo."""
     # Single condition
     if where.op is not None:
         return _compile_condition(where)
 
     # Compound conditions
     if where.and_ is not None:
-        filters = [compile_filter(clause) for clause in where.and_]
-        return lambda record: all(f(record) for f in filters)
+        return _all_of([_compile_filter(clause) for clause in _flatten_clauses(where.and_, "and_")])
 
     if where.or_ is not None:
-        filters = [compile_filter(clause) for clause in where.or_]
-        return lambda record: any(f(record) for f in filters)
+        return _any_of([_compile_filter(clause) for clause in _flatten_clauses(where.or_, "or_")])
 
     if where.not_ is not None:
-        inner = compile_filter(where.not_)
+        inner = _compile_filter(where.not_)
         return lambda record: not inner(record)
 
     # Quantifiers require relationship data - use compile_filter_with_context() instead
@@ -429,6 +457,141 @@ def compile_filter(where: WhereClause) -> Callable[[dict[str, Any]], bool]:
     return lambda _: True
 
 
+# WhereClause attributes that make a clause something other than a plain and/or
+_CLAUSE_KINDS = ("path", "expr", "op", "and_", "or_", "not_", "all_", "none_", "exists_")
+
+
+def _flatten_clauses(clauses: list[WhereClause], key: str) -> list[WhereClause]:
+    """Inline nested clauses of the same kind: and inside and, or inside or.
+
+    and[a, and[b, c]] becomes and[a, b, c], so the compiled filter makes one
+    all()/any() pass per record instead of one per nesting level. Only
+    clauses that hold nothing but ``key`` are inlined.
+    """
+    flat: list[WhereClause] = []
+    stack = clauses[::-1]
+    while stack:
+        clause = stack.pop()
+        nested = getattr(clause, key)
+        if nested is not None and all(
+            getattr(clause, kind) is None for kind in _CLAUSE_KINDS if kind != key
+        ):
+            stack.extend(reversed(nested))
+        else:
+            flat.append(clause)
+    return flat
+
+
+def _all_of(filters: list[Callable[[dict[str, Any]], bool]]) -> Callable[[dict[str, Any]], bool]:
+    """Fuse AND-ed filters into one function.
+
+    Short lists are chained directly with ``and``; longer ones use a plain
+    loop. Both avoid building an all() generator per record.
+    """
+    if not filters:
+        return lambda _: True
+    if len(filters) == 1:
+        return filters[0]
+    if len(filters) == 2:
+        first, second = filters
+        return lambda record: first(record) and second(record)
+
+    def match_all(record: dict[str, Any]) -> bool:
+        # Plain loop: all() over a generator costs an extra frame per record
+        for f in filters:  # noqa: SIM110
+            if not f(record):
+                return False
+        return True
+
+    return match_all
+
+
+def _any_of(filters: list[Callable[[dict[str, Any]], bool]]) -> Callable[[dict[str, Any]], bool]:
+    """Fuse OR-ed filters into one function (see _all_of)."""
+    if not filters:
+        return lambda _: False
+    if len(filters) == 1:
+        return filters[0]
+    if len(filters) == 2:
+        first, second = filters
+        return lambda record: first(record) or second(record)
+
+    def match_any(record: dict[str, Any]) -> bool:
+        for f in filters:  # noqa: SIM110
+            if f(record):
+                return True
+        return False
+
+    return match_any
+
+
+def _equality_path(where: WhereClause) -> str | None:
+    """Get the path compared by a WHERE made only of eq/in conditions on one path.
+
+    Handles a single eq/in condition or an AND/OR of them, e.g.
+    ``listId = 1 OR listId = 2 OR listId in [3, 4]``.
+
+    Returns:
+        The shared path, or None if the clause has any other shape
+    """
+    if where.op is not None:
+        if where.op in ("eq", "in") and where.path and where.expr is None:
+            return where.path
+        return None
+    clauses = where.and_ if where.and_ is not None else where.or_
+    if not clauses:
+        return None
+    paths = {_equality_path(clause) for clause in clauses}
+    if len(paths) != 1:
+        return None
+    return paths.pop()
+
+
+# Distinct values the equality memo holds before it gives up. Paths worth
+# memoizing (listId, entityType, status) repeat a handful of values; a path
+# that keeps producing new ones (email, name, id) would only pay for misses.
+_MEMO_MAX_VALUES = 1024
+
+
+def _memoize_by_value(
+    filter_func: Callable[[dict[str, Any]], bool], path: str
+) -> Callable[[dict[str, Any]], bool]:
+    """Cache a filter's verdict per distinct value at path.
+
+    Only valid when the filter's result depends on nothing but that value.
+    Records then cost one dict lookup each instead of re-running every
+    condition. Unhashable values (e.g. multi-select lists) are not cached.
+
+    The memo is bounded: once it has seen _MEMO_MAX_VALUES distinct values,
+    misses dominate, so it is dropped and records go straight to filter_func.
+    """
+    get_value = compile_field_path(path)
+    verdicts: dict[tuple[type, Any], bool] | None = {}
+
+    def memoized(record: dict[str, Any]) -> bool:
+        nonlocal verdicts
+        if verdicts is None:
+            return filter_func(record)
+        value = get_value(record)
+        # Key on type too: 1 and True hash alike but can compare differently
+        key = (type(value), value)
+        try:
+            return verdicts[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return filter_func(record)
+        verdict = filter_func(record)
+        if len(verdicts) < _MEMO_MAX_VALUES:
+            verdicts[key] = verdict
+        else:
+            # Values barely repeat on this path; stop paying for the memo
+            verdicts = None
+        return verdict
+
+    return memoized
+
+
 def _compile_condition(where: WhereClause) -> Callable[[dict[str, Any]], bool]:
     """Compile a single filter condition."""
     if where.op is None:
@@ -455,15 +618,47 @@ def _compile_condition(where: WhereClause) -> Callable[[dict[str, Any]], bool]:
             "Use compile_filter_with_context() with pre-fetched data."
         )
 
+    if path is None:
+        return lambda _: True
+
+    # Parse the path once here rather than on every record
+    get_value = compile_field_path(path)
+
+    if where.op == "in" and isinstance(value, list):
+        op_func = _compile_in(op_func, value)
+
     def filter_func(record: dict[str, Any]) -> bool:
-        if path is None:
-            return True
-        field_value = resolve_field_path(record, path)
-        return op_func(field_value, value)
+        return op_func(get_value(record), value)
 
     return filter_func
 
 
+def _compile_in(op_func: OperatorFunc, values: list[Any]) -> OperatorFunc:
+    """Specialize the 'in' operator for a fixed value list.
+
+    Membership is tested against a frozenset built once, so each record costs
+    a hash lookup instead of a scan of the list. Hashing agrees with == for
+    the JSON scalars a WHERE value can hold, so results match the list scan;
+    unhashable field values fall back to it.
+    """
+    try:
+        members = frozenset(values)
+    except TypeError:
+        return op_func
+
+    def in_members(field_value: Any, target: Any) -> bool:
+        if field_value is None:
+            return False
+        try:
+            if isinstance(field_value, list):
+                return any(item in members for item in field_value)
+            return field_value in members
+        except TypeError:
+            return op_func(field_value, target)
+
+    return in_members
+
+
 def matches(record: dict[str, Any], where: WhereClause | None) -> bool:
     """Check if a record matches a WHERE clause.
 
@@ -485,7 +680,7 @@ def matches(record: dict[str, Any], where: WhereClause | None) -> bool:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterContext:
     """Context available during record filtering with relationship data.
 
@@ -633,12 +828,14 @@ def compile_filter_with_context(
 
     # Handle compound clauses (recurse)
     if where.and_ is not None:
-        filters = [compile_filter_with_context(c, ctx) for c in where.and_]
-        return lambda record: all(f(record) for f in filters)
+        return _all_of(
+            [compile_filter_with_context(c, ctx) for c in _flatten_clauses(where.and_, "and_")]
+        )
 
     if where.or_ is not None:
-        filters = [compile_filter_with_context(c, ctx) for c in where.or_]
-        return lambda record: any(f(record) for f in filters)
+        return _any_of(
+            [compile_filter_with_context(c, ctx) for c in _flatten_clauses(where.or_, "or_")]
+        )
 
     if where.not_ is not None:
         inner = compile_filter_with_context(where.not_, ctx)
@@ -366,7 +366,7 @@ class Query(BaseModel):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanStep:
     """A single step in the execution plan."""
 
@@ -401,7 +401,7 @@ class PlanStep:
     expansion: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionPlan:
     """Complete execution plan for a query."""
 
@@ -30,6 +30,11 @@ from ..formatters import (
 )
 from .models import ExecutionPlan, QueryResult
 
+try:  # Optional: faster JSON encoding for large result sets
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -200,8 +205,29 @@ def format_json(
     if result.pagination:
         output["pagination"] = result.pagination
 
+    return _dumps_json(output, pretty=pretty)
+
+
+def _dumps_json(obj: Any, *, pretty: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when it is installed.
+
+    Without orjson (the ``orjson`` extra), output is exactly
+    ``json.dumps(obj, indent=..., default=str)``. orjson formats differently:
+    compact separators, raw UTF-8, ISO 8601 datetimes, NaN/Infinity as null,
+    and non-string keys such as dates allowed. Values orjson rejects (e.g.
+    integers wider than 64 bits) fall back to the standard library.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded: bytes = orjson.dumps(obj, default=str, option=option)
+            return encoded.decode()
+        except orjson.JSONEncodeError:
+            pass
     indent = 2 if pretty else None
-    return json.dumps(output, indent=indent, default=str)
+    return json.dumps(obj, indent=indent, default=str)
 
 
 # =============================================================================
@@ -696,7 +722,7 @@ def format_dry_run_json(plan: ExecutionPlan) -> str:
         "requiresFullScan": plan.requires_full_scan,
     }
 
-    return json.dumps(output, indent=2, default=str)
+    return _dumps_json(output, pretty=True)
 
 
 # =============================================================================
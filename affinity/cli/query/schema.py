@@ -90,6 +90,7 @@ class EntitySchema:
         parent_filter_field: Field name in where clause (e.g., "listId")
         parent_id_type: Type name to cast to (e.g., "ListId")
         parent_method_name: Method to call on parent service (e.g., "entries")
+        supports_id_lookup: True if service.all() accepts ids= (batch lookup by ID)
     """
 
     name: str
@@ -105,6 +106,7 @@ class EntitySchema:
     parent_id_type: str | None = None
     parent_method_name: str | None = None
     supported_expansions: frozenset[str] = field(default_factory=frozenset)
+    supports_id_lookup: bool = False
 
     def __post_init__(self) -> None:
         """Validate schema configuration at definition time."""
@@ -196,6 +198,7 @@ SCHEMA_REGISTRY: dict[str, EntitySchema] = {
         },
         fetch_strategy=FetchStrategy.GLOBAL,
         supported_expansions=frozenset(["interactionDates"]),
+        supports_id_lookup=True,
     ),
     "companies": EntitySchema(
         name="companies",
@@ -253,6 +256,7 @@ SCHEMA_REGISTRY: dict[str, EntitySchema] = {
         },
         fetch_strategy=FetchStrategy.GLOBAL,
         supported_expansions=frozenset(["interactionDates"]),
+        supports_id_lookup=True,
     ),
     "opportunities": EntitySchema(
         name="opportunities",
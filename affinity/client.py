@@ -185,6 +185,7 @@ class Affinity:
         on_event: AnyEventHook | None = None,
         hook_error_policy: Literal["swallow", "raise"] = "swallow",
         policies: Policies | None = None,
+        limits: httpx.Limits | None = None,
     ):
         """
         Initialize the Affinity client.
@@ -214,6 +215,8 @@ class Affinity:
             on_event: Event hook called for request/response lifecycle events (DX-008)
             hook_error_policy: What to do if hooks raise ("swallow" or "raise")
             policies: Client policies (e.g., disable writes)
+            limits: Connection pool limits for the underlying `httpx` client (default:
+                20 connections, 10 kept alive for 30s)
         """
         config = ClientConfig(
             api_key=api_key,
@@ -237,6 +240,8 @@ class Affinity:
             hook_error_policy=hook_error_policy,
             policies=policies or Policies(),
         )
+        if limits is not None:
+            config.limits = limits
         self._http = HTTPClient(config)
 
         # Resource management tracking
@@ -502,6 +507,7 @@ class AsyncAffinity:
         on_event: AnyEventHook | None = None,
         hook_error_policy: Literal["swallow", "raise"] = "swallow",
         policies: Policies | None = None,
+        limits: httpx.Limits | None = None,
     ):
         """
         Initialize the async Affinity client.
@@ -530,6 +536,8 @@ class AsyncAffinity:
             on_error: Hook called when a request raises (DX-008)
             on_event: Event hook called for request/response lifecycle events (DX-008)
             hook_error_policy: What to do if hooks raise ("swallow" or "raise")
+            limits: Connection pool limits for the underlying `httpx` client (default:
+                20 connections, 10 kept alive for 30s)
         """
         config = ClientConfig(
             api_key=api_key,
@@ -553,6 +561,8 @@ class AsyncAffinity:
             hook_error_policy=hook_error_policy,
             policies=policies or Policies(),
         )
+        if limits is not None:
+            config.limits = limits
         self._http = AsyncHTTPClient(config)
 
         # Resource management tracking
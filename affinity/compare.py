@@ -9,6 +9,7 @@ This module is the single source of truth for comparison operations.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 
@@ -82,50 +83,27 @@ def compare_values(
     Raises:
         ValueError: If the operator is not recognized
     """
-    # Dispatch to specific comparison function
-    if operator == "eq":
-        return _eq(field_value, target)
-    elif operator == "neq":
-        return _neq(field_value, target)
-    elif operator == "contains":
-        return _contains(field_value, target)
-    elif operator == "starts_with":
-        return _starts_with(field_value, target)
-    elif operator == "ends_with":
-        return _ends_with(field_value, target)
-    elif operator == "gt":
-        return _gt(field_value, target)
-    elif operator == "gte":
-        return _gte(field_value, target)
-    elif operator == "lt":
-        return _lt(field_value, target)
-    elif operator == "lte":
-        return _lte(field_value, target)
-    elif operator == "in":
-        return _in(field_value, target)
-    elif operator == "between":
-        return _between(field_value, target)
-    elif operator == "has_any":
-        return _has_any(field_value, target)
-    elif operator == "has_all":
-        return _has_all(field_value, target)
-    elif operator == "contains_any":
-        return _contains_any(field_value, target)
-    elif operator == "contains_all":
-        return _contains_all(field_value, target)
-    elif operator == "is_null":
-        return _is_null(field_value, target)
-    elif operator == "is_not_null":
-        return _is_not_null(field_value, target)
-    elif operator == "is_empty":
-        return _is_empty(field_value, target)
-    else:
+    return get_comparator(operator)(field_value, target)
+
+
+def get_comparator(operator: str) -> Callable[[Any, Any], bool]:
+    """Return the comparison function for an operator name.
+
+    Lets callers that apply the same operator to many values (e.g. compiled
+    query filters) resolve it once instead of on every comparison.
+
+    Raises:
+        ValueError: If the operator is not recognized
+    """
+    comparator = _COMPARATORS.get(operator)
+    if comparator is None:
         raise ValueError(
             f"Unknown comparison operator: '{operator}'. "
             f"Valid operators: eq, neq, contains, starts_with, ends_with, "
             f"gt, gte, lt, lte, in, between, has_any, has_all, "
             f"contains_any, contains_all, is_null, is_not_null, is_empty"
         )
+    return comparator
 
 
 # =============================================================================
@@ -444,6 +422,29 @@ def _is_empty(a: Any, _b: Any) -> bool:
     return isinstance(a, list) and len(a) == 0
 
 
+# Canonical operator name -> comparison function
+_COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": _eq,
+    "neq": _neq,
+    "contains": _contains,
+    "starts_with": _starts_with,
+    "ends_with": _ends_with,
+    "gt": _gt,
+    "gte": _gte,
+    "lt": _lt,
+    "lte": _lte,
+    "in": _in,
+    "between": _between,
+    "has_any": _has_any,
+    "has_all": _has_all,
+    "contains_any": _contains_any,
+    "contains_all": _contains_all,
+    "is_null": _is_null,
+    "is_not_null": _is_not_null,
+    "is_empty": _is_empty,
+}
+
+
 # =============================================================================
 # Operator Name Mapping
 # =============================================================================
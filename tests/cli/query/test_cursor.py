@@ -341,6 +341,44 @@ class TestCacheManagement:
         delete_cache(cache_file)
         assert not Path(cache_file).exists()
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param(
+                [{"id": 1, "name": "Zoë", "tags": ["a"], "path": Path("a/b")}], id="non-json-value"
+            ),
+            pytest.param([{"id": 2**70}], id="wide-int-fallback"),
+        ],
+    )
+    def test_write_cache_round_trips(self, data: list[dict]) -> None:
+        """Cached bytes decode back to the data, with non-JSON values stringified."""
+        cache_file, cache_hash = write_cache(data, "d" * 24)
+        cursor = CursorPayload(
+            v=1,
+            qh="d" * 24,
+            skip=0,
+            ts=int(time.time() * 1000),
+            mode="full-fetch",
+            cache_file=cache_file,
+            cache_hash=cache_hash,
+        )
+
+        try:
+            assert read_cache(cursor) == json.loads(json.dumps(data, default=str))
+        finally:
+            delete_cache(cache_file)
+
+    def test_cache_bytes_without_orjson_match_json_dumps(self) -> None:
+        """Without orjson, the cache keeps the plain compact json.dumps encoding."""
+        from affinity.cli.query import cursor
+
+        data = [{"name": "Zoë", "path": Path("a/b")}]
+
+        with patch.object(cursor, "orjson", None):
+            encoded = cursor._encode_cache_data(data)
+
+        assert encoded == json.dumps(data, separators=(",", ":"), default=str).encode()
+
     def test_read_cache_expired(self) -> None:
         """Expired cache returns None."""
         data = [{"id": 1}]
@@ -0,0 +1,80 @@
+"""Tests for query JSON serialization.
+
+Covers the optional orjson fast path in _dumps_json and its standard-library
+fallback, which must keep the baseline json.dumps output when orjson is absent.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from affinity.cli.query import output
+from affinity.cli.query.models import Query, QueryResult
+from affinity.cli.query.output import format_dry_run_json, format_json
+from affinity.cli.query.planner import QueryPlanner
+
+DATA = [{"id": 1, "name": "Zoë", "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)}]
+
+
+class TestStdlibFallback:
+    """Output without orjson installed."""
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_matches_baseline_json_dumps(self, pretty: bool) -> None:
+        """Without orjson, output is the plain json.dumps call."""
+        with patch.object(output, "orjson", None):
+            dumped = output._dumps_json(DATA, pretty=pretty)
+
+        assert dumped == json.dumps(DATA, indent=2 if pretty else None, default=str)
+
+    def test_format_json_escapes_non_ascii(self) -> None:
+        """Without orjson, non-ASCII text stays \\u-escaped."""
+        result = QueryResult(data=[{"name": "Zoë"}], explicit_select=None, explicit_expand=None)
+
+        with patch.object(output, "orjson", None):
+            assert format_json(result) == '{"data": [{"name": "Zo\\u00eb"}]}'
+
+    def test_dry_run_matches_baseline_json_dumps(self) -> None:
+        """Without orjson, --dry-run JSON keeps the 2-space json.dumps layout."""
+        query = Query(**{"from": "persons", "where": {"path": "name", "op": "eq", "value": "Zoë"}})
+        plan = QueryPlanner().plan(query)
+
+        with patch.object(output, "orjson", None):
+            dumped = format_dry_run_json(plan)
+
+        assert dumped == json.dumps(json.loads(dumped), indent=2)
+        assert "Zo\\u00eb" in dumped
+
+
+class TestOrjsonFastPath:
+    """Output with orjson installed."""
+
+    def test_parses_to_the_same_document(self) -> None:
+        """orjson output decodes to the same data as the fallback, bar datetime format."""
+        pytest.importorskip("orjson")
+
+        with patch.object(output, "orjson", None):
+            fallback = json.loads(output._dumps_json(DATA))
+
+        parsed = json.loads(output._dumps_json(DATA))
+
+        assert parsed == [{**fallback[0], "at": "2024-01-02T03:04:05+00:00"}]
+        assert json.loads(output._dumps_json(DATA, pretty=True)) == parsed
+
+    def test_round_trips_values_orjson_cannot_encode(self) -> None:
+        """Oversized ints fall back to the standard library."""
+        pytest.importorskip("orjson")
+        result = QueryResult(
+            data=[{"id": 2**70, "counts": {1: "a"}, "name": "Zoë"}],
+            explicit_select=None,
+            explicit_expand=None,
+        )
+
+        parsed = json.loads(format_json(result))
+
+        assert parsed["data"] == [{"id": 2**70, "counts": {"1": "a"}, "name": "Zoë"}]
+        assert json.loads(format_json(result, pretty=True)) == parsed
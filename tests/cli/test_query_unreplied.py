@@ -214,6 +214,7 @@ class TestUnrepliedExpansionExecution:
             executor.rate_limiter.__aenter__ = AsyncMock()
             executor.rate_limiter.__aexit__ = AsyncMock()
             executor.progress = MagicMock()  # Mock progress reporter
+            executor._person_name_cache = {}
 
             await executor._expand_list_entries(step, ctx, expansion_def)
 
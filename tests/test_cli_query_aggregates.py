@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from affinity.cli.query import apply_having, compute_aggregates, group_and_aggregate
+from affinity.cli.query.aggregates import _numeric_column, _present_column
+from affinity.cli.query.filters import compile_field_path
 from affinity.cli.query.models import AggregateFunc, HavingClause
 
 
@@ -170,6 +174,35 @@ class TestComputeAggregates:
         assert result["max"] == 300
         assert result["count"] == 4
 
+    def test_numeric_column_extracted_once_per_field(self, records: list[dict]) -> None:
+        """sum/avg/percentile over one field share a single column extraction."""
+        aggs = {
+            "sum": AggregateFunc(sum="amount"),
+            "avg": AggregateFunc(avg="amount"),
+            "p50": AggregateFunc(percentile={"field": "amount", "p": 50}),
+        }
+        with patch(
+            "affinity.cli.query.aggregates._numeric_column", wraps=_numeric_column
+        ) as extract:
+            result = compute_aggregates(records, aggs)
+
+        assert result == {"sum": 750, "avg": 187.5, "p50": 175.0}
+        extract.assert_called_once()
+        assert extract.call_args.args[0] is records
+
+    def test_min_max_share_column_extraction(self, records: list[dict]) -> None:
+        """min and max over one field share a single non-null column extraction."""
+        records = [*records, {"name": "Eve", "amount": None}]
+        aggs = {"lo": AggregateFunc(min="amount"), "hi": AggregateFunc(max="amount")}
+        with patch(
+            "affinity.cli.query.aggregates._present_column", wraps=_present_column
+        ) as extract:
+            result = compute_aggregates(records, aggs)
+
+        assert result == {"lo": 100, "hi": 300}
+        extract.assert_called_once()
+        assert extract.call_args.args[0] is records
+
 
 class TestGroupAndAggregate:
     """Tests for group_and_aggregate function."""
@@ -223,6 +256,25 @@ class TestGroupAndAggregate:
         assert null_group["category"] == "(no value)"
         assert null_group["count"] == 1
 
+    def test_field_paths_compiled_once_across_groups(self, records: list[dict]) -> None:
+        """Aggregate field paths are compiled once, not once per group."""
+        aggs = {
+            "total": AggregateFunc(sum="amount"),
+            "top": AggregateFunc(max="amount"),
+            "first": AggregateFunc(first="amount"),
+        }
+        with patch(
+            "affinity.cli.query.aggregates.compile_field_path", wraps=compile_field_path
+        ) as compile_path:
+            results = group_and_aggregate(records, "category", aggs)
+
+        assert results == [
+            {"category": "A", "total": 300, "top": 150, "first": 100},
+            {"category": "B", "total": 500, "top": 300, "first": 200},
+        ]
+        # The group key, "amount" for sum/max, and "amount" for first
+        assert compile_path.call_count == 3
+
 
 class TestApplyHaving:
     """Tests for apply_having function."""
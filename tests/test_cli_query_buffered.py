@@ -0,0 +1,90 @@
+"""Tests for read-ahead buffering of async iterators."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from affinity.cli.query._buffered import prefetch
+
+
+async def _numbers(count: int, log: list[str] | None = None) -> AsyncIterator[int]:
+    for i in range(count):
+        if log is not None:
+            log.append(f"produce {i}")
+        await asyncio.sleep(0)
+        yield i
+
+
+class TestPrefetch:
+    """Tests for prefetch()."""
+
+    @pytest.mark.asyncio
+    async def test_yields_all_items_in_order(self) -> None:
+        """All items are yielded in source order."""
+        assert [i async for i in prefetch(_numbers(5))] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_empty_source(self) -> None:
+        """Empty source yields nothing."""
+        assert [i async for i in prefetch(_numbers(0))] == []
+
+    @pytest.mark.asyncio
+    async def test_reads_ahead_while_consumer_works(self) -> None:
+        """Next item is produced before the consumer finishes the current one."""
+        log: list[str] = []
+        async for i in prefetch(_numbers(3, log)):
+            log.append(f"consume {i}")
+            await asyncio.sleep(0.01)
+            log.append(f"done {i}")
+        assert log.index("produce 1") < log.index("done 0")
+        assert log.index("produce 2") < log.index("done 1")
+
+    @pytest.mark.asyncio
+    async def test_source_exception_is_reraised(self) -> None:
+        """Errors from the source surface in the consumer after earlier items."""
+
+        async def failing() -> AsyncIterator[int]:
+            yield 1
+            raise RuntimeError("boom")
+
+        seen: list[int] = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for i in prefetch(failing()):
+                seen.append(i)
+        assert seen == [1]
+
+    @pytest.mark.asyncio
+    async def test_keyboard_interrupt_is_reraised(self) -> None:
+        """KeyboardInterrupt from the source is forwarded, not raised in the loop."""
+
+        async def interrupted() -> AsyncIterator[int]:
+            yield 1
+            raise KeyboardInterrupt()
+
+        with pytest.raises(KeyboardInterrupt):
+            async for _ in prefetch(interrupted()):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_producer(self) -> None:
+        """Breaking out of the loop stops the background producer."""
+        log: list[str] = []
+        gen = prefetch(_numbers(100, log))
+        async for i in gen:
+            if i == 2:
+                break
+        await gen.aclose()
+        produced = len(log)
+        await asyncio.sleep(0.01)
+        assert len(log) == produced
+        assert produced < 100
+
+    @pytest.mark.asyncio
+    async def test_invalid_buffer_size(self) -> None:
+        """Buffer size must be positive."""
+        with pytest.raises(ValueError, match="at least 1"):
+            async for _ in prefetch(_numbers(1), n=0):
+                pass
@@ -54,16 +54,12 @@ def extract_json_from_output(output: str) -> dict:
     start = output.find("{")
     if start == -1:
         raise ValueError(f"No JSON object found in output: {output}")
-    # Find matching close brace by counting
-    depth = 0
-    for i, char in enumerate(output[start:], start):
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                return json.loads(output[start : i + 1])
-    raise ValueError(f"Unbalanced JSON in output: {output}")
+    # raw_decode stops at the end of the object and handles braces inside strings
+    try:
+        obj, _end = json.JSONDecoder().raw_decode(output, start)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unbalanced JSON in output: {output}") from e
+    return obj
 
 
 # =============================================================================
@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import os
+import signal
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from functools import cache
+from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -16,11 +27,13 @@ from affinity.cli.query.executor import (
     ExecutionContext,
     NullProgressCallback,
     QueryExecutor,
-    QueryProgressCallback,
+    _extract_parent_ids_impl,
     _normalize_list_entry_fields,
+    _parse_int_string,
     can_use_streaming,
     execute_query,
 )
+from affinity.cli.query.filters import matches
 from affinity.cli.query.models import (
     AggregateFunc,
     ExecutionPlan,
@@ -29,6 +42,17 @@ from affinity.cli.query.models import (
     Query,
     WhereClause,
 )
+from affinity.cli.session_cache import SessionCache, SessionCacheConfig
+from affinity.models.entities import FieldMetadata
+from affinity.models.pagination import PaginationProgress
+
+# Immutable queries shared across tests (never mutated, so safe to reuse).
+_Q_PERSONS = Query(from_="persons")
+_Q_PERSONS_LIMIT1 = Query(from_="persons", limit=1)
+_Q_PERSONS_LIMIT5 = Query(from_="persons", limit=5)
+_Q_PERSONS_LIMIT10 = Query(from_="persons", limit=10)
+_Q_PERSONS_WITH_COMPANIES = Query(from_="persons", include=["companies"])
+_Q_ENTRIES_BY_STATUS = Query(from_="listEntries", group_by="fields.Status")
 
 # =============================================================================
 # Fixtures
@@ -43,37 +67,136 @@ def mock_client() -> AsyncMock:
     return client
 
 
-def create_mock_record(data: dict) -> MagicMock:
-    """Create a mock record with proper model_dump."""
-    record = MagicMock()
-    record.model_dump = MagicMock(return_value=data)
-    return record
+def _async_return(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Return a plain coroutine function resolving to value (no mock bookkeeping)."""
 
+    async def _inner(*_args: Any, **_kwargs: Any) -> Any:
+        return value
 
-def create_mock_page_iterator(records: list[dict]):
+    return _inner
+
+
+@dataclass(slots=True)
+class _FakeField:
+    """Field metadata stand-in; the executor reads only id and name."""
+
+    id: str
+    name: str
+
+
+@dataclass(slots=True)
+class _FakeList:
+    """List stand-in; name resolution reads only id and name."""
+
+    id: int
+    name: str
+
+
+class _MockRecord:
+    """Record stand-in whose model_dump returns the wrapped dict."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def model_dump(self, *_args: Any, **_kwargs: Any) -> dict:
+        return self._data
+
+
+def create_mock_record(data: dict) -> _MockRecord:
+    """Create a lightweight stand-in record whose model_dump returns data.
+
+    The executor dumps each record once at fetch time; later steps see dicts.
+    """
+    return _MockRecord(data)
+
+
+class _MockPageIterator:
+    """Page iterator stand-in serving its records as one page, with progress."""
+
+    def __init__(self, records: list[dict]) -> None:
+        # Built once and served on every pages() call
+        self._page = SimpleNamespace(
+            data=[create_mock_record(r) for r in records], next_cursor=None
+        )
+
+    def pages(self, on_progress: Any = None) -> AsyncIterator[SimpleNamespace]:
+        return self._pages(on_progress)
+
+    async def _pages(self, on_progress: Any) -> AsyncIterator[SimpleNamespace]:
+        page = self._page
+        if on_progress:
+            on_progress(
+                PaginationProgress(
+                    page_number=1,
+                    items_in_page=len(page.data),
+                    items_so_far=len(page.data),
+                    has_next=False,
+                )
+            )
+        yield page
+
+
+def create_mock_page_iterator(records: list[dict]) -> _MockPageIterator:
     """Create a mock page iterator for testing."""
+    return _MockPageIterator(records)
 
-    class MockPageIterator:
-        def pages(self, on_progress=None):
-            async def generator():
-                page = MagicMock()
-                page.data = [create_mock_record(r) for r in records]
-                if on_progress:
-                    from affinity.models.pagination import PaginationProgress
-
-                    on_progress(
-                        PaginationProgress(
-                            page_number=1,
-                            items_in_page=len(records),
-                            items_so_far=len(records),
-                            has_next=False,
-                        )
-                    )
-                yield page
 
-            return generator()
+class _AsyncList:
+    """Async iterable over a prebuilt list; each iteration starts from the top."""
+
+    def __init__(self, items: list[Any]) -> None:
+        self._items = items
+
+    def __aiter__(self) -> _AsyncListIterator:
+        return _AsyncListIterator(self._items)
+
+
+class _AsyncListIterator:
+    def __init__(self, items: list[Any]) -> None:
+        self._it = iter(items)
+
+    def __aiter__(self) -> _AsyncListIterator:
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
 
-    return MockPageIterator()
+
+class _Pages:
+    """Page iterator stand-in whose pages() serves prebuilt pages of records."""
+
+    def __init__(self, pages: list[list[Any]]) -> None:
+        self._pages = _AsyncList([SimpleNamespace(data=data, next_cursor=None) for data in pages])
+
+    def pages(self, on_progress: Any = None) -> _AsyncList:  # noqa: ARG002
+        return self._pages
+
+
+class _CountingProgress:
+    """Progress callback that counts calls per hook."""
+
+    def __init__(self) -> None:
+        self.starts = 0
+        self.progress_updates = 0
+        self.completes = 0
+        self.errors = 0
+
+    def on_step_start(self, _step: PlanStep) -> None:
+        self.starts += 1
+
+    def on_step_progress(self, _step: PlanStep, _current: int, _total: int | None) -> None:
+        self.progress_updates += 1
+
+    def on_step_complete(self, _step: PlanStep, _records: int) -> None:
+        self.completes += 1
+
+    def on_step_error(self, _step: PlanStep, _error: Exception) -> None:
+        self.errors += 1
 
 
 @pytest.fixture
@@ -92,7 +215,7 @@ def mock_service() -> MagicMock:
 @pytest.fixture
 def simple_query() -> Query:
     """Create a simple query for testing."""
-    return Query(from_="persons", limit=10)
+    return _Q_PERSONS_LIMIT10
 
 
 @pytest.fixture
@@ -125,6 +248,94 @@ def simple_plan(simple_query: Query) -> ExecutionPlan:
     )
 
 
+# QueryExecutor lookup caches, reset between tests sharing an executor
+_EXECUTOR_LOOKUP_CACHES = (
+    "_list_name_cache",
+    "_list_casefold_cache",
+    "_field_name_cache",
+)
+
+
+def _reset_lookup_caches(executor: QueryExecutor) -> None:
+    """Restore an executor's lookup caches to their freshly constructed state."""
+    fresh = vars(QueryExecutor(executor.client))
+    vars(executor).update({attr: fresh[attr] for attr in _EXECUTOR_LOOKUP_CACHES})
+
+
+@cache
+def _base_plan(entity: str, operations: tuple[str, ...]) -> ExecutionPlan:
+    """Build (once per recipe) a plan running operations in sequence over entity."""
+    steps = [
+        PlanStep(
+            step_id=i,
+            operation=operation,  # type: ignore[arg-type]
+            entity=entity if operation in ("fetch", "fetch_streaming") else None,
+            description=operation.replace("_", " ").capitalize(),
+            depends_on=[i - 1] if i else [],
+        )
+        for i, operation in enumerate(operations)
+    ]
+    return ExecutionPlan(
+        query=Query(from_=entity),
+        steps=steps,
+        total_api_calls=1,
+        estimated_records_fetched=None,
+        estimated_memory_mb=None,
+        warnings=[],
+        recommendations=[],
+        has_expensive_operations=False,
+        requires_full_scan=False,
+    )
+
+
+def _build_plan(query: Query, *operations: str) -> ExecutionPlan:
+    """Build a plan running operations in sequence, fetching query.from_.
+
+    Steps come from a cached plan shared by every test using the same recipe;
+    the executor only reads them.
+    """
+    return replace(_base_plan(query.from_, operations), query=query)
+
+
+@pytest.fixture(scope="module")
+def plan_factory() -> Callable[..., ExecutionPlan]:
+    """Build plans as plan_factory(query, "fetch", "filter", ...)."""
+    return _build_plan
+
+
+def _make_service(records: list[dict]) -> MagicMock:
+    """Create a service whose all() pages over records."""
+    service = MagicMock()
+    service.all.return_value = create_mock_page_iterator(records)
+    return service
+
+
+@pytest.fixture(scope="module")
+def make_service() -> Callable[[list[dict]], MagicMock]:
+    """Build paginated services as make_service(records)."""
+    return _make_service
+
+
+@pytest.fixture(scope="module")
+def pure_executor() -> QueryExecutor:
+    """Shared executor for tests of steps that don't touch the client or lookup caches."""
+    return QueryExecutor(MagicMock(), max_records=100)
+
+
+# Fetch + sort-by-value plans over persons, built once per direction
+_SORT_PLANS = {
+    direction: _build_plan(
+        Query(
+            from_="persons",
+            order_by=[OrderByClause.model_construct(field="value", direction=direction)],
+        ),
+        "fetch",
+        "sort",
+    )
+    for direction in ("asc", "desc")
+}
+
+
 # =============================================================================
 # can_use_streaming Tests
 # =============================================================================
@@ -135,17 +346,17 @@ class TestCanUseStreaming:
 
     def test_with_limit_returns_true(self) -> None:
         """Returns True when query has explicit limit."""
-        query = Query(from_="persons", limit=10)
+        query = _Q_PERSONS_LIMIT10
         assert can_use_streaming(query) is True
 
     def test_without_limit_returns_false(self) -> None:
         """Returns False when query has no limit and max_records_explicit=False."""
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         assert can_use_streaming(query) is False
 
     def test_with_max_records_explicit_returns_true(self) -> None:
         """Returns True when max_records_explicit=True even without query limit."""
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         assert can_use_streaming(query, max_records_explicit=True) is True
 
     def test_with_order_by_returns_false(self) -> None:
@@ -153,7 +364,7 @@ class TestCanUseStreaming:
         query = Query(
             from_="persons",
             limit=10,
-            order_by=[OrderByClause(field="name", direction="asc")],
+            order_by=[OrderByClause.model_construct(field="name", direction="asc")],
         )
         assert can_use_streaming(query) is False
 
@@ -161,7 +372,7 @@ class TestCanUseStreaming:
         """Returns False when query has orderBy even with max_records_explicit."""
         query = Query(
             from_="persons",
-            order_by=[OrderByClause(field="name", direction="asc")],
+            order_by=[OrderByClause.model_construct(field="name", direction="asc")],
         )
         assert can_use_streaming(query, max_records_explicit=True) is False
 
@@ -206,6 +417,12 @@ class TestExecutionContext:
             ctx.check_timeout(1.0)
         assert "exceeded timeout" in str(exc.value)
 
+    def test_check_timeout_ignores_wall_clock_jumps(self, simple_query: Query) -> None:
+        """Elapsed time is measured on the monotonic clock."""
+        ctx = ExecutionContext(query=simple_query)
+        with patch("time.time", return_value=ctx.start_time + 10_000):
+            ctx.check_timeout(1.0)
+
     def test_check_max_records_no_error(self, simple_query: Query) -> None:
         """No error when under limit."""
         ctx = ExecutionContext(query=simple_query, max_records=100)
@@ -221,6 +438,27 @@ class TestExecutionContext:
             ctx.check_max_records()
         assert "10 records" in str(exc.value)
 
+    def test_add_page_stops_without_dumping_past_stop_at(self, simple_query: Query) -> None:
+        """Records beyond stop_at are sliced off before conversion."""
+        ctx = ExecutionContext(query=simple_query)
+        ctx.records = [{"id": 0}]
+        page = [MagicMock(model_dump=MagicMock(return_value={"id": i})) for i in range(1, 6)]
+
+        assert ctx.add_page(page, stop_at=3) is True
+
+        assert ctx.records == [{"id": 0}, {"id": 1}, {"id": 2}]
+        assert [r.model_dump.call_count for r in page] == [1, 1, 0, 0, 0]
+
+    def test_add_page_filters_before_counting(self, simple_query: Query) -> None:
+        """With a fetch filter, stop_at counts only matching records."""
+        ctx = ExecutionContext(query=simple_query)
+        ctx.fetch_filter = lambda r: r["id"] % 2 == 0
+
+        assert ctx.add_page([{"id": i} for i in range(5)], stop_at=5) is False
+        assert ctx.add_page([{"id": i} for i in range(5, 10)], stop_at=5) is True
+
+        assert ctx.records == [{"id": 0}, {"id": 2}, {"id": 4}, {"id": 6}, {"id": 8}]
+
     def test_build_result(self, simple_query: Query) -> None:
         """Builds QueryResult correctly."""
         ctx = ExecutionContext(query=simple_query)
@@ -242,7 +480,7 @@ class TestSelectProjection:
 
     def test_no_select_returns_all_fields(self) -> None:
         """When select is None, all fields are returned."""
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         ctx = ExecutionContext(query=query)
         ctx.records = [
             {"id": 1, "firstName": "John", "lastName": "Doe", "email": "john@example.com"}
@@ -398,6 +636,56 @@ class TestSelectProjection:
             }
         ]
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_projection_applied_during_fetch(self, mock_client: AsyncMock) -> None:
+        """Fetch-only plans store projected records instead of full ones."""
+        service = MagicMock()
+        service.all.return_value = create_mock_page_iterator(
+            [
+                {"id": 1, "firstName": "John", "email": "john@example.com"},
+                {"id": 2, "firstName": "Jane", "email": "jane@example.com"},
+            ]
+        )
+        mock_client.persons = service
+
+        query = Query(from_="persons", select=["firstName"])
+        plan = ExecutionPlan(
+            query=query,
+            steps=[PlanStep(step_id=0, operation="fetch", entity="persons", description="Fetch")],
+            total_api_calls=1,
+            estimated_records_fetched=2,
+            estimated_memory_mb=0.01,
+            warnings=[],
+            recommendations=[],
+            has_expensive_operations=False,
+            requires_full_scan=False,
+        )
+
+        executor = QueryExecutor(mock_client, max_records=100)
+        result = await executor.execute(plan)
+
+        assert result.data == [{"firstName": "John"}, {"firstName": "Jane"}]
+
+    def test_fetch_projection_deferred_when_later_steps_need_records(self) -> None:
+        """Projection stays in build_result when a filter or sort follows the fetch."""
+        from affinity.cli.query.executor import _fetch_projection
+
+        query = Query(from_="persons", select=["firstName"])
+        fetch = PlanStep(step_id=0, operation="fetch", entity="persons", description="Fetch")
+        sort = PlanStep(step_id=1, operation="sort", description="Sort", depends_on=[0])
+        common: dict[str, Any] = {
+            "total_api_calls": 1,
+            "estimated_records_fetched": 1,
+            "estimated_memory_mb": 0.01,
+            "warnings": [],
+            "recommendations": [],
+            "has_expensive_operations": False,
+            "requires_full_scan": False,
+        }
+
+        assert _fetch_projection(ExecutionPlan(query=query, steps=[fetch], **common)) is not None
+        assert _fetch_projection(ExecutionPlan(query=query, steps=[fetch, sort], **common)) is None
+
 
 class TestNormalizeListEntryFields:
     """Tests for _normalize_list_entry_fields function.
@@ -793,11 +1081,11 @@ class TestNormalizeListEntryFields:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestQueryExecutor:
     """Tests for QueryExecutor."""
 
     @pytest.mark.req("QUERY-EXEC-001")
-    @pytest.mark.asyncio
     async def test_execute_simple_fetch_and_limit(
         self, mock_client: AsyncMock, mock_service: AsyncMock, simple_plan: ExecutionPlan
     ) -> None:
@@ -811,38 +1099,57 @@ class TestQueryExecutor:
         assert result.data[0]["name"] == "Alice"
         mock_client.whoami.assert_called_once()
 
+    async def test_execute_fetch_accepts_raw_dict_records(
+        self, mock_client: AsyncMock, simple_plan: ExecutionPlan
+    ) -> None:
+        """Records that are already dicts are used without model_dump()."""
+        service = MagicMock()
+        service.all.return_value = _Pages([[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]])
+        mock_client.persons = service
+
+        executor = QueryExecutor(mock_client, max_records=100)
+        result = await executor.execute(simple_plan)
+
+        assert result.data == [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+
+    async def test_records_dumped_once_across_pipeline(
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
+    ) -> None:
+        """Filter, sort and limit work on the dicts dumped once at fetch time."""
+        records = [
+            MagicMock(model_dump=MagicMock(return_value={"id": i, "value": i % 3}))
+            for i in range(6)
+        ]
+        mock_client.persons = MagicMock()
+        mock_client.persons.all.return_value = _Pages([records])
+        query = Query(
+            from_="persons",
+            where=WhereClause.model_construct(path="value", op="gt", value=0),
+            order_by=[OrderByClause.model_construct(field="id", direction="desc")],
+            limit=3,
+        )
+
+        executor = QueryExecutor(mock_client, max_records=100)
+        result = await executor.execute(plan_factory(query, "fetch", "filter", "sort", "limit"))
+
+        assert [r["id"] for r in result.data] == [5, 4, 2]
+        assert all(r.model_dump.call_count == 1 for r in records)
+
     @pytest.mark.req("QUERY-EXEC-002")
-    @pytest.mark.asyncio
     async def test_execute_client_side_filtering(
-        self, mock_client: AsyncMock, mock_service: AsyncMock
+        self,
+        mock_client: AsyncMock,
+        mock_service: AsyncMock,
+        plan_factory: Callable[..., ExecutionPlan],
     ) -> None:
         """Execute query with client-side filtering."""
         mock_client.persons = mock_service
 
         query = Query(
             from_="persons",
-            where=WhereClause(path="name", op="eq", value="Alice"),
-        )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch",
-                    estimated_api_calls=1,
-                ),
-                PlanStep(step_id=1, operation="filter", description="Filter", depends_on=[0]),
-            ],
-            total_api_calls=1,
-            estimated_records_fetched=1,
-            estimated_memory_mb=0.01,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
+            where=WhereClause.model_construct(path="name", op="eq", value="Alice"),
         )
+        plan = plan_factory(query, "fetch", "filter")
 
         executor = QueryExecutor(mock_client)
         result = await executor.execute(plan)
@@ -851,10 +1158,70 @@ class TestQueryExecutor:
         assert len(result.data) == 1
         assert result.data[0]["name"] == "Alice"
 
+    @pytest.mark.parametrize(
+        ("where", "expected_kwargs"),
+        [
+            ({"path": "id", "op": "eq", "value": 2}, {"ids": [2]}),
+            ({"path": "id", "op": "in", "value": [2, "1", 2]}, {"ids": [2, 1]}),
+            (
+                {
+                    "and": [
+                        {"path": "id", "op": "in", "value": [1, 2, 3]},
+                        {"path": "name", "op": "eq", "value": "Bob"},
+                        {"path": "id", "op": "in", "value": [3, 2]},
+                    ]
+                },
+                {"ids": [2, 3]},
+            ),
+            (
+                {
+                    "or": [
+                        {"path": "id", "op": "eq", "value": 2},
+                        {"path": "id", "op": "eq", "value": 5},
+                    ]
+                },
+                {"ids": [2, 5]},
+            ),
+            (
+                {
+                    "or": [
+                        {"path": "id", "op": "eq", "value": 2},
+                        {"path": "name", "op": "eq", "value": "Alice"},
+                    ]
+                },
+                {},
+            ),
+            ({"path": "id", "op": "gt", "value": 1}, {}),
+            ({"path": "id", "op": "eq", "value": "abc"}, {}),
+        ],
+        ids=["eq", "in", "and", "or", "or-with-other-field", "range", "non-numeric"],
+    )
+    async def test_id_filter_pushed_down_as_batch_lookup(
+        self,
+        mock_client: AsyncMock,
+        make_service: Callable[[list[dict]], MagicMock],
+        plan_factory: Callable[..., ExecutionPlan],
+        where: dict[str, Any],
+        expected_kwargs: dict[str, Any],
+    ) -> None:
+        """ID conditions every match must satisfy narrow the fetch to those IDs."""
+        records = [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+        mock_client.persons = service = make_service(records)
+        query = Query(from_="persons", where=WhereClause.model_validate(where))
+
+        executor = QueryExecutor(mock_client)
+        result = await executor.execute(plan_factory(query, "fetch", "filter"))
+
+        service.all.assert_called_once_with(**expected_kwargs)
+        # The where clause is still applied to what comes back (the stub ignores ids)
+        assert result.data == [r for r in records if matches(r, query.where)]
+
     @pytest.mark.req("QUERY-EXEC-002")
-    @pytest.mark.asyncio
     async def test_execute_fetch_streaming_operation(
-        self, mock_client: AsyncMock, mock_service: AsyncMock
+        self,
+        mock_client: AsyncMock,
+        mock_service: AsyncMock,
+        plan_factory: Callable[..., ExecutionPlan],
     ) -> None:
         """Execute plan with fetch_streaming operation (used for client-side filters).
 
@@ -866,28 +1233,9 @@ class TestQueryExecutor:
 
         query = Query(
             from_="persons",
-            where=WhereClause(path="name", op="eq", value="Alice"),
-        )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch_streaming",  # Key: test the streaming operation
-                    entity="persons",
-                    description="Fetch persons (paginated, client-side filter)",
-                    estimated_api_calls=1,
-                ),
-                PlanStep(step_id=1, operation="filter", description="Filter", depends_on=[0]),
-            ],
-            total_api_calls=1,
-            estimated_records_fetched=1,
-            estimated_memory_mb=0.01,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
+            where=WhereClause.model_construct(path="name", op="eq", value="Alice"),
         )
+        plan = plan_factory(query, "fetch_streaming", "filter")
 
         executor = QueryExecutor(mock_client)
         result = await executor.execute(plan)
@@ -897,43 +1245,29 @@ class TestQueryExecutor:
         assert result.data[0]["name"] == "Alice"
 
     @pytest.mark.req("QUERY-EXEC-004")
-    @pytest.mark.asyncio
-    async def test_execute_aggregations(self, mock_client: AsyncMock) -> None:
+    async def test_execute_aggregations(
+        self,
+        mock_client: AsyncMock,
+        plan_factory: Callable[..., ExecutionPlan],
+        make_service: Callable[[list[dict]], MagicMock],
+    ) -> None:
         """Execute query with aggregation."""
-        # Create service that returns records with amounts
-        service = MagicMock()
-        records = [
-            {"id": 1, "amount": 100},
-            {"id": 2, "amount": 200},
-            {"id": 3, "amount": 300},
-        ]
-        service.all.return_value = create_mock_page_iterator(records)
-        mock_client.opportunities = service
+        mock_client.opportunities = make_service(
+            [
+                {"id": 1, "amount": 100},
+                {"id": 2, "amount": 200},
+                {"id": 3, "amount": 300},
+            ]
+        )
 
         query = Query(
             from_="opportunities",
-            aggregate={"total": AggregateFunc(sum="amount"), "count": AggregateFunc(count=True)},
-        )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="opportunities",
-                    description="Fetch",
-                    estimated_api_calls=1,
-                ),
-                PlanStep(step_id=1, operation="aggregate", description="Aggregate", depends_on=[0]),
-            ],
-            total_api_calls=1,
-            estimated_records_fetched=3,
-            estimated_memory_mb=0.01,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
+            aggregate={
+                "total": AggregateFunc.model_construct(sum="amount"),
+                "count": AggregateFunc.model_construct(count=True),
+            },
         )
+        plan = plan_factory(query, "fetch", "aggregate")
 
         executor = QueryExecutor(mock_client)
         result = await executor.execute(plan)
@@ -943,166 +1277,108 @@ class TestQueryExecutor:
         assert result.data[0]["count"] == 3
 
     @pytest.mark.req("QUERY-EXEC-005")
-    @pytest.mark.asyncio
     async def test_reports_progress_callbacks(
-        self, mock_client: AsyncMock, mock_service: AsyncMock
+        self,
+        mock_client: AsyncMock,
+        mock_service: AsyncMock,
+        plan_factory: Callable[..., ExecutionPlan],
     ) -> None:
         """Progress callbacks are invoked."""
         mock_client.persons = mock_service
 
         # Use query with order_by to force non-streaming mode (tests step-by-step path)
         query = Query(
-            from_="persons", limit=10, order_by=[OrderByClause(field="name", direction="asc")]
-        )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch persons",
-                    estimated_api_calls=1,
-                ),
-                PlanStep(
-                    step_id=1,
-                    operation="sort",
-                    description="Sort by name",
-                    depends_on=[0],
-                ),
-                PlanStep(
-                    step_id=2,
-                    operation="limit",
-                    description="Limit to 10",
-                    depends_on=[1],
-                ),
-            ],
-            total_api_calls=1,
-            estimated_records_fetched=10,
-            estimated_memory_mb=0.01,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
+            from_="persons",
+            limit=10,
+            order_by=[OrderByClause.model_construct(field="name", direction="asc")],
         )
+        plan = plan_factory(query, "fetch", "sort", "limit")
 
-        progress = MagicMock(spec=QueryProgressCallback)
+        progress = _CountingProgress()
 
         executor = QueryExecutor(mock_client, progress=progress)
         await executor.execute(plan)
 
         # Should have called on_step_start for each step
-        assert progress.on_step_start.call_count == 3
+        assert progress.starts == 3
         # Should have called on_step_complete for each step
-        assert progress.on_step_complete.call_count == 3
+        assert progress.completes == 3
+        assert progress.errors == 0
 
     @pytest.mark.req("QUERY-EXEC-007")
-    @pytest.mark.asyncio
-    async def test_enforce_max_records_limit(self, mock_client: AsyncMock) -> None:
+    async def test_enforce_max_records_limit(
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
+    ) -> None:
         """Stops fetching when max_records reached."""
         # Create service that returns many records across multiple pages
         service = MagicMock()
+        service.all.return_value = _Pages(
+            [[{"id": i * 10 + j} for j in range(10)] for i in range(10)]
+        )
+        mock_client.persons = service
 
-        class MultiPageIterator:
-            def pages(self, on_progress=None):  # noqa: ARG002
-                async def generator():
-                    for i in range(10):
-                        page = MagicMock()
-                        page.data = [create_mock_record({"id": i * 10 + j}) for j in range(10)]
-                        yield page
+        query = _Q_PERSONS
+        plan = plan_factory(query, "fetch")
 
-                return generator()
+        executor = QueryExecutor(mock_client, max_records=25)
+        result = await executor.execute(plan)
 
-        service.all.return_value = MultiPageIterator()
+        # Should stop at max_records
+        assert len(result.data) <= 25
+
+    async def test_page_iterator_closed_when_fetch_stops_early(
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
+    ) -> None:
+        """Stopping at max_records closes the page generator before returning."""
+        served: list[int] = []
+        closed = False
+
+        async def pages(**_kwargs: Any) -> AsyncIterator[SimpleNamespace]:
+            nonlocal closed
+            try:
+                for i in range(10):
+                    served.append(i)
+                    yield SimpleNamespace(
+                        data=[create_mock_record({"id": i * 10 + j}) for j in range(10)],
+                        next_cursor=None,
+                    )
+            finally:
+                closed = True
+
+        service = MagicMock()
+        service.all.return_value = SimpleNamespace(pages=pages)
         mock_client.persons = service
 
-        query = Query(from_="persons")
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch",
-                    estimated_api_calls=10,
-                ),
-            ],
-            total_api_calls=10,
-            estimated_records_fetched=100,
-            estimated_memory_mb=0.1,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=True,
-        )
-
         executor = QueryExecutor(mock_client, max_records=25)
-        result = await executor.execute(plan)
+        result = await executor.execute(plan_factory(_Q_PERSONS, "fetch"))
 
-        # Should stop at max_records
-        assert len(result.data) <= 25
+        assert len(result.data) == 25
+        assert served == [0, 1, 2]
+        assert closed
 
     @pytest.mark.req("QUERY-EXEC-007b")
-    @pytest.mark.asyncio
     async def test_max_records_with_filter_fetches_all_then_truncates(
-        self, mock_client: AsyncMock
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
     ) -> None:
         """max_records doesn't stop fetch when filter exists, but truncates after."""
         # Create service that returns 50 records, but only last 10 match filter
         service = MagicMock()
-
-        class MultiPageIterator:
-            def pages(self, on_progress=None):  # noqa: ARG002
-                async def generator():
-                    # Page 1: records 0-24, none match (status="inactive")
-                    page1 = MagicMock()
-                    page1.data = [
-                        create_mock_record({"id": i, "status": "inactive"}) for i in range(25)
-                    ]
-                    yield page1
-                    # Page 2: records 25-49, all match (status="active")
-                    page2 = MagicMock()
-                    page2.data = [
-                        create_mock_record({"id": 25 + i, "status": "active"}) for i in range(25)
-                    ]
-                    yield page2
-
-                return generator()
-
-        service.all.return_value = MultiPageIterator()
+        service.all.return_value = _Pages(
+            [
+                # Page 1: records 0-24, none match (status="inactive")
+                [{"id": i, "status": "inactive"} for i in range(25)],
+                # Page 2: records 25-49, all match (status="active")
+                [{"id": 25 + i, "status": "active"} for i in range(25)],
+            ]
+        )
         mock_client.persons = service
 
         # Query with filter - should find records in page 2
         query = Query(
             from_="persons",
-            where=WhereClause(path="status", op="eq", value="active"),
-        )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch",
-                    estimated_api_calls=2,
-                ),
-                PlanStep(
-                    step_id=1,
-                    operation="filter",
-                    description="Filter",
-                    depends_on=[0],
-                ),
-            ],
-            total_api_calls=2,
-            estimated_records_fetched=50,
-            estimated_memory_mb=0.1,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=True,
+            where=WhereClause.model_construct(path="status", op="eq", value="active"),
         )
+        plan = plan_factory(query, "fetch", "filter")
 
         # Set max_records to 20, which is less than position of matching records (25+)
         # Without fix: would stop at 20, find 0 matches
@@ -1115,66 +1391,29 @@ class TestQueryExecutor:
         assert all(r["status"] == "active" for r in result.data)
 
     @pytest.mark.req("QUERY-EXEC-007c")
-    @pytest.mark.asyncio
-    async def test_sort_with_limit_fetches_all_records(self, mock_client: AsyncMock) -> None:
+    async def test_sort_with_limit_fetches_all_records(
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
+    ) -> None:
         """Sort+limit without filter fetches all records to get actual top N."""
         # Create service that returns 50 records, highest IDs are in page 2
         service = MagicMock()
-
-        class MultiPageIterator:
-            def pages(self, on_progress=None):  # noqa: ARG002
-                async def generator():
-                    # Page 1: records with low values (id: 1-25)
-                    page1 = MagicMock()
-                    page1.data = [create_mock_record({"id": i, "value": i}) for i in range(1, 26)]
-                    yield page1
-                    # Page 2: records with high values (id: 26-50)
-                    page2 = MagicMock()
-                    page2.data = [create_mock_record({"id": i, "value": i}) for i in range(26, 51)]
-                    yield page2
-
-                return generator()
-
-        service.all.return_value = MultiPageIterator()
+        service.all.return_value = _Pages(
+            [
+                # Page 1: records with low values (id: 1-25)
+                [{"id": i, "value": i} for i in range(1, 26)],
+                # Page 2: records with high values (id: 26-50)
+                [{"id": i, "value": i} for i in range(26, 51)],
+            ]
+        )
         mock_client.persons = service
 
         # Query: get top 5 by value descending (should be IDs 50, 49, 48, 47, 46)
         query = Query(
             from_="persons",
-            order_by=[OrderByClause(field="value", direction="desc")],
+            order_by=[OrderByClause.model_construct(field="value", direction="desc")],
             limit=5,
         )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch",
-                    estimated_api_calls=2,
-                ),
-                PlanStep(
-                    step_id=1,
-                    operation="sort",
-                    description="Sort by value desc",
-                    depends_on=[0],
-                ),
-                PlanStep(
-                    step_id=2,
-                    operation="limit",
-                    description="Take first 5",
-                    depends_on=[1],
-                ),
-            ],
-            total_api_calls=2,
-            estimated_records_fetched=50,
-            estimated_memory_mb=0.1,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
-        )
+        plan = plan_factory(query, "fetch", "sort", "limit")
 
         # Without fix: would stop at limit=5 during fetch, getting IDs 1-5
         # Then sort (no-op, already sorted by id), then limit (no-op)
@@ -1189,68 +1428,32 @@ class TestQueryExecutor:
         assert values == [50, 49, 48, 47, 46], f"Expected top 5 values, got {values}"
 
     @pytest.mark.req("QUERY-EXEC-007d")
-    @pytest.mark.asyncio
-    async def test_aggregate_with_limit_fetches_all_records(self, mock_client: AsyncMock) -> None:
+    async def test_aggregate_with_limit_fetches_all_records(
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
+    ) -> None:
         """Aggregate+limit without filter fetches all records for accurate counts."""
         # Create service that returns 50 records across 2 pages
         service = MagicMock()
-
-        class MultiPageIterator:
-            def pages(self, on_progress=None):  # noqa: ARG002
-                async def generator():
-                    # Page 1: 25 records
-                    page1 = MagicMock()
-                    page1.data = [create_mock_record({"id": i, "value": 10}) for i in range(25)]
-                    yield page1
-                    # Page 2: 25 more records
-                    page2 = MagicMock()
-                    page2.data = [
-                        create_mock_record({"id": 25 + i, "value": 10}) for i in range(25)
-                    ]
-                    yield page2
-
-                return generator()
-
-        service.all.return_value = MultiPageIterator()
+        service.all.return_value = _Pages(
+            [
+                # Page 1: 25 records
+                [{"id": i, "value": 10} for i in range(25)],
+                # Page 2: 25 more records
+                [{"id": 25 + i, "value": 10} for i in range(25)],
+            ]
+        )
         mock_client.persons = service
 
         # Query: count all records and sum values
         query = Query(
             from_="persons",
-            aggregate={"total": AggregateFunc(count=True), "sum": AggregateFunc(sum="value")},
+            aggregate={
+                "total": AggregateFunc.model_construct(count=True),
+                "sum": AggregateFunc.model_construct(sum="value"),
+            },
             limit=1,  # limit on output (one aggregate result row)
         )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch",
-                    estimated_api_calls=2,
-                ),
-                PlanStep(
-                    step_id=1,
-                    operation="aggregate",
-                    description="Compute aggregates",
-                    depends_on=[0],
-                ),
-                PlanStep(
-                    step_id=2,
-                    operation="limit",
-                    description="Take first 1",
-                    depends_on=[1],
-                ),
-            ],
-            total_api_calls=2,
-            estimated_records_fetched=50,
-            estimated_memory_mb=0.1,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
-        )
+        plan = plan_factory(query, "fetch", "aggregate", "limit")
 
         # Without fix: would stop at limit=1 during fetch, getting 1 record
         # Then aggregate: count=1, sum=10 - WRONG!
@@ -1263,35 +1466,86 @@ class TestQueryExecutor:
         assert result.data[0]["total"] == 50, f"Expected count=50, got {result.data[0]['total']}"
         assert result.data[0]["sum"] == 500, f"Expected sum=500, got {result.data[0]['sum']}"
 
+    async def test_count_only_aggregate_skips_record_materialization(
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
+    ) -> None:
+        """count(*)-only aggregates count pages without dumping records."""
+        records = [MagicMock(model_dump=MagicMock(return_value={"id": i})) for i in range(30)]
+        service = MagicMock()
+        service.all.return_value = _Pages([records[:20], records[20:]])
+        mock_client.persons = service
+
+        query = Query(
+            from_="persons",
+            aggregate={
+                "total": AggregateFunc.model_construct(count=True),
+                "n": AggregateFunc.model_construct(count=True),
+            },
+        )
+        plan = plan_factory(query, "fetch", "aggregate")
+
+        executor = QueryExecutor(mock_client, max_records=100)
+        result = await executor.execute(plan)
+
+        assert result.data == [{"total": 30, "n": 30}]
+        assert all(r.model_dump.call_count == 0 for r in records)
+
+    async def test_aggregate_only_plan_keeps_just_aggregated_fields(
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
+    ) -> None:
+        """Fetch-aggregate plans store only the groupBy and aggregated fields."""
+        from affinity.cli.query import executor as executor_module
+
+        service = MagicMock()
+        service.all.return_value = create_mock_page_iterator(
+            [
+                {"id": 1, "team": "a", "deal": {"size": 10}, "notes": "x" * 100},
+                {"id": 2, "team": "b", "deal": {"size": 20}, "notes": "y" * 100},
+                {"id": 3, "team": "a", "deal": {"size": 5}, "notes": "z" * 100},
+            ]
+        )
+        mock_client.persons = service
+
+        query = Query(
+            from_="persons",
+            group_by="team",
+            aggregate={
+                "total": AggregateFunc(sum="deal.size"),
+                "rows": AggregateFunc(count=True),
+            },
+        )
+        plan = plan_factory(query, "fetch", "aggregate")
+
+        executor = QueryExecutor(mock_client, max_records=100)
+        with patch.object(
+            executor_module,
+            "group_and_aggregate",
+            wraps=executor_module.group_and_aggregate,
+        ) as aggregate:
+            result = await executor.execute(plan)
+
+        assert result.data == [
+            {"team": "a", "total": 15.0, "rows": 2},
+            {"team": "b", "total": 20.0, "rows": 1},
+        ]
+        assert aggregate.call_args.args[0] == [
+            {"team": "a", "deal": {"size": 10}},
+            {"team": "b", "deal": {"size": 20}},
+            {"team": "a", "deal": {"size": 5}},
+        ]
+
     @pytest.mark.req("QUERY-EXEC-009")
-    @pytest.mark.asyncio
     async def test_limit_propagation_stops_early(
-        self, mock_client: AsyncMock, mock_service: AsyncMock
+        self,
+        mock_client: AsyncMock,
+        mock_service: AsyncMock,
+        plan_factory: Callable[..., ExecutionPlan],
     ) -> None:
         """Query limit stops fetching early."""
         mock_client.persons = mock_service
 
-        query = Query(from_="persons", limit=1)
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch",
-                    estimated_api_calls=1,
-                ),
-                PlanStep(step_id=1, operation="limit", description="Limit", depends_on=[0]),
-            ],
-            total_api_calls=1,
-            estimated_records_fetched=1,
-            estimated_memory_mb=0.01,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
-        )
+        query = _Q_PERSONS_LIMIT1
+        plan = plan_factory(query, "fetch", "limit")
 
         executor = QueryExecutor(mock_client)
         result = await executor.execute(plan)
@@ -1302,99 +1556,103 @@ class TestQueryExecutor:
 class TestQueryExecutorSorting:
     """Tests for sort step execution."""
 
-    @pytest.mark.asyncio
-    async def test_sort_ascending(self, mock_client: AsyncMock) -> None:
-        """Sort records in ascending order."""
-        service = MagicMock()
-        records = [
-            {"id": 1, "name": "Charlie"},
-            {"id": 2, "name": "Alice"},
-            {"id": 3, "name": "Bob"},
-        ]
-        service.all.return_value = create_mock_page_iterator(records)
-        mock_client.persons = service
-
-        query = Query(
-            from_="persons",
-            order_by=[OrderByClause(field="name", direction="asc")],
-        )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch",
-                    estimated_api_calls=1,
-                ),
-                PlanStep(step_id=1, operation="sort", description="Sort", depends_on=[0]),
-            ],
-            total_api_calls=1,
-            estimated_records_fetched=3,
-            estimated_memory_mb=0.01,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
-        )
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        ("direction", "values", "expected"),
+        [
+            ("asc", ["Charlie", "Alice", "Bob"], ["Alice", "Bob", "Charlie"]),
+            ("desc", [10, 30, 20], [30, 20, 10]),
+        ],
+        ids=["ascending", "descending"],
+    )
+    async def test_sort(
+        self,
+        mock_client: AsyncMock,
+        make_service: Callable[[list[dict]], MagicMock],
+        direction: str,
+        values: list[Any],
+        expected: list[Any],
+    ) -> None:
+        """Sort records in the requested direction."""
+        records = [{"id": i, "value": value} for i, value in enumerate(values, start=1)]
+        mock_client.persons = make_service(records)
 
         executor = QueryExecutor(mock_client)
-        result = await executor.execute(plan)
+        result = await executor.execute(_SORT_PLANS[direction])
 
-        assert result.data[0]["name"] == "Alice"
-        assert result.data[1]["name"] == "Bob"
-        assert result.data[2]["name"] == "Charlie"
+        assert [r["value"] for r in result.data] == expected
 
-    @pytest.mark.asyncio
-    async def test_sort_descending(self, mock_client: AsyncMock) -> None:
-        """Sort records in descending order."""
-        service = MagicMock()
-        records = [
-            {"id": 1, "value": 10},
-            {"id": 2, "value": 30},
-            {"id": 3, "value": 20},
-        ]
-        service.all.return_value = create_mock_page_iterator(records)
-        mock_client.persons = service
+    @pytest.mark.parametrize(("limit", "expected"), [(2, [0, 1]), (5, [0, 1, 2]), (0, [])])
+    def test_limit_truncates_in_place(
+        self, pure_executor: QueryExecutor, limit: int, expected: list[int]
+    ) -> None:
+        """The limit step trims the existing record list rather than copying it."""
+        ctx = ExecutionContext(query=Query(from_="persons", limit=limit))
+        records = [{"id": i} for i in range(3)]
+        ctx.records = records
+
+        pure_executor._execute_limit(
+            PlanStep(step_id=1, operation="limit", description="Limit"), ctx
+        )
 
+        assert ctx.records is records
+        assert [r["id"] for r in ctx.records] == expected
+
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("direction", ["asc", "desc"])
+    async def test_top_k_matches_full_sort(
+        self,
+        mock_client: AsyncMock,
+        make_service: Callable[[list[dict]], MagicMock],
+        plan_factory: Callable[..., ExecutionPlan],
+        direction: str,
+    ) -> None:
+        """A small limit after sort keeps the same records, in order, as a full sort."""
+        values = [5, 3, 5, 1, 3, 8, 2, 8, 5, 0, 7, 3, 1, 6, 4, 1]
+        records = [{"id": i, "value": value} for i, value in enumerate(values)]
+        mock_client.persons = make_service(records)
         query = Query(
             from_="persons",
-            order_by=[OrderByClause(field="value", direction="desc")],
-        )
-        plan = ExecutionPlan(
-            query=query,
-            steps=[
-                PlanStep(
-                    step_id=0,
-                    operation="fetch",
-                    entity="persons",
-                    description="Fetch",
-                    estimated_api_calls=1,
-                ),
-                PlanStep(step_id=1, operation="sort", description="Sort", depends_on=[0]),
-            ],
-            total_api_calls=1,
-            estimated_records_fetched=3,
-            estimated_memory_mb=0.01,
-            warnings=[],
-            recommendations=[],
-            has_expensive_operations=False,
-            requires_full_scan=False,
+            order_by=[OrderByClause.model_construct(field="value", direction=direction)],
+            limit=3,
         )
 
         executor = QueryExecutor(mock_client)
-        result = await executor.execute(plan)
+        with patch("affinity.cli.query.executor.heapq.nsmallest", wraps=heapq.nsmallest) as topk:
+            result = await executor.execute(plan_factory(query, "fetch", "sort", "limit"))
+
+        topk.assert_called_once()
+        expected = sorted(records, key=lambda r: r["value"], reverse=direction == "desc")
+        assert result.data == expected[:3]
 
-        assert result.data[0]["value"] == 30
-        assert result.data[1]["value"] == 20
-        assert result.data[2]["value"] == 10
+    def test_multi_key_sort(self, pure_executor: QueryExecutor) -> None:
+        """Later order keys break ties left by earlier ones; nulls sort last."""
+        ctx = ExecutionContext(
+            query=Query(
+                from_="persons",
+                order_by=[
+                    OrderByClause.model_construct(field="team", direction="asc"),
+                    OrderByClause.model_construct(field="score", direction="desc"),
+                ],
+            )
+        )
+        ctx.records = [
+            {"id": 1, "team": "b", "score": 1},
+            {"id": 2, "team": None, "score": 9},
+            {"id": 3, "team": "a", "score": 2},
+            {"id": 4, "team": "b", "score": 5},
+            {"id": 5, "team": "a", "score": 7},
+        ]
+
+        pure_executor._execute_sort(PlanStep(step_id=1, operation="sort", description="Sort"), ctx)
 
+        assert [r["id"] for r in ctx.records] == [5, 3, 4, 1, 2]
 
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestQueryExecutorErrors:
     """Tests for error handling."""
 
-    @pytest.mark.asyncio
     async def test_auth_failure(self, mock_client: AsyncMock, simple_plan: ExecutionPlan) -> None:
         """Auth failure raises QueryExecutionError."""
         mock_client.whoami.side_effect = Exception("Unauthorized")
@@ -1404,7 +1662,25 @@ class TestQueryExecutorErrors:
             await executor.execute(simple_plan)
         assert "Authentication failed" in str(exc.value)
 
-    @pytest.mark.asyncio
+    async def test_auth_check_reused_until_expired_or_invalidated(
+        self, mock_client: AsyncMock
+    ) -> None:
+        """A reused executor calls whoami() once per TTL window, or after invalidate_auth()."""
+        executor = QueryExecutor(mock_client)
+
+        await executor._verify_auth()
+        await executor._verify_auth()
+        assert mock_client.whoami.call_count == 1
+
+        executor.invalidate_auth()
+        await executor._verify_auth()
+        assert mock_client.whoami.call_count == 2
+
+        later = time.monotonic() + 301
+        with patch("affinity.cli.query.executor.time.monotonic", return_value=later):
+            await executor._verify_auth()
+        assert mock_client.whoami.call_count == 3
+
     async def test_fetch_error(self, mock_client: AsyncMock, simple_plan: ExecutionPlan) -> None:
         """Fetch error raises QueryExecutionError."""
         service = MagicMock()
@@ -1441,10 +1717,10 @@ class TestNullProgressCallback:
         callback.on_step_error(step, Exception("test"))
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestExecuteQueryFunction:
     """Tests for execute_query convenience function."""
 
-    @pytest.mark.asyncio
     async def test_convenience_function(
         self, mock_client: AsyncMock, mock_service: AsyncMock, simple_plan: ExecutionPlan
     ) -> None:
@@ -1462,101 +1738,132 @@ class TestExecuteQueryFunction:
 
 
 class TestExtractParentIds:
-    """Tests for _extract_parent_ids helper method.
+    """Tests for _extract_parent_ids_impl, the logic behind _extract_parent_ids.
 
-    NOTE: _extract_parent_ids is a method on QueryExecutor. Since the method
-    doesn't use self.client for extraction, we use a minimal mock.
+    The function doesn't touch a client, so no executor is constructed.
     """
 
-    @pytest.fixture
-    def executor(self) -> QueryExecutor:
-        """Create QueryExecutor with minimal mock client."""
-        mock_client = MagicMock()
-        return QueryExecutor(mock_client, max_records=100)
-
-    def test_direct_condition(self, executor: QueryExecutor) -> None:
-        """Extract parent ID from direct eq condition."""
-        where = {"path": "listId", "op": "eq", "value": 123}
-        assert executor._extract_parent_ids(where, "listId") == [123]
-
-    def test_and_condition(self, executor: QueryExecutor) -> None:
-        """Extract parent ID from AND condition."""
-        where = {
-            "and": [
-                {"path": "listId", "op": "eq", "value": 123},
-                {"path": "status", "op": "eq", "value": "active"},
-            ]
-        }
-        assert executor._extract_parent_ids(where, "listId") == [123]
-
-    def test_or_condition_multiple_ids(self, executor: QueryExecutor) -> None:
-        """Extract multiple parent IDs from OR condition."""
-        where = {
-            "or": [
-                {"path": "listId", "op": "eq", "value": 123},
-                {"path": "listId", "op": "eq", "value": 456},
-            ]
-        }
-        assert executor._extract_parent_ids(where, "listId") == [123, 456]
-
-    def test_nested_and_or(self, executor: QueryExecutor) -> None:
-        """Extract parent IDs from nested AND/OR conditions."""
-        where = {
-            "and": [
+    @pytest.mark.parametrize(
+        ("where", "field", "expected"),
+        [
+            pytest.param(
+                {"path": "listId", "op": "eq", "value": 123}, "listId", [123], id="direct_eq"
+            ),
+            pytest.param(
+                {
+                    "and": [
+                        {"path": "listId", "op": "eq", "value": 123},
+                        {"path": "status", "op": "eq", "value": "active"},
+                    ]
+                },
+                "listId",
+                [123],
+                id="and",
+            ),
+            pytest.param(
                 {
                     "or": [
                         {"path": "listId", "op": "eq", "value": 123},
                         {"path": "listId", "op": "eq", "value": 456},
                     ]
                 },
-                {"path": "status", "op": "eq", "value": "active"},
-            ]
-        }
-        assert executor._extract_parent_ids(where, "listId") == [123, 456]
+                "listId",
+                [123, 456],
+                id="or_multiple_ids",
+            ),
+            pytest.param(
+                {
+                    "and": [
+                        {
+                            "or": [
+                                {"path": "listId", "op": "eq", "value": 123},
+                                {"path": "listId", "op": "eq", "value": 456},
+                            ]
+                        },
+                        {"path": "status", "op": "eq", "value": "active"},
+                    ]
+                },
+                "listId",
+                [123, 456],
+                id="nested_and_or",
+            ),
+            pytest.param(
+                {
+                    "or": [
+                        {"path": "listId", "op": "eq", "value": 123},
+                        {"path": "listId", "op": "eq", "value": 123},
+                    ]
+                },
+                "listId",
+                [123],
+                id="deduplication",
+            ),
+            pytest.param(
+                {"path": "listId", "op": "in", "value": [123, 456, 789]},
+                "listId",
+                [123, 456, 789],
+                id="in_operator",
+            ),
+            pytest.param(
+                {"path": "listId", "op": "eq", "value": "123"}, "listId", [123], id="string_id"
+            ),
+            pytest.param(
+                {"path": "listId", "op": "in", "value": [123, "456", 789]},
+                "listId",
+                [123, 456, 789],
+                id="mixed_string_int_ids",
+            ),
+            pytest.param(
+                {"path": "listId", "op": "in", "value": [123, "not-a-number", 456]},
+                "listId",
+                [123, 456],
+                id="invalid_string_id_ignored",
+            ),
+            pytest.param(None, "listId", [], id="none_where"),
+            pytest.param(
+                {"path": "listId", "op": "eq", "value": 123}, None, [], id="none_field_name"
+            ),
+            pytest.param(
+                WhereClause.model_construct(path="listId", op="eq", value=123),
+                "listId",
+                [123],
+                id="pydantic_model",
+            ),
+        ],
+    )
+    def test_extract(
+        self,
+        where: dict[str, Any] | WhereClause | None,
+        field: str | None,
+        expected: list[int],
+    ) -> None:
+        """Parent IDs are collected from eq/in conditions, with dedup and int coercion."""
+        assert _extract_parent_ids_impl(where, field) == expected
 
-    def test_deduplication(self, executor: QueryExecutor) -> None:
-        """Duplicate IDs are deduplicated."""
+    def test_large_in_list_dedup_keeps_first_seen_order(self) -> None:
+        """Thousands of repeated IDs collapse to first-seen order."""
+        values = [str(i % 500) for i in range(5000, 0, -1)]
         where = {
             "or": [
-                {"path": "listId", "op": "eq", "value": 123},
-                {"path": "listId", "op": "eq", "value": 123},  # duplicate
+                {"path": "listId", "op": "in", "value": values},
+                {"path": "listId", "op": "eq", "value": 7},
             ]
         }
-        assert executor._extract_parent_ids(where, "listId") == [123]
 
-    def test_in_operator(self, executor: QueryExecutor) -> None:
-        """Extract multiple IDs from 'in' operator."""
-        where = {"path": "listId", "op": "in", "value": [123, 456, 789]}
-        assert executor._extract_parent_ids(where, "listId") == [123, 456, 789]
+        ids = _extract_parent_ids_impl(where, "listId")
 
-    def test_string_id(self, executor: QueryExecutor) -> None:
-        """String IDs are converted to int."""
-        where = {"path": "listId", "op": "eq", "value": "123"}
-        assert executor._extract_parent_ids(where, "listId") == [123]
+        assert ids == list(dict.fromkeys(int(v) for v in values))
+        assert len(ids) == 500
 
-    def test_mixed_string_int_ids(self, executor: QueryExecutor) -> None:
-        """Mixed string and int IDs in 'in' operator."""
-        where = {"path": "listId", "op": "in", "value": [123, "456", 789]}
-        assert executor._extract_parent_ids(where, "listId") == [123, 456, 789]
+    def test_deep_nesting_keeps_order_without_recursion(self) -> None:
+        """Nesting past the recursion limit is walked in left-to-right order."""
+        where: dict[str, Any] = {"path": "listId", "op": "eq", "value": 0}
+        for i in range(1, sys.getrecursionlimit() + 100):
+            where = {"or": [{"path": "listId", "op": "eq", "value": i}, {"and": [where]}]}
 
-    def test_invalid_string_id_ignored(self, executor: QueryExecutor) -> None:
-        """Non-numeric strings are silently ignored."""
-        where = {"path": "listId", "op": "in", "value": [123, "not-a-number", 456]}
-        assert executor._extract_parent_ids(where, "listId") == [123, 456]
+        ids = _extract_parent_ids_impl(where, "listId")
 
-    def test_none_where(self, executor: QueryExecutor) -> None:
-        """Returns empty list for None where clause."""
-        assert executor._extract_parent_ids(None, "listId") == []
-
-    def test_none_field_name(self, executor: QueryExecutor) -> None:
-        """Returns empty list for None field name."""
-        where = {"path": "listId", "op": "eq", "value": 123}
-        assert executor._extract_parent_ids(where, None) == []
-
-    def test_pydantic_model_conversion(self, executor: QueryExecutor) -> None:
-        """Handles WhereClause pydantic model by calling model_dump."""
-        where = WhereClause(path="listId", op="eq", value=123)
-        assert executor._extract_parent_ids(where, "listId") == [123]
+        assert ids == list(range(sys.getrecursionlimit() + 99, -1, -1))
 
 
 # =============================================================================
@@ -1564,6 +1871,47 @@ class TestExtractParentIds:
 # =============================================================================
 
 
+class _StubLists:
+    """client.lists stand-in serving fixed lists, counting calls."""
+
+    __slots__ = ("_lists", "all_calls")
+
+    def __init__(self, *, lists: Sequence[_FakeList] = ()) -> None:
+        self._lists = lists
+        self.all_calls = 0
+
+    def all(self) -> AsyncIterator[_FakeList]:
+        self.all_calls += 1
+        return self._iter_lists()
+
+    async def _iter_lists(self) -> AsyncIterator[_FakeList]:
+        for lst in self._lists:
+            yield lst
+
+    def reset_calls(self) -> None:
+        self.all_calls = 0
+
+
+class _StubClient:
+    """Client stand-in exposing only the lists service."""
+
+    __slots__ = ("lists", "whoami")
+
+    def __init__(self, lists: _StubLists) -> None:
+        self.lists = lists
+        self.whoami = _async_return({"id": 1})
+
+
+@pytest.fixture(scope="module")
+def list_name_executor() -> QueryExecutor:
+    """Create QueryExecutor with a stub client returning known lists."""
+    lists = _StubLists(
+        lists=[_FakeList(id=12345, name="My Deals"), _FakeList(id=67890, name="Leads")]
+    )
+    return QueryExecutor(_StubClient(lists), max_records=100)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestListNameResolution:
     """Tests for _resolve_list_names_to_ids helper method.
 
@@ -1572,50 +1920,30 @@ class TestListNameResolution:
     """
 
     @pytest.fixture
-    def executor(self) -> QueryExecutor:
-        """Create QueryExecutor with mock client returning known lists."""
-        # Create mock list objects
-        mock_list_1 = MagicMock()
-        mock_list_1.name = "My Deals"
-        mock_list_1.id = 12345
-
-        mock_list_2 = MagicMock()
-        mock_list_2.name = "Leads"
-        mock_list_2.id = 67890
-
-        # Create async iterator for client.lists.all()
-        async def mock_lists_all():
-            for lst in [mock_list_1, mock_list_2]:
-                yield lst
-
-        mock_client = MagicMock()
-        mock_client.lists.all = mock_lists_all
-        mock_client.whoami = AsyncMock(return_value={"id": 1})
-
-        return QueryExecutor(mock_client, max_records=100)
+    def executor(self, list_name_executor: QueryExecutor) -> Iterator[QueryExecutor]:
+        """Shared executor, with lookup caches dropped after each test."""
+        yield list_name_executor
+        _reset_lookup_caches(list_name_executor)
+        list_name_executor.client.lists.reset_calls()
 
-    @pytest.mark.asyncio
     async def test_single_list_name_resolved(self, executor: QueryExecutor) -> None:
         """Single listName is resolved to listId."""
         where = {"path": "listName", "op": "eq", "value": "My Deals"}
         resolved = await executor._resolve_list_names_to_ids(where)
         assert resolved == {"path": "listId", "op": "eq", "value": 12345}
 
-    @pytest.mark.asyncio
     async def test_multiple_list_names_resolved(self, executor: QueryExecutor) -> None:
         """Multiple listNames in 'in' operator are resolved."""
         where = {"path": "listName", "op": "in", "value": ["My Deals", "Leads"]}
         resolved = await executor._resolve_list_names_to_ids(where)
         assert resolved == {"path": "listId", "op": "in", "value": [12345, 67890]}
 
-    @pytest.mark.asyncio
     async def test_unknown_list_name_raises_error(self, executor: QueryExecutor) -> None:
         """Unknown list name raises QueryExecutionError."""
         where = {"path": "listName", "op": "eq", "value": "Nonexistent List"}
         with pytest.raises(QueryExecutionError, match="List not found"):
             await executor._resolve_list_names_to_ids(where)
 
-    @pytest.mark.asyncio
     async def test_nested_list_name_resolved(self, executor: QueryExecutor) -> None:
         """listName in nested conditions is resolved."""
         where = {
@@ -1628,14 +1956,24 @@ class TestListNameResolution:
         assert resolved["and"][0] == {"path": "listId", "op": "eq", "value": 12345}
         assert resolved["and"][1] == {"path": "status", "op": "eq", "value": "active"}
 
-    @pytest.mark.asyncio
     async def test_non_listname_passthrough(self, executor: QueryExecutor) -> None:
         """Non-listName conditions pass through unchanged."""
         where = {"path": "listId", "op": "eq", "value": 999}
         resolved = await executor._resolve_list_names_to_ids(where)
         assert resolved == {"path": "listId", "op": "eq", "value": 999}
 
-    @pytest.mark.asyncio
+    async def test_unchanged_clauses_not_copied(self, executor: QueryExecutor) -> None:
+        """Clauses without listName come back as the same objects."""
+        untouched = {"or": [{"path": "status", "op": "eq", "value": "active"}]}
+        where = {"and": [untouched, {"path": "listId", "op": "eq", "value": 999}]}
+        assert await executor._resolve_list_names_to_ids(where) is where
+
+        where["and"].append({"path": "listName", "op": "eq", "value": "Leads"})
+        resolved = await executor._resolve_list_names_to_ids(where)
+        assert resolved is not where
+        assert resolved["and"][0] is untouched
+        assert resolved["and"][2] == {"path": "listId", "op": "eq", "value": 67890}
+
     async def test_cache_reused(self, executor: QueryExecutor) -> None:
         """List name cache is reused across multiple resolutions."""
         where1 = {"path": "listName", "op": "eq", "value": "My Deals"}
@@ -1650,157 +1988,31 @@ class TestListNameResolution:
         # Cache should exist
         assert hasattr(executor, "_list_name_cache")
         assert len(executor._list_name_cache) == 2
+        assert executor.client.lists.all_calls == 1
 
+    async def test_list_name_match_ignores_case(self, executor: QueryExecutor) -> None:
+        """listName matches regardless of case."""
+        where = {"path": "listName", "op": "in", "value": ["MY DEALS", "leads"]}
+        resolved = await executor._resolve_list_names_to_ids(where)
+        assert resolved == {"path": "listId", "op": "in", "value": [12345, 67890]}
 
-# =============================================================================
-# _resolve_field_names_to_ids Tests
-# =============================================================================
-
-
-class TestFieldNameResolution:
-    """Tests for _resolve_field_names_to_ids helper method.
-
-    This tests the feature that resolves human-readable field names
-    to field IDs in query where clauses. For example:
-        {"path": "fields.Status", ...} -> {"path": "fields.12345", ...}
-    """
-
-    @pytest.fixture
-    def executor(self) -> QueryExecutor:
-        """Create QueryExecutor with mock client returning known fields."""
-        # Create mock field objects
-        mock_field_1 = MagicMock()
-        mock_field_1.name = "Status"
-        mock_field_1.id = "field-260415"
-
-        mock_field_2 = MagicMock()
-        mock_field_2.name = "Deal Value"
-        mock_field_2.id = "field-260416"
-
-        mock_field_3 = MagicMock()
-        mock_field_3.name = "Priority"
-        mock_field_3.id = "field-260417"
-
-        # Create mock for lists.get_fields
-        async def mock_get_fields(_list_id: Any) -> list[Any]:
-            return [mock_field_1, mock_field_2, mock_field_3]
-
-        mock_client = MagicMock()
-        mock_client.lists.get_fields = mock_get_fields
-        mock_client.whoami = AsyncMock(return_value={"id": 1})
-
-        return QueryExecutor(mock_client, max_records=100)
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_single_field_name_resolved(self, executor: QueryExecutor) -> None:
-        """Single field name is resolved to field ID."""
-        where = {"path": "fields.Status", "op": "eq", "value": "Active"}
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        assert resolved == {"path": "fields.field-260415", "op": "eq", "value": "Active"}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_field_name_case_insensitive(self, executor: QueryExecutor) -> None:
-        """Field name resolution is case-insensitive."""
-        where = {"path": "fields.status", "op": "eq", "value": "Active"}
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        assert resolved == {"path": "fields.field-260415", "op": "eq", "value": "Active"}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_field_with_space_resolved(self, executor: QueryExecutor) -> None:
-        """Field names with spaces are resolved."""
-        where = {"path": "fields.Deal Value", "op": "gt", "value": 10000}
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        assert resolved == {"path": "fields.field-260416", "op": "gt", "value": 10000}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_numeric_field_id_passthrough(self, executor: QueryExecutor) -> None:
-        """Numeric field IDs pass through unchanged."""
-        where = {"path": "fields.12345", "op": "eq", "value": "Active"}
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        # Should not change since it's already a numeric ID
-        assert resolved == {"path": "fields.12345", "op": "eq", "value": "Active"}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_field_id_prefix_passthrough(self, executor: QueryExecutor) -> None:
-        """field- prefixed IDs pass through unchanged."""
-        where = {"path": "fields.field-260415", "op": "eq", "value": "Active"}
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        assert resolved == {"path": "fields.field-260415", "op": "eq", "value": "Active"}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_unknown_field_name_passthrough(self, executor: QueryExecutor) -> None:
-        """Unknown field names pass through unchanged (no error)."""
-        where = {"path": "fields.NonexistentField", "op": "eq", "value": "X"}
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        # Should pass through since field not found
-        assert resolved == {"path": "fields.NonexistentField", "op": "eq", "value": "X"}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_nested_and_conditions_resolved(self, executor: QueryExecutor) -> None:
-        """Field names in nested AND conditions are resolved."""
-        where = {
-            "and": [
-                {"path": "fields.Status", "op": "eq", "value": "Active"},
-                {"path": "fields.Priority", "op": "eq", "value": "High"},
-            ]
-        }
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        assert resolved["and"][0] == {"path": "fields.field-260415", "op": "eq", "value": "Active"}
-        assert resolved["and"][1] == {"path": "fields.field-260417", "op": "eq", "value": "High"}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_nested_or_conditions_resolved(self, executor: QueryExecutor) -> None:
-        """Field names in nested OR conditions are resolved."""
-        where = {
-            "or": [
-                {"path": "fields.Status", "op": "eq", "value": "Active"},
-                {"path": "fields.Status", "op": "eq", "value": "Pending"},
-            ]
-        }
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        assert resolved["or"][0] == {"path": "fields.field-260415", "op": "eq", "value": "Active"}
-        assert resolved["or"][1] == {"path": "fields.field-260415", "op": "eq", "value": "Pending"}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_non_field_paths_passthrough(self, executor: QueryExecutor) -> None:
-        """Non-fields.* paths pass through unchanged."""
-        where = {"path": "listId", "op": "eq", "value": 12345}
-        resolved = await executor._resolve_field_names_to_ids(where, [12345])
-        assert resolved == {"path": "listId", "op": "eq", "value": 12345}
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_empty_list_ids_passthrough(self, executor: QueryExecutor) -> None:
-        """Empty list IDs returns where unchanged."""
-        where = {"path": "fields.Status", "op": "eq", "value": "Active"}
-        resolved = await executor._resolve_field_names_to_ids(where, [])
-        assert resolved == where
-
-    @pytest.mark.asyncio
-    @pytest.mark.req("QUERY-EXECUTOR-010")
-    async def test_cache_reused(self, executor: QueryExecutor) -> None:
-        """Field name cache is reused across multiple resolutions."""
-        where1 = {"path": "fields.Status", "op": "eq", "value": "Active"}
-        where2 = {"path": "fields.Priority", "op": "eq", "value": "High"}
-
-        # First resolution populates cache
-        await executor._resolve_field_names_to_ids(where1, [12345])
+    async def test_names_differing_only_in_case_are_ambiguous(self) -> None:
+        """Lists whose names differ only in case resolve exactly, else are ambiguous."""
+        client = MagicMock()
+        client.lists.all = MagicMock(
+            return_value=_AsyncList([_FakeList(id=1, name="Deals"), _FakeList(id=2, name="DEALS")])
+        )
+        executor = QueryExecutor(client, max_records=100)
 
-        # Second resolution should use cache
-        await executor._resolve_field_names_to_ids(where2, [12345])
+        resolved = await executor._resolve_list_names_to_ids(
+            {"path": "listName", "op": "in", "value": ["Deals", "DEALS"]}
+        )
+        assert resolved == {"path": "listId", "op": "in", "value": [1, 2]}
 
-        # Cache should exist
-        assert hasattr(executor, "_field_name_to_id_cache")
-        assert len(executor._field_name_to_id_cache) == 3  # All 3 fields cached
+        with pytest.raises(QueryExecutionError, match="Ambiguous list name"):
+            await executor._resolve_list_names_to_ids(
+                {"path": "listName", "op": "eq", "value": "deals"}
+            )
 
 
 # =============================================================================
@@ -1825,12 +2037,24 @@ class TestCollectFieldRefs:
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"Status", "Owner"}
 
+    def test_repeat_call_does_not_rescan(self, executor: QueryExecutor) -> None:
+        """A second call for the same query skips walking the query tree."""
+        query = Query(
+            from_="listEntries",
+            select=["fields.Status"],
+            where=WhereClause.model_construct(path="fields.Owner", op="eq", value="me"),
+        )
+        with patch.object(executor, "_scan_field_refs", wraps=executor._scan_field_refs) as scan:
+            assert executor._collect_field_refs_from_query(query) == {"Status", "Owner"}
+            assert executor._collect_field_refs_from_query(query) == {"Status", "Owner"}
+        scan.assert_called_once_with(query)
+
     def test_collects_from_groupby(self, executor: QueryExecutor) -> None:
         """Collects field names from groupBy clause."""
         query = Query(
             from_="listEntries",
             group_by="fields.Status",
-            aggregate={"count": AggregateFunc(count=True)},
+            aggregate={"count": AggregateFunc.model_construct(count=True)},
         )
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"Status"}
@@ -1840,8 +2064,8 @@ class TestCollectFieldRefs:
         query = Query(
             from_="listEntries",
             aggregate={
-                "total": AggregateFunc(sum="fields.Deal Value"),
-                "avg_amount": AggregateFunc(avg="fields.Amount"),
+                "total": AggregateFunc.model_construct(sum="fields.Deal Value"),
+                "avg_amount": AggregateFunc.model_construct(avg="fields.Amount"),
             },
         )
         field_names = executor._collect_field_refs_from_query(query)
@@ -1851,7 +2075,7 @@ class TestCollectFieldRefs:
         """Collects field names from where clause."""
         query = Query(
             from_="listEntries",
-            where=WhereClause(path="fields.Status", op="eq", value="Active"),
+            where=WhereClause.model_construct(path="fields.Status", op="eq", value="Active"),
         )
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"Status"}
@@ -1860,29 +2084,80 @@ class TestCollectFieldRefs:
         """Collects field names from compound where clause."""
         query = Query(
             from_="listEntries",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 and_=[
-                    WhereClause(path="listId", op="eq", value=123),
-                    WhereClause(path="fields.Status", op="eq", value="Active"),
-                    WhereClause(path="fields.Priority", op="in", value=["High", "Medium"]),
+                    WhereClause.model_construct(path="listId", op="eq", value=123),
+                    WhereClause.model_construct(path="fields.Status", op="eq", value="Active"),
+                    WhereClause.model_construct(
+                        path="fields.Priority", op="in", value=["High", "Medium"]
+                    ),
                 ]
             ),
         )
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"Status", "Priority"}
 
+    def test_deeply_nested_where_does_not_recurse(self, executor: QueryExecutor) -> None:
+        """Nesting deeper than the recursion limit is walked iteratively."""
+        where: dict[str, Any] = {"path": "fields.Leaf", "op": "eq", "value": 1}
+        for i in range(sys.getrecursionlimit() + 100):
+            where = {"and": [{"path": f"fields.F{i % 3}", "op": "eq", "value": 1}, {"not": where}]}
+        field_names: set[str] = set()
+        executor._collect_field_refs_from_where(where, field_names)
+        assert field_names == {"Leaf", "F0", "F1", "F2"}
+
+    def test_where_model_walked_without_dump(self, executor: QueryExecutor) -> None:
+        """A WhereClause is walked as a model and matches the dict walk."""
+        where = WhereClause(
+            or_=[
+                WhereClause(path="fields.Status", op="eq", value="Active"),
+                WhereClause(not_=WhereClause(path="fields.Owner", op="is_null")),
+                WhereClause(path="name", op="contains", value="fields.Nope"),
+            ]
+        )
+        from_dict: set[str] = set()
+        executor._collect_field_refs_from_where(
+            where.model_dump(mode="json", by_alias=True), from_dict
+        )
+
+        query = Query(from_="listEntries", select=["id"], where=where)
+        with patch.object(WhereClause, "model_dump") as dump:
+            assert executor._collect_field_refs_from_query(query) == from_dict
+        dump.assert_not_called()
+        assert from_dict == {"Status", "Owner"}
+
     def test_returns_wildcard_for_fields_star_in_select(self, executor: QueryExecutor) -> None:
         """Returns wildcard when fields.* is in select."""
         query = Query(from_="listEntries", select=["id", "fields.*"])
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"*"}
 
+    def test_select_wildcard_skips_where_walk(self, executor: QueryExecutor) -> None:
+        """A fields.* select returns before the where clause is walked."""
+        query = Query(
+            from_="listEntries",
+            select=["fields.*"],
+            where=WhereClause.model_construct(path="fields.Status", op="eq", value="Active"),
+        )
+        with patch.object(executor, "_collect_field_refs_from_where") as walk:
+            assert executor._collect_field_refs_from_query(query) == {"*"}
+        walk.assert_not_called()
+
+    def test_select_only_takes_fast_path(self, executor: QueryExecutor) -> None:
+        """A select-only query is resolved without the general clause walk."""
+        query = Query(
+            from_="listEntries", select=["id", "fields.Status", "fields.", "fields.Owner"]
+        )
+        with patch("affinity.cli.query.executor._iter_query_field_paths") as walk:
+            assert executor._collect_field_refs_from_query(query) == {"Status", "Owner"}
+        walk.assert_not_called()
+
     def test_returns_wildcard_for_fields_star_in_groupby(self, executor: QueryExecutor) -> None:
         """Returns wildcard when fields.* is in groupBy."""
         query = Query(
             from_="listEntries",
             group_by="fields.*",
-            aggregate={"count": AggregateFunc(count=True)},
+            aggregate={"count": AggregateFunc.model_construct(count=True)},
         )
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"*"}
@@ -1902,8 +2177,8 @@ class TestCollectFieldRefs:
             from_="listEntries",
             select=["fields.A", "fields.B"],
             group_by="fields.C",
-            aggregate={"total": AggregateFunc(sum="fields.D")},
-            where=WhereClause(path="fields.E", op="eq", value="X"),
+            aggregate={"total": AggregateFunc.model_construct(sum="fields.D")},
+            where=WhereClause.model_construct(path="fields.E", op="eq", value="X"),
         )
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"A", "B", "C", "D", "E"}
@@ -1912,33 +2187,32 @@ class TestCollectFieldRefs:
         """Collects field names from percentile aggregate."""
         query = Query(
             from_="listEntries",
-            aggregate={"p90": AggregateFunc(percentile={"field": "fields.Amount", "p": 90})},
+            aggregate={
+                "p90": AggregateFunc.model_construct(percentile={"field": "fields.Amount", "p": 90})
+            },
         )
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"Amount"}
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestResolveFieldIdsForListEntries:
     """Tests for _resolve_field_ids_for_list_entries method."""
 
     @pytest.fixture
-    def mock_fields(self) -> list[MagicMock]:
+    def mock_fields(self) -> list[_FakeField]:
         """Create mock field objects."""
-        fields = []
-        for i, name in enumerate(["Status", "Priority", "Amount"]):
-            field = MagicMock()
-            field.id = f"field-{100 + i}"
-            field.name = name
-            fields.append(field)
-        return fields
+        return [
+            _FakeField(id=f"field-{100 + i}", name=name)
+            for i, name in enumerate(["Status", "Priority", "Amount"])
+        ]
 
     @pytest.fixture
-    def executor(self, mock_client: AsyncMock, mock_fields: list[MagicMock]) -> QueryExecutor:
+    def executor(self, mock_client: AsyncMock, mock_fields: list[_FakeField]) -> QueryExecutor:
         """Create executor with mocked get_fields."""
         mock_client.lists.get_fields = AsyncMock(return_value=mock_fields)
         return QueryExecutor(mock_client, max_records=100)
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-EXECUTOR-011")
     async def test_resolves_field_names_to_ids(
         self, executor: QueryExecutor, mock_client: AsyncMock
@@ -1947,7 +2221,7 @@ class TestResolveFieldIdsForListEntries:
         query = Query(
             from_="listEntries",
             group_by="fields.Status",
-            aggregate={"count": AggregateFunc(count=True)},
+            aggregate={"count": AggregateFunc.model_construct(count=True)},
         )
         ctx = ExecutionContext(query=query)
 
@@ -1956,7 +2230,6 @@ class TestResolveFieldIdsForListEntries:
         assert field_ids == ["field-100"]
         mock_client.lists.get_fields.assert_called_once()
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-EXECUTOR-011")
     async def test_resolves_multiple_fields(self, executor: QueryExecutor) -> None:
         """Resolves multiple field names."""
@@ -1970,7 +2243,6 @@ class TestResolveFieldIdsForListEntries:
 
         assert sorted(field_ids) == ["field-100", "field-101"]
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-EXECUTOR-011")
     async def test_returns_all_fields_for_wildcard(self, executor: QueryExecutor) -> None:
         """Returns all field IDs for fields.* wildcard."""
@@ -1981,7 +2253,6 @@ class TestResolveFieldIdsForListEntries:
 
         assert sorted(field_ids) == ["field-100", "field-101", "field-102"]
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-EXECUTOR-011")
     async def test_returns_none_for_no_field_refs(self, executor: QueryExecutor) -> None:
         """Returns None when no field references in query."""
@@ -1992,7 +2263,6 @@ class TestResolveFieldIdsForListEntries:
 
         assert field_ids is None
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-EXECUTOR-011")
     async def test_skips_unknown_field_names(self, executor: QueryExecutor) -> None:
         """Skips field names not found in list metadata."""
@@ -2007,7 +2277,6 @@ class TestResolveFieldIdsForListEntries:
         # Should only include Status, not UnknownField
         assert field_ids == ["field-100"]
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-EXECUTOR-011")
     async def test_case_insensitive_field_lookup(self, executor: QueryExecutor) -> None:
         """Field names are resolved case-insensitively."""
@@ -2021,13 +2290,23 @@ class TestResolveFieldIdsForListEntries:
 
         assert field_ids == ["field-100"]
 
-    @pytest.mark.asyncio
+    async def test_field_lookup_uses_casefold(self, mock_client: AsyncMock) -> None:
+        """Matching uses full case folding, not just lower()."""
+        mock_client.lists.get_fields = AsyncMock(
+            return_value=[_FakeField(id="field-7", name="Straße")]
+        )
+        executor = QueryExecutor(mock_client, max_records=100)
+        ctx = ExecutionContext(query=Query(from_="listEntries", select=["fields.STRASSE"]))
+
+        assert await executor._resolve_field_ids_for_list_entries(ctx, 12345) == ["field-7"]
+        assert ctx.warnings == []
+
     @pytest.mark.req("QUERY-EXECUTOR-011")
     async def test_caches_field_metadata(
         self, executor: QueryExecutor, mock_client: AsyncMock
     ) -> None:
         """Field metadata is cached per list ID."""
-        query = Query(from_="listEntries", group_by="fields.Status")
+        query = _Q_ENTRIES_BY_STATUS
         ctx = ExecutionContext(query=query)
 
         # First call
@@ -2038,21 +2317,61 @@ class TestResolveFieldIdsForListEntries:
         # Should only fetch fields once
         assert mock_client.lists.get_fields.call_count == 1
 
-    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(
+        self,
+        executor: QueryExecutor,
+        mock_client: AsyncMock,
+        mock_fields: list[_FakeField],
+    ) -> None:
+        """Concurrent lookups for one list coalesce into a single get_fields call."""
+
+        async def slow_get_fields(_list_id: Any) -> list[_FakeField]:
+            await asyncio.sleep(0)  # Yield so the other lookups start mid-fetch
+            return mock_fields
+
+        mock_client.lists.get_fields = AsyncMock(side_effect=slow_get_fields)
+        ctx = ExecutionContext(query=_Q_ENTRIES_BY_STATUS)
+
+        results = await asyncio.gather(
+            *(executor._resolve_field_ids_for_list_entries(ctx, 12345) for _ in range(5))
+        )
+
+        assert results == [["field-100"]] * 5
+        assert mock_client.lists.get_fields.call_count == 1
+
+    async def test_session_cache_shared_across_executors(
+        self, mock_client: AsyncMock, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Field metadata in the session cache is reused by a later executor run."""
+        monkeypatch.setenv("AFFINITY_SESSION_CACHE", str(tmp_path))
+        config = SessionCacheConfig()
+        config.set_tenant_hash("test-api-key")
+        mock_client.lists.get_fields = AsyncMock(
+            return_value=[FieldMetadata(id="field-100", name="Status", valueType="text")]
+        )
+
+        for _ in range(2):
+            executor = QueryExecutor(
+                mock_client, max_records=100, session_cache=SessionCache(config)
+            )
+            ctx = ExecutionContext(query=_Q_ENTRIES_BY_STATUS)
+            assert await executor._resolve_field_ids_for_list_entries(ctx, 12345) == ["field-100"]
+
+        assert mock_client.lists.get_fields.call_count == 1
+
     @pytest.mark.req("QUERY-EXECUTOR-011")
     async def test_handles_get_fields_error(self, mock_client: AsyncMock) -> None:
         """Returns None if get_fields fails."""
         mock_client.lists.get_fields = AsyncMock(side_effect=Exception("API Error"))
         executor = QueryExecutor(mock_client, max_records=100)
 
-        query = Query(from_="listEntries", group_by="fields.Status")
+        query = _Q_ENTRIES_BY_STATUS
         ctx = ExecutionContext(query=query)
 
         field_ids = await executor._resolve_field_ids_for_list_entries(ctx, 12345)
 
         assert field_ids is None
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-EXECUTOR-013")
     async def test_warns_on_missing_field(self, executor: QueryExecutor) -> None:
         """Adds warning when referenced field doesn't exist on list."""
@@ -2066,7 +2385,6 @@ class TestResolveFieldIdsForListEntries:
         assert "NonExistentField" in ctx.warnings[0]
         assert "Available fields:" in ctx.warnings[0]
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-EXECUTOR-013")
     async def test_warns_on_multiple_missing_fields(self, mock_client: AsyncMock) -> None:
         """Adds warning listing all missing fields."""
@@ -2212,10 +2530,10 @@ class TestNormalizeListEntryFieldsEdgeCases:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestSortEdgeCases:
     """Tests for _execute_sort edge cases."""
 
-    @pytest.mark.asyncio
     async def test_sort_with_null_values_asc(self, mock_client: AsyncMock) -> None:
         """Sort with null values - nulls go to end in ascending order."""
         service = MagicMock()
@@ -2229,7 +2547,7 @@ class TestSortEdgeCases:
 
         query = Query(
             from_="persons",
-            order_by=[OrderByClause(field="name", direction="asc")],
+            order_by=[OrderByClause.model_construct(field="name", direction="asc")],
         )
         plan = ExecutionPlan(
             query=query,
@@ -2254,7 +2572,6 @@ class TestSortEdgeCases:
         assert result.data[1]["name"] == "Bob"
         assert result.data[2]["name"] is None
 
-    @pytest.mark.asyncio
     async def test_sort_with_null_values_desc(self, mock_client: AsyncMock) -> None:
         """Sort with null values - nulls go to end in descending order."""
         service = MagicMock()
@@ -2268,7 +2585,7 @@ class TestSortEdgeCases:
 
         query = Query(
             from_="persons",
-            order_by=[OrderByClause(field="name", direction="desc")],
+            order_by=[OrderByClause.model_construct(field="name", direction="desc")],
         )
         plan = ExecutionPlan(
             query=query,
@@ -2293,7 +2610,6 @@ class TestSortEdgeCases:
         assert result.data[1]["name"] == "Alice"
         assert result.data[2]["name"] is None
 
-    @pytest.mark.asyncio
     async def test_sort_mixed_types_fallback(self, mock_client: AsyncMock) -> None:
         """Sort with mixed types falls back to string comparison."""
         service = MagicMock()
@@ -2307,7 +2623,7 @@ class TestSortEdgeCases:
 
         query = Query(
             from_="persons",
-            order_by=[OrderByClause(field="value", direction="asc")],
+            order_by=[OrderByClause.model_construct(field="value", direction="asc")],
         )
         plan = ExecutionPlan(
             query=query,
@@ -2330,12 +2646,11 @@ class TestSortEdgeCases:
         # Should not raise - falls back to string comparison
         assert len(result.data) == 3
 
-    @pytest.mark.asyncio
     async def test_sort_no_order_by(self, mock_client: AsyncMock, mock_service: AsyncMock) -> None:
         """Sort step with no order_by is a no-op."""
         mock_client.persons = mock_service
 
-        query = Query(from_="persons")  # No order_by
+        query = _Q_PERSONS  # No order_by
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -2364,25 +2679,19 @@ class TestSortEdgeCases:
 
 
 class TestExtractParentIdsEdgeCases:
-    """Additional edge case tests for _extract_parent_ids."""
-
-    @pytest.fixture
-    def executor(self) -> QueryExecutor:
-        """Create QueryExecutor with minimal mock client."""
-        mock_client = MagicMock()
-        return QueryExecutor(mock_client, max_records=100)
+    """Additional edge case tests for _extract_parent_ids_impl."""
 
-    def test_where_not_dict(self, executor: QueryExecutor) -> None:
+    def test_where_not_dict(self) -> None:
         """Returns empty list when where is not a dict."""
-        assert executor._extract_parent_ids("not a dict", "listId") == []
+        assert _extract_parent_ids_impl("not a dict", "listId") == []
 
-    def test_float_value_ignored(self, executor: QueryExecutor) -> None:
+    def test_float_value_ignored(self) -> None:
         """Float values are not converted to int."""
         where = {"path": "listId", "op": "eq", "value": 123.45}
         # Float is not int or str, so to_int returns None
-        assert executor._extract_parent_ids(where, "listId") == []
+        assert _extract_parent_ids_impl(where, "listId") == []
 
-    def test_deeply_nested_and_or(self, executor: QueryExecutor) -> None:
+    def test_deeply_nested_and_or(self) -> None:
         """Handles deeply nested AND/OR structures."""
         where = {
             "and": [
@@ -2395,10 +2704,10 @@ class TestExtractParentIdsEdgeCases:
                 {"path": "listId", "op": "eq", "value": 333},
             ]
         }
-        result = executor._extract_parent_ids(where, "listId")
+        result = _extract_parent_ids_impl(where, "listId")
         assert sorted(result) == [111, 222, 333]
 
-    def test_not_clause_ignored(self, executor: QueryExecutor) -> None:
+    def test_not_clause_ignored(self) -> None:
         """NOT clauses are intentionally not traversed."""
         where = {
             "and": [
@@ -2406,15 +2715,28 @@ class TestExtractParentIdsEdgeCases:
                 {"not": {"path": "listId", "op": "eq", "value": 456}},  # Should be ignored
             ]
         }
-        result = executor._extract_parent_ids(where, "listId")
+        result = _extract_parent_ids_impl(where, "listId")
         assert result == [123]
 
-    def test_string_ids_in_list_converted(self, executor: QueryExecutor) -> None:
+    def test_string_ids_in_list_converted(self) -> None:
         """String IDs in 'in' operator list are converted."""
         where = {"path": "listId", "op": "in", "value": ["100", "200", "300"]}
-        result = executor._extract_parent_ids(where, "listId")
+        result = _extract_parent_ids_impl(where, "listId")
         assert result == [100, 200, 300]
 
+    def test_repeated_string_ids_parsed_once(self) -> None:
+        """String IDs repeated across clauses are parsed from the memo."""
+        _parse_int_string.cache_clear()
+        where = {
+            "or": [
+                {"path": "listId", "op": "in", "value": ["100", "abc", "200"]},
+                {"path": "listId", "op": "in", "value": ["200", "abc", " 100 "]},
+            ]
+        }
+        assert _extract_parent_ids_impl(where, "listId") == [100, 200]
+        info = _parse_int_string.cache_info()
+        assert (info.hits, info.misses) == (2, 4)
+
 
 # =============================================================================
 # Edge Case Tests for _collect_field_refs_from_where
@@ -2433,7 +2755,9 @@ class TestCollectFieldRefsEdgeCases:
         """Collects field names from nested NOT conditions."""
         query = Query(
             from_="listEntries",
-            where=WhereClause(not_=WhereClause(path="fields.Status", op="eq", value="Inactive")),
+            where=WhereClause.model_construct(
+                not_=WhereClause.model_construct(path="fields.Status", op="eq", value="Inactive")
+            ),
         )
         field_names = executor._collect_field_refs_from_query(query)
         assert field_names == {"Status"}
@@ -2442,15 +2766,19 @@ class TestCollectFieldRefsEdgeCases:
         """Collects from deeply nested where clause."""
         query = Query(
             from_="listEntries",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 and_=[
-                    WhereClause(
+                    WhereClause.model_construct(
                         or_=[
-                            WhereClause(path="fields.A", op="eq", value="X"),
-                            WhereClause(not_=WhereClause(path="fields.B", op="eq", value="Y")),
+                            WhereClause.model_construct(path="fields.A", op="eq", value="X"),
+                            WhereClause.model_construct(
+                                not_=WhereClause.model_construct(
+                                    path="fields.B", op="eq", value="Y"
+                                )
+                            ),
                         ]
                     ),
-                    WhereClause(path="fields.C", op="gt", value=100),
+                    WhereClause.model_construct(path="fields.C", op="gt", value=100),
                 ]
             ),
         )
@@ -2470,10 +2798,10 @@ class TestCollectFieldRefsEdgeCases:
         query = Query(
             from_="listEntries",
             aggregate={
-                "min_val": AggregateFunc(min="fields.Min"),
-                "max_val": AggregateFunc(max="fields.Max"),
-                "first_val": AggregateFunc(first="fields.First"),
-                "last_val": AggregateFunc(last="fields.Last"),
+                "min_val": AggregateFunc.model_construct(min="fields.Min"),
+                "max_val": AggregateFunc.model_construct(max="fields.Max"),
+                "first_val": AggregateFunc.model_construct(first="fields.First"),
+                "last_val": AggregateFunc.model_construct(last="fields.Last"),
             },
         )
         field_names = executor._collect_field_refs_from_query(query)
@@ -2493,7 +2821,7 @@ class TestShouldStop:
         mock_client = MagicMock()
         executor = QueryExecutor(mock_client, max_records=10)
 
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         ctx = ExecutionContext(query=query, max_records=10)
         ctx.records = [{"id": i} for i in range(10)]
 
@@ -2504,7 +2832,7 @@ class TestShouldStop:
         mock_client = MagicMock()
         executor = QueryExecutor(mock_client, max_records=100)
 
-        query = Query(from_="persons", limit=5)
+        query = _Q_PERSONS_LIMIT5
         ctx = ExecutionContext(query=query, max_records=100)
         ctx.records = [{"id": i} for i in range(5)]
 
@@ -2515,7 +2843,7 @@ class TestShouldStop:
         mock_client = MagicMock()
         executor = QueryExecutor(mock_client, max_records=100)
 
-        query = Query(from_="persons", limit=10)
+        query = _Q_PERSONS_LIMIT10
         ctx = ExecutionContext(query=query, max_records=100)
         ctx.records = [{"id": i} for i in range(3)]
 
@@ -2526,7 +2854,7 @@ class TestShouldStop:
         mock_client = MagicMock()
         executor = QueryExecutor(mock_client, max_records=5)
 
-        query = Query(from_="persons")  # No limit
+        query = _Q_PERSONS  # No limit
         ctx = ExecutionContext(query=query, max_records=5)
         ctx.records = [{"id": i} for i in range(3)]
 
@@ -2537,7 +2865,7 @@ class TestShouldStop:
         mock_client = MagicMock()
         executor = QueryExecutor(mock_client, max_records=100)
 
-        query = Query(from_="persons", limit=5)
+        query = _Q_PERSONS_LIMIT5
         ctx = ExecutionContext(query=query, max_records=100, needs_full_fetch=True)
         ctx.records = [{"id": i} for i in range(50)]  # Way over limit
 
@@ -2549,7 +2877,7 @@ class TestShouldStop:
         mock_client = MagicMock()
         executor = QueryExecutor(mock_client, max_records=10)
 
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         ctx = ExecutionContext(query=query, max_records=10, needs_full_fetch=True)
         ctx.records = [{"id": i} for i in range(20)]  # Over max_records
 
@@ -2561,45 +2889,54 @@ class TestShouldStop:
         mock_client = MagicMock()
         executor = QueryExecutor(mock_client, max_records=100)
 
-        query = Query(from_="persons", limit=5)
+        query = _Q_PERSONS_LIMIT5
         ctx = ExecutionContext(query=query, max_records=100, needs_full_fetch=False)
         ctx.records = [{"id": i} for i in range(5)]
 
         # With needs_full_fetch=False, should stop at limit
         assert executor._should_stop(ctx) is True
 
+    def test_fetch_stop_at_is_smaller_of_limit_and_max_records(self) -> None:
+        """Precomputed stop threshold combines query limit and max_records."""
+        executor = QueryExecutor(MagicMock(), max_records=100)
+
+        limited = ExecutionContext(query=_Q_PERSONS_LIMIT5, max_records=100)
+        unlimited = ExecutionContext(query=_Q_PERSONS, max_records=100)
+        full = ExecutionContext(query=_Q_PERSONS_LIMIT5, max_records=100, needs_full_fetch=True)
+
+        assert executor._fetch_stop_at(limited) == 5
+        assert executor._fetch_stop_at(unlimited) == 100
+        assert executor._fetch_stop_at(full) is None
+
 
 # =============================================================================
 # Edge Case Tests for _resolve_list_names_to_ids
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestResolveListNamesEdgeCases:
     """Additional edge case tests for _resolve_list_names_to_ids."""
 
-    @pytest.mark.asyncio
     async def test_non_dict_where_passthrough(self) -> None:
         """Non-dict where passes through unchanged."""
         mock_client = MagicMock()
-        mock_client.whoami = AsyncMock(return_value={"id": 1})
+        mock_client.whoami = _async_return({"id": 1})
         executor = QueryExecutor(mock_client, max_records=100)
 
         result = await executor._resolve_list_names_to_ids("not a dict")  # type: ignore[arg-type]
         assert result == "not a dict"
 
-    @pytest.mark.asyncio
     async def test_unknown_list_in_multiple_raises(self) -> None:
         """Unknown list in 'in' operator raises error."""
-        mock_list = MagicMock()
-        mock_list.name = "Known List"
-        mock_list.id = 12345
+        mock_list = _FakeList(id=12345, name="Known List")
 
         async def mock_lists_all():
             yield mock_list
 
         mock_client = MagicMock()
         mock_client.lists.all = mock_lists_all
-        mock_client.whoami = AsyncMock(return_value={"id": 1})
+        mock_client.whoami = _async_return({"id": 1})
 
         executor = QueryExecutor(mock_client, max_records=100)
 
@@ -2607,19 +2944,16 @@ class TestResolveListNamesEdgeCases:
         with pytest.raises(QueryExecutionError, match="List not found: 'Unknown List'"):
             await executor._resolve_list_names_to_ids(where)
 
-    @pytest.mark.asyncio
     async def test_or_conditions_resolved(self) -> None:
         """OR conditions are recursively resolved."""
-        mock_list = MagicMock()
-        mock_list.name = "Deals"
-        mock_list.id = 111
+        mock_list = _FakeList(id=111, name="Deals")
 
         async def mock_lists_all():
             yield mock_list
 
         mock_client = MagicMock()
         mock_client.lists.all = mock_lists_all
-        mock_client.whoami = AsyncMock(return_value={"id": 1})
+        mock_client.whoami = _async_return({"id": 1})
 
         executor = QueryExecutor(mock_client, max_records=100)
 
@@ -2639,17 +2973,17 @@ class TestResolveListNamesEdgeCases:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestAggregateStepEdgeCases:
     """Tests for _execute_aggregate edge cases."""
 
-    @pytest.mark.asyncio
     async def test_aggregate_no_aggregate_clause(
         self, mock_client: AsyncMock, mock_service: AsyncMock
     ) -> None:
         """Aggregate step with no aggregate clause is a no-op."""
         mock_client.persons = mock_service
 
-        query = Query(from_="persons")  # No aggregate
+        query = _Q_PERSONS  # No aggregate
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -2677,10 +3011,10 @@ class TestAggregateStepEdgeCases:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestExecuteInclude:
     """Tests for _execute_include method."""
 
-    @pytest.mark.asyncio
     async def test_include_entity_method_strategy(self, mock_client: AsyncMock) -> None:
         """Test include with entity_method fetch strategy."""
         # Setup persons service
@@ -2704,7 +3038,7 @@ class TestExecuteInclude:
         companies_service.iter = mock_companies_iter
         mock_client.companies = companies_service
 
-        query = Query(from_="persons", include=["companies"])
+        query = _Q_PERSONS_WITH_COMPANIES
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -2743,7 +3077,55 @@ class TestExecuteInclude:
         assert len(result.included_by_parent["companies"][1]) == 2  # Alice has 2 companies
         assert len(result.included_by_parent["companies"][2]) == 1  # Bob has 1 company
 
-    @pytest.mark.asyncio
+    async def test_adjacent_includes_run_concurrently(
+        self, mock_client: AsyncMock, plan_factory: Callable[..., ExecutionPlan]
+    ) -> None:
+        """Consecutive include steps overlap; included keeps the query's order."""
+        notes_listed = asyncio.Event()
+
+        persons_service = MagicMock()
+        persons_service.all.return_value = create_mock_page_iterator([{"id": 1}])
+
+        async def company_ids(_person_id: int) -> list[int]:
+            # Only completes if the notes include runs alongside this one
+            await notes_listed.wait()
+            return []
+
+        persons_service.get_associated_company_ids = company_ids
+        mock_client.persons = persons_service
+
+        async def list_notes(**_kwargs: Any) -> SimpleNamespace:
+            notes_listed.set()
+            note = MagicMock(model_dump=MagicMock(return_value={"id": 7}))
+            return SimpleNamespace(data=[note])
+
+        mock_client.notes = MagicMock(list=list_notes)
+
+        query = Query(from_="persons", include=["companies", "notes"])
+        plan = replace(
+            plan_factory(query, "fetch"),
+            steps=[
+                PlanStep(step_id=0, operation="fetch", entity="persons", description="Fetch"),
+                *(
+                    PlanStep(
+                        step_id=step_id,
+                        operation="include",
+                        entity="persons",
+                        relationship=rel_name,
+                        description=f"Include {rel_name}",
+                        depends_on=[step_id - 1],
+                    )
+                    for step_id, rel_name in ((1, "companies"), (2, "notes"))
+                ),
+            ],
+        )
+
+        executor = QueryExecutor(mock_client)
+        result = await asyncio.wait_for(executor.execute(plan), timeout=5)
+
+        assert list(result.included) == ["companies", "notes"]
+        assert result.included["notes"] == [{"id": 7}]
+
     async def test_include_global_service_strategy(self, mock_client: AsyncMock) -> None:
         """Test include with global_service fetch strategy."""
         # Setup persons service
@@ -2796,7 +3178,6 @@ class TestExecuteInclude:
         assert "notes" in result.included
         assert len(result.included["notes"]) == 2
 
-    @pytest.mark.asyncio
     async def test_include_unknown_relationship_raises(self, mock_client: AsyncMock) -> None:
         """Test include with unknown relationship raises error."""
         persons_service = MagicMock()
@@ -2831,7 +3212,6 @@ class TestExecuteInclude:
         with pytest.raises(QueryExecutionError, match="Unknown relationship"):
             await executor.execute(plan)
 
-    @pytest.mark.asyncio
     async def test_include_with_missing_entity_skipped(self, mock_client: AsyncMock) -> None:
         """Test include step with no entity/relationship is skipped."""
         persons_service = MagicMock()
@@ -2839,7 +3219,7 @@ class TestExecuteInclude:
         persons_service.all.return_value = create_mock_page_iterator(records)
         mock_client.persons = persons_service
 
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -2868,7 +3248,6 @@ class TestExecuteInclude:
         # Should complete without error
         assert len(result.data) == 1
 
-    @pytest.mark.asyncio
     async def test_include_entity_method_handles_errors(self, mock_client: AsyncMock) -> None:
         """Test include gracefully handles errors in entity method calls."""
         persons_service = MagicMock()
@@ -2893,7 +3272,7 @@ class TestExecuteInclude:
         companies_service.iter = mock_companies_iter
         mock_client.companies = companies_service
 
-        query = Query(from_="persons", include=["companies"])
+        query = _Q_PERSONS_WITH_COMPANIES
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -2930,7 +3309,6 @@ class TestExecuteInclude:
         assert len(result.included_by_parent["companies"][1]) == 1  # Alice has 1 company
         assert len(result.included_by_parent["companies"][2]) == 0  # Bob has 0 (error)
 
-    @pytest.mark.asyncio
     async def test_include_record_missing_id(self, mock_client: AsyncMock) -> None:
         """Test include skips records without id field."""
         persons_service = MagicMock()
@@ -2940,7 +3318,7 @@ class TestExecuteInclude:
         persons_service.get_associated_company_ids = AsyncMock(return_value=[100])
         mock_client.persons = persons_service
 
-        query = Query(from_="persons", include=["companies"])
+        query = _Q_PERSONS_WITH_COMPANIES
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -2970,7 +3348,6 @@ class TestExecuteInclude:
         assert len(result.data) == 1
         assert result.included["companies"] == []
 
-    @pytest.mark.asyncio
     @pytest.mark.req("QUERY-INCLUDE-BATCH-001")
     async def test_batch_fetch_handles_deleted_entities(self, mock_client: AsyncMock) -> None:
         """Test batch fetch gracefully handles deleted/missing entities.
@@ -3002,7 +3379,7 @@ class TestExecuteInclude:
         companies_service.iter = mock_companies_iter
         mock_client.companies = companies_service
 
-        query = Query(from_="persons", include=["companies"])
+        query = _Q_PERSONS_WITH_COMPANIES
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -3062,10 +3439,10 @@ class TestExecuteInclude:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestAggregateWithGroupByAndHaving:
     """Tests for _execute_aggregate with groupBy and HAVING."""
 
-    @pytest.mark.asyncio
     async def test_aggregate_groupby_with_having(self, mock_client: AsyncMock) -> None:
         """Test aggregate with groupBy and HAVING filter."""
         from affinity.cli.query.models import HavingClause
@@ -3083,7 +3460,10 @@ class TestAggregateWithGroupByAndHaving:
         query = Query(
             from_="persons",
             group_by="status",
-            aggregate={"total": AggregateFunc(sum="amount"), "count": AggregateFunc(count=True)},
+            aggregate={
+                "total": AggregateFunc.model_construct(sum="amount"),
+                "count": AggregateFunc.model_construct(count=True),
+            },
             having=HavingClause(path="total", op="gt", value=100),
         )
         plan = ExecutionPlan(
@@ -3111,7 +3491,6 @@ class TestAggregateWithGroupByAndHaving:
         assert "Pending" in statuses
         assert "Inactive" not in statuses
 
-    @pytest.mark.asyncio
     async def test_aggregate_groupby_without_having(self, mock_client: AsyncMock) -> None:
         """Test aggregate with groupBy but no HAVING."""
         service = MagicMock()
@@ -3126,7 +3505,7 @@ class TestAggregateWithGroupByAndHaving:
         query = Query(
             from_="persons",
             group_by="status",
-            aggregate={"total": AggregateFunc(sum="amount")},
+            aggregate={"total": AggregateFunc.model_construct(sum="amount")},
             # No having clause
         )
         plan = ExecutionPlan(
@@ -3156,10 +3535,10 @@ class TestAggregateWithGroupByAndHaving:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestKeyboardInterruptHandling:
     """Tests for KeyboardInterrupt handling."""
 
-    @pytest.mark.asyncio
     async def test_interrupt_without_allow_partial_raises(self, mock_client: AsyncMock) -> None:
         """KeyboardInterrupt without allow_partial raises QueryInterruptedError."""
         from affinity.cli.query import QueryInterruptedError
@@ -3178,7 +3557,7 @@ class TestKeyboardInterruptHandling:
         service.all.return_value = InterruptingPageIterator()
         mock_client.persons = service
 
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         plan = ExecutionPlan(
             query=query,
             steps=[PlanStep(step_id=0, operation="fetch", entity="persons", description="Fetch")],
@@ -3197,7 +3576,6 @@ class TestKeyboardInterruptHandling:
 
         assert "interrupted" in str(exc.value).lower()
 
-    @pytest.mark.asyncio
     async def test_interrupt_with_allow_partial_returns_results(
         self, mock_client: AsyncMock
     ) -> None:
@@ -3223,7 +3601,7 @@ class TestKeyboardInterruptHandling:
         service.all.return_value = PartialPageIterator()
         mock_client.persons = service
 
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         plan = ExecutionPlan(
             query=query,
             steps=[PlanStep(step_id=0, operation="fetch", entity="persons", description="Fetch")],
@@ -3243,6 +3621,121 @@ class TestKeyboardInterruptHandling:
         assert len(result.data) == 2
         assert result.meta["interrupted"] is True
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="os.kill(SIGINT) needs Unix")
+    async def test_sigint_cancels_fetch_and_returns_partial(self, mock_client: AsyncMock) -> None:
+        """SIGINT during a fetch cancels it and returns partial results."""
+        service = MagicMock()
+
+        class SignallingPageIterator:
+            def pages(self, on_progress=None):  # noqa: ARG002
+                async def generator():
+                    page = MagicMock()
+                    page.data = [create_mock_record({"id": 1, "name": "Alice"})]
+                    yield page
+                    os.kill(os.getpid(), signal.SIGINT)
+                    await asyncio.sleep(10)
+                    yield page
+
+                return generator()
+
+        service.all.return_value = SignallingPageIterator()
+        mock_client.persons = service
+
+        query = _Q_PERSONS
+        plan = ExecutionPlan(
+            query=query,
+            steps=[PlanStep(step_id=0, operation="fetch", entity="persons", description="Fetch")],
+            total_api_calls=1,
+            estimated_records_fetched=100,
+            estimated_memory_mb=0.1,
+            warnings=[],
+            recommendations=[],
+            has_expensive_operations=False,
+            requires_full_scan=False,
+        )
+
+        executor = QueryExecutor(mock_client, allow_partial=True)
+        previous_handler = signal.getsignal(signal.SIGINT)
+        result = await asyncio.wait_for(executor.execute(plan), timeout=5)
+
+        assert [r["id"] for r in result.data] == [1]
+        assert result.meta["interrupted"] is True
+        # The handler that was installed before the query is back in place
+        assert signal.getsignal(signal.SIGINT) is previous_handler
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="os.kill(SIGINT) needs Unix")
+    async def test_sigint_during_sync_sort_returns_partial(
+        self, mock_client: AsyncMock, make_service: Callable[[list[dict]], MagicMock]
+    ) -> None:
+        """SIGINT during a synchronous step with no await after it still interrupts."""
+        mock_client.persons = make_service([{"id": 1, "value": 2}, {"id": 2, "value": 1}])
+        executor = QueryExecutor(mock_client, allow_partial=True)
+        sort = executor._execute_sort
+
+        def signalling_sort(step: PlanStep, ctx: ExecutionContext) -> None:
+            os.kill(os.getpid(), signal.SIGINT)
+            sort(step, ctx)
+
+        with patch.object(executor, "_execute_sort", side_effect=signalling_sort):
+            result = await executor.execute(_SORT_PLANS["asc"])
+        # No cancel is left pending on the task once the query has returned
+        await asyncio.sleep(0)
+
+        assert [r["id"] for r in result.data] == [2, 1]
+        assert result.meta["interrupted"] is True
+
+    async def test_sigint_handler_restores_previous_handler(self) -> None:
+        """The SIGINT handler installed before a query is put back afterwards."""
+        from affinity.cli.query.executor import ExecutionContext, _cancel_on_sigint
+
+        def host_handler(_signum: int, _frame: Any) -> None:
+            pass
+
+        original = signal.signal(signal.SIGINT, host_handler)
+        try:
+            with _cancel_on_sigint(ExecutionContext(query=_Q_PERSONS)):
+                assert signal.getsignal(signal.SIGINT) is not host_handler
+            assert signal.getsignal(signal.SIGINT) is host_handler
+        finally:
+            signal.signal(signal.SIGINT, original)
+
+    async def test_external_cancellation_propagates(self, mock_client: AsyncMock) -> None:
+        """Cancellation not caused by SIGINT is not turned into an interrupt."""
+        service = MagicMock()
+        started = asyncio.Event()
+
+        class BlockingPageIterator:
+            def pages(self, on_progress=None):  # noqa: ARG002
+                async def generator():
+                    started.set()
+                    await asyncio.sleep(10)
+                    yield MagicMock()
+
+                return generator()
+
+        service.all.return_value = BlockingPageIterator()
+        mock_client.persons = service
+
+        query = _Q_PERSONS
+        plan = ExecutionPlan(
+            query=query,
+            steps=[PlanStep(step_id=0, operation="fetch", entity="persons", description="Fetch")],
+            total_api_calls=1,
+            estimated_records_fetched=100,
+            estimated_memory_mb=0.1,
+            warnings=[],
+            recommendations=[],
+            has_expensive_operations=False,
+            requires_full_scan=False,
+        )
+
+        executor = QueryExecutor(mock_client, allow_partial=True)
+        task = asyncio.create_task(executor.execute(plan))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
 
 # =============================================================================
 # Tests for Parent ID Extraction with IN Operator
@@ -3250,38 +3743,43 @@ class TestKeyboardInterruptHandling:
 
 
 class TestExtractParentIdsWithInOperator:
-    """Tests for _extract_parent_ids with IN operator."""
-
-    @pytest.fixture
-    def executor(self) -> QueryExecutor:
-        """Create executor for testing."""
-        return QueryExecutor(MagicMock(), max_records=100)
+    """Tests for _extract_parent_ids_impl with IN operator."""
 
-    def test_in_operator_extracts_multiple_ids(self, executor: QueryExecutor) -> None:
+    def test_in_operator_extracts_multiple_ids(self) -> None:
         """IN operator extracts all IDs from list."""
         where = {"path": "listId", "op": "in", "value": [100, 200, 300]}
-        result = executor._extract_parent_ids(where, "listId")
+        result = _extract_parent_ids_impl(where, "listId")
         assert result == [100, 200, 300]
 
-    def test_in_operator_with_string_ids(self, executor: QueryExecutor) -> None:
+    def test_in_operator_with_string_ids(self) -> None:
         """IN operator converts string IDs to int."""
         where = {"path": "listId", "op": "in", "value": ["100", "200"]}
-        result = executor._extract_parent_ids(where, "listId")
+        result = _extract_parent_ids_impl(where, "listId")
         assert result == [100, 200]
 
-    def test_in_operator_skips_invalid_values(self, executor: QueryExecutor) -> None:
+    def test_in_operator_skips_invalid_values(self) -> None:
         """IN operator skips non-convertible values."""
         where = {"path": "listId", "op": "in", "value": [100, "abc", 200, None]}
-        result = executor._extract_parent_ids(where, "listId")
+        result = _extract_parent_ids_impl(where, "listId")
         assert result == [100, 200]
 
-    def test_in_operator_with_non_list_returns_empty(self, executor: QueryExecutor) -> None:
+    def test_in_operator_string_id_edge_cases(self) -> None:
+        """Padded and signed numeric strings convert; other digit-like strings are skipped."""
+        where = {
+            "path": "listId",
+            "op": "in",
+            "value": [" 100 ", "+200", "-3", "", "-", "²", "1.5"],
+        }
+        result = _extract_parent_ids_impl(where, "listId")
+        assert result == [100, 200, -3]
+
+    def test_in_operator_with_non_list_returns_empty(self) -> None:
         """IN operator with non-list value returns empty."""
         where = {"path": "listId", "op": "in", "value": "not a list"}
-        result = executor._extract_parent_ids(where, "listId")
+        result = _extract_parent_ids_impl(where, "listId")
         assert result == []
 
-    def test_combined_eq_and_in_in_or(self, executor: QueryExecutor) -> None:
+    def test_combined_eq_and_in_in_or(self) -> None:
         """OR with eq and in operators extracts all IDs."""
         where = {
             "or": [
@@ -3289,9 +3787,21 @@ class TestExtractParentIdsWithInOperator:
                 {"path": "listId", "op": "in", "value": [200, 300]},
             ]
         }
-        result = executor._extract_parent_ids(where, "listId")
+        result = _extract_parent_ids_impl(where, "listId")
         assert sorted(result) == [100, 200, 300]
 
+    def test_duplicate_ids_across_branches_keep_first_order(self) -> None:
+        """IDs repeated across OR branches are returned once, in first-seen order."""
+        where = {
+            "or": [
+                {"path": "listId", "op": "in", "value": [300, 100]},
+                {"path": "listId", "op": "eq", "value": "100"},
+                {"path": "listId", "op": "in", "value": [200, 300]},
+            ]
+        }
+        result = _extract_parent_ids_impl(where, "listId")
+        assert result == [300, 100, 200]
+
 
 # =============================================================================
 # Tests for Field Refs Collection from Aggregates
@@ -3310,7 +3820,7 @@ class TestCollectFieldRefsFromAggregates:
         """Collects field from sum aggregate."""
         query = Query(
             from_="listEntries",
-            aggregate={"total": AggregateFunc(sum="fields.Amount")},
+            aggregate={"total": AggregateFunc.model_construct(sum="fields.Amount")},
         )
         fields = executor._collect_field_refs_from_query(query)
         assert fields == {"Amount"}
@@ -3319,7 +3829,7 @@ class TestCollectFieldRefsFromAggregates:
         """Collects field from avg aggregate."""
         query = Query(
             from_="listEntries",
-            aggregate={"average": AggregateFunc(avg="fields.Score")},
+            aggregate={"average": AggregateFunc.model_construct(avg="fields.Score")},
         )
         fields = executor._collect_field_refs_from_query(query)
         assert fields == {"Score"}
@@ -3328,7 +3838,9 @@ class TestCollectFieldRefsFromAggregates:
         """Collects field from percentile aggregate."""
         query = Query(
             from_="listEntries",
-            aggregate={"p90": AggregateFunc(percentile={"field": "fields.Value", "p": 90})},
+            aggregate={
+                "p90": AggregateFunc.model_construct(percentile={"field": "fields.Value", "p": 90})
+            },
         )
         fields = executor._collect_field_refs_from_query(query)
         assert fields == {"Value"}
@@ -3337,7 +3849,7 @@ class TestCollectFieldRefsFromAggregates:
         """Wildcard in aggregate returns {'*'}."""
         query = Query(
             from_="listEntries",
-            aggregate={"first": AggregateFunc(first="fields.*")},
+            aggregate={"first": AggregateFunc.model_construct(first="fields.*")},
         )
         fields = executor._collect_field_refs_from_query(query)
         assert fields == {"*"}
@@ -3347,7 +3859,7 @@ class TestCollectFieldRefsFromAggregates:
         query = Query(
             from_="listEntries",
             group_by="fields.*",
-            aggregate={"count": AggregateFunc(count=True)},
+            aggregate={"count": AggregateFunc.model_construct(count=True)},
         )
         fields = executor._collect_field_refs_from_query(query)
         assert fields == {"*"}
@@ -3357,9 +3869,9 @@ class TestCollectFieldRefsFromAggregates:
         query = Query(
             from_="listEntries",
             aggregate={
-                "sum": AggregateFunc(sum="fields.Amount"),
-                "avg": AggregateFunc(avg="fields.Score"),
-                "min": AggregateFunc(min="fields.Price"),
+                "sum": AggregateFunc.model_construct(sum="fields.Amount"),
+                "avg": AggregateFunc.model_construct(avg="fields.Score"),
+                "min": AggregateFunc.model_construct(min="fields.Price"),
             },
         )
         fields = executor._collect_field_refs_from_query(query)
@@ -3369,7 +3881,7 @@ class TestCollectFieldRefsFromAggregates:
         """Query without field refs returns empty set."""
         query = Query(
             from_="listEntries",
-            aggregate={"count": AggregateFunc(count=True)},
+            aggregate={"count": AggregateFunc.model_construct(count=True)},
         )
         fields = executor._collect_field_refs_from_query(query)
         assert fields == set()
@@ -3378,27 +3890,46 @@ class TestCollectFieldRefsFromAggregates:
         """Percentile with wildcard field returns {'*'}."""
         query = Query(
             from_="listEntries",
-            aggregate={"p50": AggregateFunc(percentile={"field": "fields.*", "p": 50})},
+            aggregate={
+                "p50": AggregateFunc.model_construct(percentile={"field": "fields.*", "p": 50})
+            },
         )
         fields = executor._collect_field_refs_from_query(query)
         assert fields == {"*"}
 
+    def test_result_is_cached_per_query(self, executor: QueryExecutor) -> None:
+        """Repeated calls for the same query return the cached frozenset."""
+        query = Query(
+            from_="listEntries",
+            aggregate={"total": AggregateFunc.model_construct(sum="fields.Amount")},
+        )
+        first = executor._collect_field_refs_from_query(query)
+        second = executor._collect_field_refs_from_query(query)
+        assert isinstance(first, frozenset)
+        assert second is first
+
+        other = Query(
+            from_="listEntries",
+            aggregate={"total": AggregateFunc.model_construct(sum="fields.Score")},
+        )
+        assert executor._collect_field_refs_from_query(other) == {"Score"}
+
 
 # =============================================================================
 # Tests for _execute_filter with Resolved Where
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestExecuteFilterWithResolvedWhere:
     """Tests for _execute_filter using resolved where clause."""
 
-    @pytest.mark.asyncio
     async def test_filter_uses_resolved_where(self, mock_client: AsyncMock) -> None:
         """Filter step uses resolved where clause when available."""
         # Create executor context directly to test resolved_where
         query = Query(
             from_="listEntries",
-            where=WhereClause(path="listName", op="eq", value="My List"),
+            where=WhereClause.model_construct(path="listName", op="eq", value="My List"),
         )
         ctx = ExecutionContext(query=query, max_records=100)
 
@@ -3420,14 +3951,13 @@ class TestExecuteFilterWithResolvedWhere:
         assert len(ctx.records) == 1
         assert ctx.records[0]["listId"] == 123
 
-    @pytest.mark.asyncio
     async def test_filter_without_resolved_where_uses_query_where(
         self, mock_client: AsyncMock
     ) -> None:
         """Filter step uses query.where when resolved_where is None."""
         query = Query(
             from_="persons",
-            where=WhereClause(path="name", op="eq", value="Alice"),
+            where=WhereClause.model_construct(path="name", op="eq", value="Alice"),
         )
         ctx = ExecutionContext(query=query, max_records=100)
         ctx.records = [
@@ -3444,10 +3974,43 @@ class TestExecuteFilterWithResolvedWhere:
         assert len(ctx.records) == 1
         assert ctx.records[0]["name"] == "Alice"
 
-    @pytest.mark.asyncio
+    async def test_unresolved_where_not_revalidated(self, mock_client: AsyncMock) -> None:
+        """A where clause without listName is filtered as given, not dumped and re-parsed."""
+        from affinity.cli.query.planner import create_planner
+
+        async def pages(**_kwargs):
+            yield SimpleNamespace(
+                data=[
+                    create_mock_record({"id": i, "listId": 100, "name": name})
+                    for i, name in enumerate(["Alice", "Bob"], start=1)
+                ],
+                next_cursor=None,
+            )
+
+        mock_client.lists.entries = MagicMock(return_value=SimpleNamespace(pages=pages))
+        mock_client.lists.get_fields = AsyncMock(return_value=[])
+        query = Query(
+            from_="listEntries",
+            where=WhereClause(
+                and_=[
+                    WhereClause(path="listId", op="eq", value=100),
+                    WhereClause(path="name", op="eq", value="Bob"),
+                ]
+            ),
+            order_by=[OrderByClause.model_construct(field="id", direction="asc")],
+        )
+        plan = create_planner().plan(query)
+
+        with patch.object(
+            WhereClause, "model_validate", side_effect=AssertionError("re-validated")
+        ):
+            result = await QueryExecutor(mock_client, max_records=100).execute(plan)
+
+        assert [r["id"] for r in result.data] == [2]
+
     async def test_filter_with_no_where_clause_keeps_all(self, mock_client: AsyncMock) -> None:
         """Filter step with no where clause keeps all records."""
-        query = Query(from_="persons")  # No where
+        query = _Q_PERSONS  # No where
         ctx = ExecutionContext(query=query, max_records=100)
         ctx.records = [{"id": 1}, {"id": 2}, {"id": 3}]
 
@@ -3458,12 +4021,11 @@ class TestExecuteFilterWithResolvedWhere:
 
         assert len(ctx.records) == 3
 
-    @pytest.mark.asyncio
     async def test_filter_with_normalized_alias_entityName(self, mock_client: AsyncMock) -> None:
         """Filter works with normalized entityName alias on listEntries."""
         query = Query(
             from_="listEntries",
-            where=WhereClause(path="entityName", op="contains", value="Acme"),
+            where=WhereClause.model_construct(path="entityName", op="contains", value="Acme"),
         )
         ctx = ExecutionContext(query=query, max_records=100)
         # Records after normalization (entityName alias added)
@@ -3483,19 +4045,177 @@ class TestExecuteFilterWithResolvedWhere:
         assert ctx.records[0]["entityName"] == "Acme Corp"
         assert ctx.records[1]["entityName"] == "Acme Labs"
 
+    async def test_filter_and_limit_stop_fetch_early(self, mock_client: AsyncMock) -> None:
+        """With only fetch/filter/limit steps, fetch stops once enough records match."""
+        from affinity.cli.query.planner import create_planner
+
+        pages_fetched = 0
+
+        async def pages(**_kwargs):
+            nonlocal pages_fetched
+            for start in (1, 4, 7):
+                pages_fetched += 1
+                yield SimpleNamespace(
+                    data=[
+                        create_mock_record(
+                            {"id": i, "listId": 100, "name": "Acme" if i % 2 else "Beta"}
+                        )
+                        for i in range(start, start + 3)
+                    ],
+                    next_cursor=f"after-{start}",
+                )
+
+        mock_client.lists.entries = MagicMock(return_value=SimpleNamespace(pages=pages))
+        mock_client.lists.get_fields = AsyncMock(return_value=[])
+
+        query = Query(
+            from_="listEntries",
+            where=WhereClause.model_construct(
+                and_=[
+                    WhereClause.model_construct(path="listId", op="eq", value=100),
+                    WhereClause.model_construct(path="name", op="eq", value="Acme"),
+                ]
+            ),
+            limit=2,
+        )
+        plan = create_planner().plan(query)
+
+        executor = QueryExecutor(mock_client, max_records=100)
+        result = await executor.execute(plan)
+
+        assert [r["id"] for r in result.data] == [1, 3]
+        assert pages_fetched == 1
+
+    async def test_multi_list_fetch_loads_field_metadata_once(self, mock_client: AsyncMock) -> None:
+        """Only the list used for field selection has its field metadata fetched."""
+        from affinity.cli.query.planner import create_planner
+
+        def entries(list_id: Any) -> SimpleNamespace:
+            async def pages(**_kwargs):
+                yield SimpleNamespace(
+                    data=[
+                        create_mock_record(
+                            {
+                                "id": int(list_id) + i,
+                                "listId": int(list_id),
+                                "fields": {"Status": s},
+                            }
+                        )
+                        for i, s in enumerate(("Active", "Lost"))
+                    ],
+                    next_cursor=None,
+                )
+
+            return SimpleNamespace(pages=pages, all=lambda: SimpleNamespace(pages=pages))
+
+        mock_client.lists.entries = MagicMock(side_effect=entries)
+        mock_client.lists.get_fields = AsyncMock(
+            return_value=[_FakeField(id="field-1", name="Status")]
+        )
+        where = WhereClause.model_construct(
+            and_=[
+                WhereClause.model_construct(path="listId", op="in", value=[100, 200]),
+                WhereClause.model_construct(path="fields.Status", op="eq", value="Active"),
+            ]
+        )
+        plan = create_planner().plan(Query(from_="listEntries", where=where))
+
+        result = await QueryExecutor(mock_client, max_records=100).execute(plan)
+
+        assert [r["id"] for r in result.data] == [100, 200]
+        mock_client.lists.get_fields.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        ("where", "expected_kwargs"),
+        [
+            pytest.param(
+                WhereClause.model_construct(path="listId", op="eq", value=100),
+                {"limit": 2},
+                id="parent-only",
+            ),
+            pytest.param(
+                WhereClause.model_construct(
+                    and_=[
+                        WhereClause.model_construct(path="listId", op="eq", value=100),
+                        WhereClause.model_construct(path="name", op="eq", value="Acme"),
+                    ]
+                ),
+                {},
+                id="filtered",
+            ),
+        ],
+    )
+    async def test_small_limit_pushed_down_as_page_size(
+        self, mock_client: AsyncMock, where: WhereClause, expected_kwargs: dict[str, Any]
+    ) -> None:
+        """A limit below the page size is requested from the API unless rows get filtered."""
+        from affinity.cli.query.planner import create_planner
+
+        requested: list[dict[str, Any]] = []
+
+        async def pages(**kwargs):
+            requested.append(kwargs)
+            yield SimpleNamespace(
+                data=[
+                    create_mock_record({"id": i, "listId": 100, "name": "Acme"}) for i in range(3)
+                ],
+                next_cursor=None,
+            )
+
+        mock_client.lists.entries = MagicMock(return_value=SimpleNamespace(pages=pages))
+        mock_client.lists.get_fields = AsyncMock(return_value=[])
+        plan = create_planner().plan(Query(from_="listEntries", where=where, limit=2))
+
+        result = await QueryExecutor(mock_client, max_records=100).execute(plan)
+
+        assert [r["id"] for r in result.data] == [0, 1]
+        assert requested == [expected_kwargs]
+
+    async def test_full_fetch_reads_list_entry_pages_ahead(self, mock_client: AsyncMock) -> None:
+        """When every page is needed, list entry pages are prefetched."""
+        from affinity.cli.query import executor as executor_module
+        from affinity.cli.query.planner import create_planner
+
+        async def pages(**_kwargs):
+            for start in (1, 4):
+                yield SimpleNamespace(
+                    data=[
+                        create_mock_record({"id": i, "listId": 100})
+                        for i in range(start, start + 3)
+                    ],
+                    next_cursor=None,
+                )
+
+        mock_client.lists.entries = MagicMock(return_value=SimpleNamespace(pages=pages))
+        mock_client.lists.get_fields = AsyncMock(return_value=[])
+        query = Query(
+            from_="listEntries",
+            where=WhereClause.model_construct(path="listId", op="eq", value=100),
+            order_by=[OrderByClause.model_construct(field="id", direction="desc")],
+        )
+        plan = create_planner().plan(query)
+
+        with patch.object(
+            executor_module, "prefetch", wraps=executor_module.prefetch
+        ) as read_ahead:
+            result = await QueryExecutor(mock_client, max_records=100).execute(plan)
+
+        assert [r["id"] for r in result.data] == [6, 5, 4, 3, 2, 1]
+        read_ahead.assert_called_once()
+
 
 # =============================================================================
 # Tests for Fetch Errors
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestFetchErrors:
     """Tests for fetch error handling."""
 
-    @pytest.mark.asyncio
     async def test_fetch_missing_entity_raises(self, mock_client: AsyncMock) -> None:
         """Fetch step without entity raises error."""
-        query = Query(from_="persons")
+        query = _Q_PERSONS
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -3519,7 +4239,6 @@ class TestFetchErrors:
         with pytest.raises(QueryExecutionError, match="missing entity"):
             await executor.execute(plan)
 
-    @pytest.mark.asyncio
     async def test_fetch_unknown_entity_raises(self, mock_client: AsyncMock) -> None:
         """Fetch step with unknown entity raises error."""
         query = Query(from_="unknown_entity")
@@ -3543,8 +4262,10 @@ class TestFetchErrors:
         )
 
         executor = QueryExecutor(mock_client)
-        with pytest.raises(QueryExecutionError, match="Unknown entity"):
+        with pytest.raises(QueryExecutionError, match="Unknown entity") as exc:
             await executor.execute(plan)
+        assert "listEntries" in str(exc.value)
+        assert "notes" not in str(exc.value)
 
 
 # =============================================================================
@@ -3565,24 +4286,24 @@ class TestNeedsFullRecords:
         """Returns False when only id field is referenced."""
         from affinity.cli.query.executor import _needs_full_records
 
-        where = WhereClause(path="id", op="gt", value=0)
+        where = WhereClause.model_construct(path="id", op="gt", value=0)
         assert _needs_full_records(where) is False
 
     def test_returns_true_for_non_id_field(self) -> None:
         """Returns True when non-id field is referenced."""
         from affinity.cli.query.executor import _needs_full_records
 
-        where = WhereClause(path="name", op="contains", value="Acme")
+        where = WhereClause.model_construct(path="name", op="contains", value="Acme")
         assert _needs_full_records(where) is True
 
     def test_returns_true_for_nested_non_id(self) -> None:
         """Returns True when non-id field is in compound clause."""
         from affinity.cli.query.executor import _needs_full_records
 
-        where = WhereClause(
+        where = WhereClause.model_construct(
             and_=[
-                WhereClause(path="id", op="gt", value=0),
-                WhereClause(path="name", op="contains", value="Inc"),
+                WhereClause.model_construct(path="id", op="gt", value=0),
+                WhereClause.model_construct(path="name", op="contains", value="Inc"),
             ]
         )
         assert _needs_full_records(where) is True
@@ -3606,10 +4327,10 @@ class TestAnyQuantifierNeedsFullRecords:
         from affinity.cli.query.schema import SCHEMA_REGISTRY
 
         schema = SCHEMA_REGISTRY["persons"]
-        where = WhereClause(
+        where = WhereClause.model_construct(
             all_=QuantifierClause(
                 path="companies",
-                where=WhereClause(path="id", op="gt", value=0),
+                where=WhereClause.model_construct(path="id", op="gt", value=0),
             )
         )
         assert _any_quantifier_needs_full_records(where, "companies", schema) is False
@@ -3621,10 +4342,10 @@ class TestAnyQuantifierNeedsFullRecords:
         from affinity.cli.query.schema import SCHEMA_REGISTRY
 
         schema = SCHEMA_REGISTRY["persons"]
-        where = WhereClause(
+        where = WhereClause.model_construct(
             all_=QuantifierClause(
                 path="companies",
-                where=WhereClause(path="name", op="contains", value="Inc"),
+                where=WhereClause.model_construct(path="name", op="contains", value="Inc"),
             )
         )
         assert _any_quantifier_needs_full_records(where, "companies", schema) is True
@@ -3637,18 +4358,18 @@ class TestAnyQuantifierNeedsFullRecords:
 
         schema = SCHEMA_REGISTRY["persons"]
         # First quantifier only needs id, second needs name
-        where = WhereClause(
+        where = WhereClause.model_construct(
             and_=[
-                WhereClause(
+                WhereClause.model_construct(
                     all_=QuantifierClause(
                         path="companies",
-                        where=WhereClause(path="id", op="gt", value=0),
+                        where=WhereClause.model_construct(path="id", op="gt", value=0),
                     )
                 ),
-                WhereClause(
+                WhereClause.model_construct(
                     none_=QuantifierClause(
                         path="companies",
-                        where=WhereClause(path="name", op="contains", value="Spam"),
+                        where=WhereClause.model_construct(path="name", op="contains", value="Spam"),
                     )
                 ),
             ]
@@ -3663,16 +4384,17 @@ class TestAnyQuantifierNeedsFullRecords:
         from affinity.cli.query.schema import SCHEMA_REGISTRY
 
         schema = SCHEMA_REGISTRY["persons"]
-        where = WhereClause(
+        where = WhereClause.model_construct(
             all_=QuantifierClause(
                 path="companies",  # Different relationship
-                where=WhereClause(path="name", op="contains", value="Inc"),
+                where=WhereClause.model_construct(path="name", op="contains", value="Inc"),
             )
         )
         # Should return False for "opportunities" relationship
         assert _any_quantifier_needs_full_records(where, "opportunities", schema) is False
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestPreIncludeExecution:
     """Tests for _execute_filter_with_preinclude method."""
 
@@ -3681,7 +4403,6 @@ class TestPreIncludeExecution:
         """Create a mock AsyncAffinity client."""
         return AsyncMock()
 
-    @pytest.mark.asyncio
     async def test_simple_filter_skips_preinclude(self, mock_client: AsyncMock) -> None:
         """Simple filter without quantifiers skips pre-include step."""
         # Set up mock service using the helper function
@@ -3694,7 +4415,9 @@ class TestPreIncludeExecution:
         mock_client.persons = mock_service
 
         # Create a simple query without quantifiers
-        query = Query(from_="persons", where=WhereClause(path="name", op="eq", value="Alice"))
+        query = Query(
+            from_="persons", where=WhereClause.model_construct(path="name", op="eq", value="Alice")
+        )
         plan = ExecutionPlan(
             query=query,
             steps=[
@@ -3717,7 +4440,6 @@ class TestPreIncludeExecution:
         assert len(result.data) == 1
         assert result.data[0]["name"] == "Alice"
 
-    @pytest.mark.asyncio
     async def test_quantifier_filter_triggers_preinclude(self, mock_client: AsyncMock) -> None:
         """Filter with quantifier triggers pre-include data fetch."""
         from affinity.cli.query.executor import ExecutionContext
@@ -3726,10 +4448,10 @@ class TestPreIncludeExecution:
         # Create query with quantifier
         query = Query(
             from_="persons",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 all_=QuantifierClause(
                     path="companies",
-                    where=WhereClause(path="name", op="contains", value="Inc"),
+                    where=WhereClause.model_construct(path="name", op="contains", value="Inc"),
                 )
             ),
         )
@@ -3789,6 +4511,7 @@ class TestPreIncludeExecution:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestIDsOnlyUpgrade:
     """Tests for IDs-only relationship upgrade to full records.
 
@@ -3802,7 +4525,6 @@ class TestIDsOnlyUpgrade:
         """Create a mock AsyncAffinity client."""
         return AsyncMock()
 
-    @pytest.mark.asyncio
     async def test_ids_only_no_upgrade_for_count(self, mock_client: AsyncMock) -> None:
         """_count queries don't need full records, just counts."""
         from affinity.cli.query.executor import ExecutionContext, QueryExecutor
@@ -3817,7 +4539,7 @@ class TestIDsOnlyUpgrade:
 
         query = Query(
             from_="persons",
-            where=WhereClause(path="companies._count", op="gte", value=1),
+            where=WhereClause.model_construct(path="companies._count", op="gte", value=1),
         )
         ctx = ExecutionContext(
             query=query,
@@ -3834,7 +4556,6 @@ class TestIDsOnlyUpgrade:
         assert len(ctx.records) == 1
         assert ctx.relationship_counts.get("companies", {}).get(1) == 2
 
-    @pytest.mark.asyncio
     async def test_ids_only_upgrades_for_property_filter(self, mock_client: AsyncMock) -> None:
         """When filtering on properties, IDs must be upgraded to full records."""
         from affinity.cli.query.executor import ExecutionContext, QueryExecutor
@@ -3862,10 +4583,10 @@ class TestIDsOnlyUpgrade:
         # Query filters on 'name' which isn't in IDs-only response
         query = Query(
             from_="persons",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 all_=QuantifierClause(
                     path="companies",
-                    where=WhereClause(path="name", op="contains", value="Inc"),
+                    where=WhereClause.model_construct(path="name", op="contains", value="Inc"),
                 )
             ),
         )
@@ -3882,7 +4603,6 @@ class TestIDsOnlyUpgrade:
         # Only Acme Inc has "Inc", so all_ should return False (Tech Corp doesn't match)
         assert len(ctx.records) == 0  # Alice filtered out
 
-    @pytest.mark.asyncio
     async def test_ids_only_no_upgrade_for_id_filter(self, mock_client: AsyncMock) -> None:
         """Filtering only on 'id' doesn't need full records."""
         from affinity.cli.query.executor import ExecutionContext, QueryExecutor
@@ -3899,10 +4619,10 @@ class TestIDsOnlyUpgrade:
         # Query filters only on 'id' which IS in IDs-only response
         query = Query(
             from_="persons",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 all_=QuantifierClause(
                     path="companies",
-                    where=WhereClause(path="id", op="gt", value=100),
+                    where=WhereClause.model_construct(path="id", op="gt", value=100),
                 )
             ),
         )
@@ -3920,7 +4640,6 @@ class TestIDsOnlyUpgrade:
         # Both companies have id > 100, so all_ returns True
         assert len(ctx.records) == 1
 
-    @pytest.mark.asyncio
     async def test_multiple_quantifiers_mixed_fields_upgrades(self, mock_client: AsyncMock) -> None:
         """Multiple quantifiers on same rel: one needs id, one needs name -> upgrade.
 
@@ -3955,18 +4674,20 @@ class TestIDsOnlyUpgrade:
         # - Second filters on 'name' (needs upgrade)
         query = Query(
             from_="persons",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 and_=[
-                    WhereClause(
+                    WhereClause.model_construct(
                         all_=QuantifierClause(
                             path="companies",
-                            where=WhereClause(path="id", op="gt", value=0),
+                            where=WhereClause.model_construct(path="id", op="gt", value=0),
                         )
                     ),
-                    WhereClause(
+                    WhereClause.model_construct(
                         none_=QuantifierClause(
                             path="companies",
-                            where=WhereClause(path="name", op="contains", value="Spam"),
+                            where=WhereClause.model_construct(
+                                path="name", op="contains", value="Spam"
+                            ),
                         )
                     ),
                 ]
@@ -3998,6 +4719,7 @@ class TestIDsOnlyUpgrade:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestQuantifierIntegration:
     """End-to-end tests for quantifier query execution."""
 
@@ -4006,7 +4728,6 @@ class TestQuantifierIntegration:
         """Create a mock AsyncAffinity client."""
         return AsyncMock()
 
-    @pytest.mark.asyncio
     async def test_all_quantifier_filters_correctly(self, mock_client: AsyncMock) -> None:
         """all_ quantifier correctly filters based on all related items."""
         from affinity.cli.query.executor import ExecutionContext, QueryExecutor
@@ -4046,10 +4767,10 @@ class TestQuantifierIntegration:
 
         query = Query(
             from_="persons",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 all_=QuantifierClause(
                     path="companies",
-                    where=WhereClause(path="domain", op="contains", value=".com"),
+                    where=WhereClause.model_construct(path="domain", op="contains", value=".com"),
                 )
             ),
         )
@@ -4071,7 +4792,6 @@ class TestQuantifierIntegration:
         assert len(ctx.records) == 1
         assert ctx.records[0]["name"] == "Alice"
 
-    @pytest.mark.asyncio
     async def test_none_quantifier_filters_correctly(self, mock_client: AsyncMock) -> None:
         """none_ quantifier correctly filters based on no related items matching."""
         from affinity.cli.query.executor import ExecutionContext, QueryExecutor
@@ -4105,10 +4825,10 @@ class TestQuantifierIntegration:
 
         query = Query(
             from_="persons",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 none_=QuantifierClause(
                     path="companies",
-                    where=WhereClause(path="name", op="contains", value="Spam"),
+                    where=WhereClause.model_construct(path="name", op="contains", value="Spam"),
                 )
             ),
         )
@@ -4130,7 +4850,6 @@ class TestQuantifierIntegration:
         assert len(ctx.records) == 1
         assert ctx.records[0]["name"] == "Alice"
 
-    @pytest.mark.asyncio
     async def test_exists_with_filter(self, mock_client: AsyncMock) -> None:
         """exists_ with where clause correctly filters."""
         from affinity.cli.query.executor import ExecutionContext, QueryExecutor
@@ -4161,7 +4880,7 @@ class TestQuantifierIntegration:
 
         query = Query(
             from_="persons",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 exists_=ExistsClause(
                     **{
                         "from": "interactions",
@@ -4187,7 +4906,6 @@ class TestQuantifierIntegration:
         assert len(ctx.records) == 1
         assert ctx.records[0]["name"] == "Alice"
 
-    @pytest.mark.asyncio
     async def test_count_filter(self, mock_client: AsyncMock) -> None:
         """_count pseudo-field correctly counts related items."""
         from affinity.cli.query.executor import ExecutionContext, QueryExecutor
@@ -4204,7 +4922,7 @@ class TestQuantifierIntegration:
 
         query = Query(
             from_="persons",
-            where=WhereClause(path="companies._count", op="gte", value=2),
+            where=WhereClause.model_construct(path="companies._count", op="gte", value=2),
         )
         ctx = ExecutionContext(
             query=query,
@@ -4223,7 +4941,6 @@ class TestQuantifierIntegration:
         assert len(ctx.records) == 1
         assert ctx.records[0]["name"] == "Alice"
 
-    @pytest.mark.asyncio
     async def test_vacuous_truth_for_empty_relationship(self, mock_client: AsyncMock) -> None:
         """all_ returns True for records with no related items (vacuous truth)."""
         from affinity.cli.query.executor import ExecutionContext, QueryExecutor
@@ -4236,10 +4953,10 @@ class TestQuantifierIntegration:
 
         query = Query(
             from_="persons",
-            where=WhereClause(
+            where=WhereClause.model_construct(
                 all_=QuantifierClause(
                     path="companies",
-                    where=WhereClause(path="name", op="contains", value="Inc"),
+                    where=WhereClause.model_construct(path="name", op="contains", value="Inc"),
                 )
             ),
         )
@@ -4272,10 +4989,10 @@ class TestQuantifierIntegration:
 # =============================================================================
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestBatchFetchByIds:
     """Tests for _batch_fetch_by_ids V2 batch optimization."""
 
-    @pytest.mark.asyncio
     async def test_batch_fetch_uses_iter_for_v2_entities(self, mock_client: AsyncMock) -> None:
         """Verify _batch_fetch_by_ids uses iter(ids=...) for V2 entities."""
         mock_company = MagicMock()
@@ -4309,7 +5026,6 @@ class TestBatchFetchByIds:
         # Verify get() was NOT called (batch was used)
         mock_service.get.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_batch_fetch_falls_back_to_get_for_v1_entities(
         self, mock_client: AsyncMock
     ) -> None:
@@ -4330,7 +5046,6 @@ class TestBatchFetchByIds:
         # Verify get() was called for each ID
         assert mock_service.get.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_batch_fetch_handles_iter_failure_with_fallback(
         self, mock_client: AsyncMock
     ) -> None:
@@ -4357,7 +5072,6 @@ class TestBatchFetchByIds:
         assert result[0]["id"] == 100
         mock_service.get.assert_called_once_with(100)
 
-    @pytest.mark.asyncio
     async def test_batch_fetch_returns_id_only_for_unknown_entity(
         self, mock_client: AsyncMock
     ) -> None:
@@ -4367,7 +5081,6 @@ class TestBatchFetchByIds:
 
         assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
 
-    @pytest.mark.asyncio
     async def test_batch_fetch_handles_get_errors_gracefully(self, mock_client: AsyncMock) -> None:
         """Verify _batch_fetch_by_ids returns ID-only for failed individual fetches."""
 
@@ -4396,3 +5109,24 @@ class TestBatchFetchByIds:
         assert result[0]["name"] == "Company 100"
         assert result[1] == {"id": 200}  # Fallback on error
         assert result[2]["name"] == "Company 300"
+
+
+# =============================================================================
+# HTTP Connection Pool Sizing
+# =============================================================================
+
+
+class TestQueryHttpLimits:
+    """Tests for query_http_limits()."""
+
+    def test_keeps_a_connection_alive_per_concurrent_request(self) -> None:
+        """Pool keeps entity fetch and person lookup connections alive."""
+        from affinity.cli.query.executor import (
+            PERSON_RESOLUTION_CONCURRENCY,
+            query_http_limits,
+        )
+
+        limits = query_http_limits(15)
+
+        assert limits.max_connections == 15 + PERSON_RESOLUTION_CONCURRENCY
+        assert limits.max_keepalive_connections == limits.max_connections
@@ -7,6 +7,9 @@ persons, companies, and listEntries.
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator, Callable
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 from click.testing import CliRunner
@@ -14,6 +17,20 @@ from click.testing import CliRunner
 from affinity.cli.query.exceptions import QueryValidationError
 from affinity.cli.query.parser import parse_query
 
+
+def _person_iter_stub(name_for: Callable[[int], str]) -> Callable[..., AsyncIterator[Any]]:
+    """Build a persons.iter(ids=...) stand-in yielding persons named by name_for(id)."""
+
+    def person_iter(*, ids: list[Any]) -> AsyncIterator[Any]:
+        async def generator() -> AsyncIterator[Any]:
+            for pid in ids:
+                yield SimpleNamespace(id=int(pid), full_name=name_for(int(pid)))
+
+        return generator()
+
+    return person_iter
+
+
 # ==============================================================================
 # Parser Tests - Validation of expand clause
 # ==============================================================================
@@ -121,15 +138,12 @@ class TestQueryExpandDryRun:
         start = output.find("{")
         if start == -1:
             raise ValueError(f"No JSON object found in output: {output}")
-        depth = 0
-        for i, char in enumerate(output[start:], start):
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    return json.loads(output[start : i + 1])
-        raise ValueError(f"Unbalanced JSON in output: {output}")
+        # raw_decode stops at the end of the object and handles braces inside strings
+        try:
+            obj, _end = json.JSONDecoder().raw_decode(output, start)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Unbalanced JSON in output: {output}") from e
+        return obj
 
     @pytest.mark.req("QUERY-EXPAND-003")
     def test_dry_run_shows_expansion_in_plan(self, runner, cli_context) -> None:
@@ -355,6 +369,7 @@ class TestStreamingPathWithExpand:
             return mock_team_member
 
         mock_client.persons.get = mock_get
+        mock_client.persons.iter = _person_iter_stub(lambda _pid: "Team Member")
 
         # Create executor and run
         executor = QueryExecutor(
@@ -469,6 +484,7 @@ class TestExpandViaSingleIdLookup:
         mock_client = AsyncMock()
         mock_client.whoami = AsyncMock()
         mock_client.persons.get = mock_get
+        mock_client.persons.iter = _person_iter_stub(lambda _pid: "Team Member")
 
         executor = QueryExecutor(
             client=mock_client,
@@ -809,6 +825,55 @@ class TestExpandViaExecuteStepPath:
         )
         assert expand_get_called, "persons.get() with interaction params should have been called"
 
+    @pytest.mark.asyncio
+    async def test_expand_runs_after_sort_and_limit(self) -> None:
+        """Only the records kept by orderBy + limit are expanded."""
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock
+
+        from affinity.cli.query.executor import QueryExecutor
+        from affinity.cli.query.planner import create_planner
+        from affinity.models.entities import InteractionEvent, Interactions
+
+        parse_result = parse_query(
+            {
+                "from": "persons",
+                "expand": ["interactionDates"],
+                "orderBy": [{"field": "firstName", "direction": "asc"}],
+                "limit": 2,
+            }
+        )
+        plan = create_planner().plan(parse_result.query)
+
+        names = ["Alice", "Dana", "Bob", "Carol"]
+        records = [{"id": i, "firstName": name} for i, name in enumerate(names, start=1)]
+
+        async def mock_pages(**_kwargs):
+            yield SimpleNamespace(
+                data=[SimpleNamespace(model_dump=lambda *_a, r=r, **_k: r) for r in records],
+                next_cursor=None,
+            )
+
+        expanded_ids: list[int] = []
+
+        async def mock_get(person_id, **_kwargs):
+            expanded_ids.append(int(person_id))
+            return SimpleNamespace(
+                interaction_dates=None,
+                interactions=Interactions(last_event=InteractionEvent(person_ids=[])),
+            )
+
+        mock_client = AsyncMock()
+        mock_client.whoami = AsyncMock()
+        mock_client.persons.all = MagicMock(return_value=SimpleNamespace(pages=mock_pages))
+        mock_client.persons.get = mock_get
+
+        query_result = await QueryExecutor(client=mock_client, max_records=100).execute(plan)
+
+        assert [r["firstName"] for r in query_result.data] == ["Alice", "Bob"]
+        assert sorted(expanded_ids) == [1, 3]
+        assert all("interactionDates" in r for r in query_result.data)
+
 
 # ==============================================================================
 # Concurrency and Performance Tests - Expansion with Parallelization
@@ -870,24 +935,29 @@ class TestExpandConcurrencyOptimizations:
 
         mock_company_expanded = MagicMock(spec=Company)
         mock_company_expanded.interaction_dates = mock_interaction_dates
-        # Each company has 3 team members -> 10 companies x 3 = 30 person fetches
+        # Each company has the same 3 team members, looked up in batches
         from affinity.models.entities import InteractionEvent, Interactions
 
         mock_company_expanded.interactions = Interactions(
             last_event=InteractionEvent(person_ids=[100, 101, 102])
         )
 
-        async def mock_person_get(_person_id, **_kwargs):
-            nonlocal concurrent_person_fetches, max_concurrent_person_fetches
-            concurrent_person_fetches += 1
-            max_concurrent_person_fetches = max(
-                max_concurrent_person_fetches, concurrent_person_fetches
-            )
-            await asyncio.sleep(0.01)  # Small delay to allow overlap
-            concurrent_person_fetches -= 1
-            person = MagicMock()
-            person.full_name = f"Person {_person_id.value}"
-            return person
+        def mock_person_iter(*, ids):
+            async def generator():
+                nonlocal concurrent_person_fetches, max_concurrent_person_fetches
+                concurrent_person_fetches += 1
+                max_concurrent_person_fetches = max(
+                    max_concurrent_person_fetches, concurrent_person_fetches
+                )
+                await asyncio.sleep(0.01)  # Small delay to allow overlap
+                concurrent_person_fetches -= 1
+                for pid in ids:
+                    person = MagicMock()
+                    person.id = pid
+                    person.full_name = f"Person {int(pid)}"
+                    yield person
+
+            return generator()
 
         # Create mock async client
         mock_client = AsyncMock()
@@ -911,7 +981,8 @@ class TestExpandConcurrencyOptimizations:
             return make_mock_company(_company_id.value)
 
         mock_client.companies.get = mock_company_get
-        mock_client.persons.get = mock_person_get
+        mock_client.persons.iter = mock_person_iter
+        mock_client.persons.get = AsyncMock(side_effect=AssertionError("unexpected get"))
 
         # Run with concurrency 15 (DEFAULT_CONCURRENCY)
         executor = QueryExecutor(
@@ -981,11 +1052,18 @@ class TestExpandConcurrencyOptimizations:
 
         mock_client.companies.get = mock_company_get
 
-        # Person API always fails
-        async def mock_person_get(_person_id, **_kwargs):
-            raise Exception("API Error - person service unavailable")
+        # Person API always fails, for the batch lookup and the individual fallback
+        def mock_person_iter(*, ids):  # noqa: ARG001
+            async def generator():
+                raise Exception("API Error - person service unavailable")
+                yield
 
-        mock_client.persons.get = mock_person_get
+            return generator()
+
+        mock_client.persons.iter = mock_person_iter
+        mock_client.persons.get = AsyncMock(
+            side_effect=Exception("API Error - person service unavailable")
+        )
 
         executor = QueryExecutor(
             client=mock_client,
@@ -1008,6 +1086,8 @@ class TestExpandConcurrencyOptimizations:
         assert team_names == ["Person 456", "Person 789"], (
             f"Expected fallback names, got {team_names}"
         )
+        # The failed batch fell back to one lookup per team member
+        assert mock_client.persons.get.await_count == 2
 
     @pytest.mark.asyncio
     async def test_shared_person_cache_deduplicates_fetches(self) -> None:
@@ -1065,3 +1145,87 @@ class TestExpandConcurrencyOptimizations:
         assert unique_fetched == {100, 101, 102}, (
             f"Should fetch all unique persons: {unique_fetched}"
         )
+
+    @pytest.mark.asyncio
+    async def test_team_member_names_resolved_in_one_batch(self) -> None:
+        """Team members across all expanded records are looked up in one persons.iter call."""
+        from datetime import datetime, timezone
+        from unittest.mock import AsyncMock, MagicMock
+
+        from affinity.cli.query.executor import QueryExecutor
+        from affinity.cli.query.parser import parse_query
+        from affinity.cli.query.planner import create_planner
+        from affinity.models.entities import (
+            Company,
+            InteractionDates,
+            InteractionEvent,
+            Interactions,
+        )
+
+        plan = create_planner().plan(
+            parse_query({"from": "companies", "expand": ["interactionDates"], "limit": 5}).query
+        )
+
+        def make_mock_company(cid: int) -> MagicMock:
+            mock = MagicMock(spec=Company)
+            mock.model_dump = MagicMock(return_value={"id": cid, "name": f"Company {cid}"})
+            return mock
+
+        mock_interaction_dates = MagicMock(spec=InteractionDates)
+        mock_interaction_dates.last_event_date = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        mock_interaction_dates.next_event_date = None
+        mock_interaction_dates.last_email_date = None
+        mock_interaction_dates.last_interaction_date = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        mock_company_expanded = MagicMock(spec=Company)
+        mock_company_expanded.interaction_dates = mock_interaction_dates
+        mock_company_expanded.interactions = Interactions(
+            last_event=InteractionEvent(person_ids=[100, 101])
+        )
+
+        mock_client = AsyncMock()
+        mock_client.whoami = AsyncMock()
+
+        mock_page = MagicMock()
+        mock_page.data = [make_mock_company(i) for i in range(1, 6)]
+
+        async def mock_pages(**_kwargs):
+            yield mock_page
+
+        mock_companies_all = MagicMock()
+        mock_companies_all.pages = mock_pages
+        mock_client.companies.all = MagicMock(return_value=mock_companies_all)
+
+        async def mock_company_get(_company_id, **_kwargs):
+            return mock_company_expanded
+
+        mock_client.companies.get = mock_company_get
+
+        batches: list[list[int]] = []
+
+        def mock_person_iter(*, ids):
+            batches.append([int(i) for i in ids])
+
+            async def generator():
+                for pid in ids:
+                    person = MagicMock()
+                    person.id = pid
+                    person.full_name = f"Name {int(pid)}"
+                    yield person
+
+            return generator()
+
+        mock_client.persons.iter = mock_person_iter
+        mock_client.persons.get = AsyncMock(side_effect=AssertionError("unexpected get"))
+
+        executor = QueryExecutor(client=mock_client, max_records=100)
+        result = await executor.execute(plan)
+
+        assert len(batches) == 1
+        assert sorted(batches[0]) == [100, 101]
+        for record in result.data:
+            names = record["interactionDates"]["lastMeeting"]["teamMemberNames"]
+            assert names == ["Name 100", "Name 101"]
+
+        # Names stay cached on the executor, so a repeat query makes no lookups
+        await executor.execute(plan)
+        assert len(batches) == 1
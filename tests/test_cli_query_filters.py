@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
 import pytest
 
 from affinity.cli.query import compile_filter, matches, resolve_field_path
+from affinity.cli.query.filters import (
+    _compile_condition,
+    _flatten_clauses,
+    _parse_field_path,
+    compile_field_path,
+)
 from affinity.cli.query.models import WhereClause
+from affinity.compare import get_comparator
 
 
 class TestResolveFieldPath:
@@ -49,6 +60,33 @@ class TestResolveFieldPath:
         assert resolve_field_path(record, "fields.Status") == "Active"
 
 
+class TestCompileFieldPath:
+    """Tests for compile_field_path function."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "name",
+            "missing",
+            "address.city",
+            "emails[1]",
+            "emails[10]",
+            "missing.child",
+            "fields.Status",
+            "",
+        ],
+    )
+    def test_matches_resolve_field_path(self, path: str) -> None:
+        """Compiled getter resolves the same value as resolve_field_path."""
+        record = {
+            "name": "Alice",
+            "address": {"city": "NYC"},
+            "emails": ["a@test.com", "b@test.com"],
+            "fields": {"Status": "Active"},
+        }
+        assert compile_field_path(path)(record) == resolve_field_path(record, path)
+
+
 class TestFilterOperators:
     """Tests for individual filter operators."""
 
@@ -126,6 +164,27 @@ class TestFilterOperators:
         assert not matches({"status": "closed"}, where)
 
     @pytest.mark.req("QUERY-FILT-003")
+    @pytest.mark.parametrize(
+        ("field_value", "expected"),
+        [
+            pytest.param("High", True, id="scalar-member"),
+            pytest.param("Low", False, id="scalar-non-member"),
+            pytest.param(["Low", "Medium"], True, id="list-any-member"),
+            pytest.param(["Low"], False, id="list-no-member"),
+            pytest.param(1, True, id="numeric-equal-hash"),
+            pytest.param({"name": "High"}, False, id="unhashable-falls-back"),
+            pytest.param([{"name": "High"}, "Medium"], True, id="unhashable-item-falls-back"),
+            pytest.param(None, False, id="none"),
+        ],
+    )
+    def test_in_operator_matches_list_scan(self, field_value: Any, expected: bool) -> None:
+        """The set-backed 'in' agrees with the plain list-membership comparison."""
+        values = ["High", "Medium", 1.0]
+        filter_fn = compile_filter(WhereClause(path="priority", op="in", value=values))
+
+        assert filter_fn({"priority": field_value}) is expected
+        assert get_comparator("in")(field_value, values) is expected
+
     def test_between_operator(self) -> None:
         """Test between operator (inclusive)."""
         where = WhereClause(path="age", op="between", value=[20, 30])
@@ -222,6 +281,45 @@ class TestCompoundFilters:
         # Unverified adult non-admin
         assert not matches({"age": 30, "verified": False}, where)
 
+    def test_same_operator_nesting_is_flattened(self) -> None:
+        """and-in-and and or-in-or are inlined; mixed nesting is kept."""
+        a, b, c, d = (WhereClause(path=name, op="eq", value=1) for name in "abcd")
+        mixed = WhereClause(or_=[c, d])
+        clauses = [a, WhereClause(and_=[b, WhereClause(and_=[mixed])]), WhereClause(and_=[])]
+
+        assert _flatten_clauses(clauses, "and_") == [a, b, mixed]
+        assert _flatten_clauses([mixed, WhereClause(or_=[a])], "or_") == [c, d, a]
+        # A clause carrying anything besides the nested list is not inlined
+        negated = WhereClause(and_=[a], not_=b)
+        assert _flatten_clauses([negated], "and_") == [negated]
+
+        where = WhereClause(and_=clauses)
+        assert matches({"a": 1, "b": 1, "c": 1}, where)
+        assert not matches({"a": 1, "b": 1}, where)
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3])
+    def test_compound_short_circuits_at_any_width(self, size: int) -> None:
+        """AND stops at the first miss and OR at the first hit, like all()/any()."""
+        seen: list[str] = []
+        names = "abc"[:size]
+
+        def clauses() -> list[WhereClause]:
+            # gte rather than eq keeps the per-value memo out of the way
+            return [WhereClause(path=name, op="gte", value=1) for name in names]
+
+        class Record(dict):
+            def get(self, key, default=None):
+                seen.append(key)
+                return super().get(key, default)
+
+        assert compile_filter(WhereClause(and_=clauses()))(Record()) is (size == 0)
+        assert seen == list(names[:1])
+
+        seen.clear()
+        record = Record(dict.fromkeys(names, 1))
+        assert compile_filter(WhereClause(or_=clauses()))(record) is (size > 0)
+        assert seen == list(names[:1])
+
 
 class TestCompileFilter:
     """Tests for compile_filter function."""
@@ -253,6 +351,85 @@ class TestCompileFilter:
         """matches() with None where matches all."""
         assert matches({"any": "record"}, None)
 
+    def test_equality_filter_evaluated_once_per_value(self) -> None:
+        """OR of eq/in on one path runs its conditions once per distinct value."""
+        where = WhereClause(
+            or_=[
+                WhereClause(path="listId", op="eq", value=1),
+                WhereClause(path="listId", op="in", value=[3, 4]),
+            ]
+        )
+        calls = 0
+
+        def counting(clause: WhereClause) -> Callable[[dict[str, Any]], bool]:
+            condition = _compile_condition(clause)
+
+            def wrapper(record: dict[str, Any]) -> bool:
+                nonlocal calls
+                calls += 1
+                return condition(record)
+
+            return wrapper
+
+        with patch("affinity.cli.query.filters._compile_condition", side_effect=counting):
+            filter_fn = compile_filter(where)
+        records = [{"listId": i % 5} for i in range(50)]
+
+        filtered = [r["listId"] for r in records if filter_fn(r)]
+
+        assert filtered == [i % 5 for i in range(50) if i % 5 in (1, 3, 4)]
+        # At most two conditions per distinct value (listId=1 short-circuits the OR),
+        # not per record
+        assert calls == 2 * 5 - 1
+
+    def test_equality_filter_memo_keeps_comparison_semantics(self) -> None:
+        """Memoized equality still coerces strings and matches list membership."""
+        filter_fn = compile_filter(WhereClause(path="status", op="eq", value="1"))
+
+        assert filter_fn({"status": 1})
+        assert filter_fn({"status": "1"})
+        assert not filter_fn({"status": True})
+        assert filter_fn({"status": ["0", "1"]})
+        assert not filter_fn({"status": ["0"]})
+
+    def test_equality_filter_memo_gives_up_on_unique_values(self) -> None:
+        """On a path whose values never repeat, the memo stops growing and caching."""
+        calls = 0
+
+        def counting(where: WhereClause) -> Callable[[dict[str, Any]], bool]:
+            condition = _compile_condition(where)
+
+            def wrapper(record: dict[str, Any]) -> bool:
+                nonlocal calls
+                calls += 1
+                return condition(record)
+
+            return wrapper
+
+        where = WhereClause(path="email", op="eq", value="a3@x.com")
+        with (
+            patch("affinity.cli.query.filters._MEMO_MAX_VALUES", 4),
+            patch("affinity.cli.query.filters._compile_condition", side_effect=counting),
+        ):
+            filter_fn = compile_filter(where)
+            emails = [f"a{i}@x.com" for i in range(10)]
+            assert [e for e in emails if filter_fn({"email": e})] == ["a3@x.com"]
+            # Repeats after the memo gave up are evaluated again, not looked up
+            assert filter_fn({"email": "a0@x.com"}) is False
+
+        assert calls == 11
+
+    def test_condition_parses_path_once(self) -> None:
+        """A compiled condition parses its field path at compile time, not per record."""
+        with patch(
+            "affinity.cli.query.filters._parse_field_path", wraps=_parse_field_path
+        ) as parse:
+            filter_fn = compile_filter(WhereClause(path="address.city", op="contains", value="par"))
+            results = [filter_fn({"address": {"city": city}}) for city in ("Paris", "Oslo") * 10]
+
+        assert results == [True, False] * 10
+        assert parse.call_count == 1
+
 
 # =============================================================================
 # Edge Case Tests for Filter Operators
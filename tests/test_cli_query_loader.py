@@ -0,0 +1,89 @@
+"""Tests for batched ID lookups."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from affinity.cli.query._loader import IdBatcher
+
+
+class TestIdBatcher:
+    """Tests for IdBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_loads_in_same_tick_share_one_batch(self) -> None:
+        """Concurrent loads are coalesced into a single batch call."""
+        calls: list[list[int]] = []
+
+        async def batch_fn(ids: list[int]) -> dict[int, str]:
+            calls.append(ids)
+            return {i: f"v{i}" for i in ids}
+
+        batcher: IdBatcher[int, str] = IdBatcher(batch_fn)
+        results = await asyncio.gather(batcher.load(1), batcher.load(2), batcher.load(3))
+
+        assert results == ["v1", "v2", "v3"]
+        assert calls == [[1, 2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_and_repeated_loads_are_memoized(self) -> None:
+        """The same ID is fetched once, even across ticks."""
+        calls: list[list[int]] = []
+
+        async def batch_fn(ids: list[int]) -> dict[int, str]:
+            calls.append(ids)
+            return {i: f"v{i}" for i in ids}
+
+        batcher: IdBatcher[int, str] = IdBatcher(batch_fn)
+        assert await asyncio.gather(batcher.load(1), batcher.load(1)) == ["v1", "v1"]
+        assert await batcher.load(1) == "v1"
+
+        assert calls == [[1]]
+
+    @pytest.mark.asyncio
+    async def test_batches_split_at_max_size(self) -> None:
+        """Queued IDs are split into chunks of max_batch_size."""
+        calls: list[list[int]] = []
+
+        async def batch_fn(ids: list[int]) -> dict[int, int]:
+            calls.append(ids)
+            return {i: i * 10 for i in ids}
+
+        batcher: IdBatcher[int, int] = IdBatcher(batch_fn, max_batch_size=2)
+        results = await asyncio.gather(*[batcher.load(i) for i in range(5)])
+
+        assert results == [0, 10, 20, 30, 40]
+        assert calls == [[0, 1], [2, 3], [4]]
+
+    @pytest.mark.asyncio
+    async def test_missing_ids_resolve_to_none(self) -> None:
+        """IDs absent from the batch result resolve to None."""
+
+        async def batch_fn(ids: list[int]) -> dict[int, str]:
+            return {i: "found" for i in ids if i != 2}
+
+        batcher: IdBatcher[int, str] = IdBatcher(batch_fn)
+        assert await asyncio.gather(batcher.load(1), batcher.load(2)) == ["found", None]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_propagates_to_all_waiters(self) -> None:
+        """A failing batch call raises in every caller of that batch."""
+
+        async def batch_fn(_ids: list[int]) -> dict[int, str]:
+            raise RuntimeError("boom")
+
+        batcher: IdBatcher[int, str] = IdBatcher(batch_fn)
+        results = await asyncio.gather(batcher.load(1), batcher.load(2), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_invalid_batch_size(self) -> None:
+        """Batch size must be positive."""
+
+        async def batch_fn(_ids: list[int]) -> dict[int, int]:
+            return {}
+
+        with pytest.raises(ValueError, match="at least 1"):
+            IdBatcher(batch_fn, max_batch_size=0)
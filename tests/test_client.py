@@ -162,6 +162,19 @@ class TestHTTPClient:
         assert config.limits.max_keepalive_connections == 10
         assert config.limits.keepalive_expiry == 30.0
 
+    def test_limits_can_be_overridden_on_clients(self) -> None:
+        limits = httpx.Limits(max_connections=25, max_keepalive_connections=25)
+        with Affinity(api_key="test-key", limits=limits) as client:
+            assert client._http._config.limits is limits
+        with Affinity(api_key="test-key") as client:
+            assert client._http._config.limits.max_connections == 20
+
+    @pytest.mark.asyncio
+    async def test_limits_can_be_overridden_on_async_client(self) -> None:
+        limits = httpx.Limits(max_connections=25, max_keepalive_connections=25)
+        async with AsyncAffinity(api_key="test-key", limits=limits) as client:
+            assert client._http._config.limits is limits
+
     @pytest.mark.req("TR-010")
     def test_timeout_can_be_overridden_with_seconds(self) -> None:
         config = ClientConfig(api_key="test-key", timeout=5.0)